@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Palette-indexed export of rendered assets.
+
+Quantizes rendered PNGs to a fixed palette through a cached nearest-colour
+lookup table and writes 8-bit indexed PNG (or lossless WebP).
+
+Palettes:
+    halftone — halftone_common.PALETTE plus tone ramps from each paper
+               stock to every ink (halftone dots, tints and grain land
+               between paper and ink)
+    pixel    — pixel_doc.PALETTE, exact (pixel-art documents only use it)
+    auto     — pixel if the image only contains pixel_doc colours,
+               otherwise halftone
+
+Usage:
+    python asset_export.py output/*.png                   # -> output/export/
+    python asset_export.py output/*.png --format webp -j 4
+    python asset_export.py in.png -o Assets/StreamingAssets/docs --palette halftone
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: 'numpy' package not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from halftone_common import PALETTE, CACHE_DIR
+import pixel_doc
+
+EXPORT_DIR = Path(__file__).parent / "output" / "export"
+LUT_CACHE_DIR = CACHE_DIR / "lut"
+
+# Bits per channel of the lookup table: 64x64x64 cells, 256 KB per palette
+LUT_BITS = 6
+
+# Paper stocks the halftone ramps start from
+PAPER_STOCKS = ("paper", "paper_warm", "newspaper_yellow")
+
+# Interior steps per paper -> ink ramp (3 stocks x 15 inks x 5 + 18 <= 256)
+RAMP_STEPS = 5
+
+# Grain offsets kept around each paper stock, so bare paper is not flat
+GRAIN_STEPS = (-12, -6, 6, 12)
+
+# Mean per-channel error above which an image keeps its RGB colours (still
+# re-encoded): the family letter's warm, unprinted paper is not a palette job
+MAX_ERROR = 4.0
+
+FORMATS = ("png", "webp")
+
+
+# =============================================================================
+# PALETTES
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def halftone_palette():
+    """Master colours, paper grain steps and paper -> ink ramps (RGB tuples)."""
+    colors = list(dict.fromkeys(PALETTE.values()))
+    papers = [PALETTE[s] for s in PAPER_STOCKS]
+    inks = [c for c in colors if c not in papers]
+    for paper in papers:
+        for d in GRAIN_STEPS:
+            colors.append(tuple(min(255, max(0, c + d)) for c in paper))
+    for paper in papers:
+        paper = np.array(paper, np.float64)
+        for ink in inks:
+            for i in range(1, RAMP_STEPS + 1):
+                t = i / (RAMP_STEPS + 1)
+                colors.append(tuple(int(round(c)) for c in paper + (np.array(ink) - paper) * t))
+    colors = list(dict.fromkeys(colors))
+    if len(colors) > 256:
+        raise ValueError(f"halftone palette has {len(colors)} colours (max 256)")
+    return tuple(colors)
+
+
+@lru_cache(maxsize=None)
+def pixel_palette():
+    """pixel_doc.PALETTE colours, as a tuple of RGB tuples."""
+    return tuple(dict.fromkeys(pixel_doc.PALETTE.values()))
+
+
+PALETTES = {
+    "halftone": halftone_palette,
+    "pixel": pixel_palette,
+}
+
+
+# =============================================================================
+# NEAREST-COLOUR LUT
+# =============================================================================
+
+def _build_lut(colors):
+    """Nearest palette index for the centre of every LUT cell."""
+    pal = np.array(colors, np.float32)
+    n = 1 << LUT_BITS
+    centres = (np.arange(n, dtype=np.float32) + 0.5) * (256 / n)
+    grid = np.stack(np.meshgrid(centres, centres, centres, indexing="ij"), -1).reshape(-1, 3)
+
+    lut = np.empty(len(grid), np.uint8)
+    pal_sq = (pal ** 2).sum(1)
+    for start in range(0, len(grid), 1 << 15):
+        chunk = grid[start:start + (1 << 15)]
+        # |c - p|^2 without the per-cell |c|^2 term, which is the same for every p
+        dist = pal_sq[None, :] - 2.0 * chunk @ pal.T
+        lut[start:start + len(chunk)] = dist.argmin(1)
+    return lut
+
+
+@lru_cache(maxsize=8)
+def nearest_lut(colors):
+    """
+    Nearest-colour lookup table for a palette, cached in memory and on disk.
+
+    Args:
+        colors: Tuple of RGB tuples (at most 256)
+
+    Returns:
+        Read-only uint8 array of 2**(3 * LUT_BITS) palette indices, indexed
+        by (r >> s) << 2b | (g >> s) << b | (b >> s) with b = LUT_BITS,
+        s = 8 - LUT_BITS.
+    """
+    key = hashlib.sha1(repr((LUT_BITS, colors)).encode("utf-8")).hexdigest()
+    path = LUT_CACHE_DIR / f"{key}.npy"
+    try:
+        lut = np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        lut = None
+    if lut is None or lut.shape != (1 << (3 * LUT_BITS),):
+        lut = _build_lut(colors)
+        try:
+            LUT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{key}.{os.getpid()}.tmp.npy")
+            np.save(tmp, lut, allow_pickle=False)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    lut.flags.writeable = False
+    return lut
+
+
+def quantize(img, colors):
+    """
+    Map an image onto a fixed palette.
+
+    Args:
+        img: PIL Image (converted to RGB if needed)
+        colors: Tuple of RGB tuples
+
+    Returns:
+        PIL Image in mode "P" with the palette attached.
+    """
+    px = np.asarray(img.convert("RGB"))
+    shift = 8 - LUT_BITS
+    idx = ((px[..., 0].astype(np.int32) >> shift) << (2 * LUT_BITS)
+           | (px[..., 1].astype(np.int32) >> shift) << LUT_BITS
+           | (px[..., 2].astype(np.int32) >> shift))
+    out = Image.fromarray(nearest_lut(colors)[idx], "P")
+    out.putpalette([c for rgb in colors for c in rgb])
+    return out
+
+
+def pick_palette(img):
+    """'pixel' if img only uses pixel_doc colours, else 'halftone'."""
+    used = img.convert("RGB").getcolors(256)
+    if used is not None and {rgb for _, rgb in used} <= set(pixel_palette()):
+        return "pixel"
+    return "halftone"
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def quantize_error(img, indexed):
+    """Mean absolute per-channel difference between img and its quantized copy."""
+    a = np.asarray(img.convert("RGB"), np.int16)
+    b = np.asarray(indexed.convert("RGB"), np.int16)
+    return float(np.abs(a - b).mean())
+
+
+def export_image(src, dst, fmt="png", palette="auto", max_error=MAX_ERROR):
+    """
+    Quantize one image file and write it indexed.
+
+    Args:
+        src: Source image path
+        dst: Output path (its suffix is replaced to match fmt)
+        fmt: "png" (8-bit indexed) or "webp" (lossless)
+        palette: "halftone", "pixel" or "auto"
+        max_error: Keep RGB when quantizing would change the image by more
+                   than this mean error (None: always quantize)
+
+    Returns:
+        (dst path, source bytes, output bytes, palette used or "rgb")
+    """
+    with Image.open(src) as img:
+        img.load()
+    if palette == "auto":
+        palette = pick_palette(img)
+    indexed = quantize(img, PALETTES[palette]())
+    if max_error is not None and quantize_error(img, indexed) > max_error:
+        indexed, palette = img.convert("RGB"), "rgb"
+
+    dst = Path(dst).with_suffix(f".{fmt}")
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.stem}.{os.getpid()}.tmp{dst.suffix}")
+    if fmt == "png":
+        indexed.save(tmp, "PNG", optimize=True)
+    else:
+        # WebP has no indexed mode; lossless WebP re-derives the palette
+        indexed.convert("RGB").save(tmp, "WEBP", lossless=True, quality=100, method=4)
+    os.replace(tmp, dst)
+    return dst, os.path.getsize(src), os.path.getsize(dst), palette
+
+
+def export_assets(sources, out_dir=EXPORT_DIR, fmt="png", palette="auto",
+                  workers=None, max_error=MAX_ERROR):
+    """
+    Export several images across a process pool.
+
+    Args:
+        sources: Image paths
+        out_dir: Output directory (files keep their stem)
+        fmt, palette, max_error: As for export_image
+        workers: Process count. Default: one per CPU core
+
+    Returns:
+        List of export_image results (or the raised exception), in input order.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r} (expected one of {FORMATS})")
+    sources = [Path(s) for s in sources]
+    jobs = [(s, Path(out_dir) / s.name, fmt, palette, max_error) for s in sources]
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    if workers <= 1:
+        return [_export_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_export_job, jobs))
+
+
+def _export_job(job):
+    try:
+        return export_image(*job)
+    except Exception as e:
+        return e
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export rendered assets as palette-indexed PNG/WebP"
+    )
+    parser.add_argument("sources", nargs="+", help="Rendered images")
+    parser.add_argument("-o", "--output-dir", default=str(EXPORT_DIR),
+                        help=f"Output directory (default: {EXPORT_DIR})")
+    parser.add_argument("--format", choices=FORMATS, default="png",
+                        help="Output format (default: png)")
+    parser.add_argument("--palette", choices=("auto",) + tuple(PALETTES), default="auto",
+                        help="Palette to quantize to (default: auto)")
+    parser.add_argument("--max-error", type=float, default=MAX_ERROR,
+                        help=f"Keep RGB above this mean quantization error "
+                             f"(default: {MAX_ERROR}; negative: always quantize)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    max_error = args.max_error if args.max_error >= 0 else None
+    results = export_assets(args.sources, args.output_dir, args.format,
+                            args.palette, args.jobs, max_error)
+    total_in = total_out = failed = 0
+    for src, result in zip(args.sources, results):
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"  FAILED  {src}: {type(result).__name__}: {result}")
+            continue
+        dst, size_in, size_out, palette = result
+        total_in += size_in
+        total_out += size_out
+        print(f"  {size_in / 1024:8.1f} KB -> {size_out / 1024:7.1f} KB  "
+              f"[{palette:8}] {dst}")
+
+    if total_in:
+        print(f"\n{len(results) - failed} exported in {time.perf_counter() - start:.2f}s: "
+              f"{total_in / 1024:.0f} KB -> {total_out / 1024:.0f} KB "
+              f"({total_out / total_in:.0%})")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
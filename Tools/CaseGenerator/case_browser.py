@@ -34,6 +34,8 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+from schema_check import schema_errors
+
 
 def _all_responses(tag: dict) -> list:
     """Get all response objects from a tag interaction."""
@@ -83,8 +85,7 @@ def validate_case_inline(case: dict, schema: dict | None) -> dict:
     # Phase 1: SCHEMA
     phase_errors, phase_warnings, phase_info = [], [], []
     if schema and HAS_JSONSCHEMA:
-        validator = jsonschema.Draft202012Validator(schema)
-        for err in validator.iter_errors(case):
+        for err in schema_errors(case, schema):
             path = " -> ".join(str(p) for p in err.absolute_path) or "root"
             phase_errors.append(f"{path}: {err.message}")
         if not phase_errors:
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Data-driven evidence renderer — every evidence page of every case.
+
+Reads `evidences` / `extraEvidences` (and their hotspots) from the case
+JSONs and renders each page with the layout for its evidence `type`.
+Hotspot notes are printed inside their hotspot rectangles.
+
+Usage:
+    python evidence_renderer.py                          # All cases
+    python evidence_renderer.py ../../Assets/.../core_03_curfew_runner.json
+    python evidence_renderer.py --type Photo --jobs 4
+    python evidence_renderer.py --no-halftone -o /tmp/evidence
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from halftone_common import (
+    PALETTE, OUTPUT_DIR, RenderRNG,
+    load_font, make_paper_texture, InkScreen, apply_halftone_screens,
+    add_grain_overlay, add_paper_wear,
+    draw_bureau_header, draw_pattern_emblem, draw_footer, stamp_seal,
+)
+from text_layout import centered_x, wrap_text
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent  # Tools/CaseGenerator -> Tools -> project root
+CASES_DIR = PROJECT_ROOT / "Assets" / "StreamingAssets" / "content" / "cases"
+EVIDENCE_OUTPUT_DIR = OUTPUT_DIR / "evidence"
+
+_TAG_RE = re.compile(r"</?\w+>")
+
+
+# =============================================================================
+# LAYOUT SPECS — one per evidence `type` in the case schema
+# =============================================================================
+# blend is the halftone strength (see apply_halftone_blend)
+
+LAYOUTS = {
+    "Document": {
+        "blend": 0.45,
+        "size": (600, 840),
+        "paper": PALETTE["paper"],
+        "dot_spacing": 10,
+        "header": True,
+        "stamp": ("SECTOR 3", "FILED"),
+        "creases": ((None, True),),
+    },
+    "Photo": {
+        "blend": 0.6,
+        "size": (600, 520),
+        "paper": PALETTE["paper_warm"],
+        "dot_spacing": 5,
+        "photo_box": (30, 30, 570, 420),
+        "creases": (),
+    },
+    "Disc": {
+        "blend": 0.35,
+        "size": (520, 520),
+        "paper": PALETTE["desk"],
+        "dot_spacing": 6,
+        "creases": (),
+    },
+    "Item": {
+        "blend": 0.4,
+        "size": (480, 300),
+        "paper": PALETTE["paper_warm"],
+        "dot_spacing": 6,
+        "creases": (),
+    },
+}
+
+
+@dataclass(frozen=True)
+class EvidencePage:
+    """One page to render: an evidence entry plus where it came from."""
+    case_id: str
+    case_dir: str
+    evidence: dict
+    page: int
+    pages: int
+
+    @property
+    def file_name(self):
+        stem = self.evidence["id"]
+        return f"{stem}.png" if self.pages == 1 else f"{stem}_p{self.page + 1}.png"
+
+    @property
+    def seed(self):
+        """Stable per-page seed, so reruns produce the same page."""
+        return zlib.crc32(f"{self.case_id}/{self.evidence['id']}/{self.page}".encode())
+
+
+# =============================================================================
+# CASE LOADING
+# =============================================================================
+
+def load_pages(case_paths, types=None):
+    """
+    Collect the evidence pages of the given case files.
+
+    Args:
+        case_paths: Iterable of case JSON paths
+        types: Optional set of evidence types to keep
+
+    Returns:
+        List of EvidencePage, in case then evidence order.
+    """
+    pages = []
+    for path in case_paths:
+        with open(path, encoding="utf-8") as f:
+            case = json.load(f)
+        case_id = case.get("caseID", Path(path).stem)
+        for key in ("evidences", "extraEvidences"):
+            for ev in case.get(key) or []:
+                if types and ev.get("type") not in types:
+                    continue
+                # cardImagePath is "Evidence/<case_dir>/<id>_card"
+                parts = ev.get("cardImagePath", "").split("/")
+                case_dir = parts[1] if len(parts) > 2 else case_id
+                count = 1 + max((h.get("pageIndex", 0) for h in ev.get("hotspots") or []),
+                                default=0)
+                pages.extend(EvidencePage(case_id, case_dir, ev, p, count)
+                             for p in range(count))
+    return pages
+
+
+# =============================================================================
+# TEXT HELPERS
+# =============================================================================
+
+def plain_note(text):
+    """Hotspot note text without its <person>/<location> markup."""
+    return _TAG_RE.sub("", text)
+
+
+def _draw_centered(draw, w, y, text, font, fill):
+    draw.text((centered_x(font, text, w), y), text, fill=fill, font=font)
+
+
+def _draw_block(draw, box, text, font, fill, line_h, middle=False):
+    """
+    Wrap text into box (x0, y0, x1, y1); lines that do not fit are dropped.
+
+    middle=True centers the block vertically in the box.
+    """
+    x0, y0, x1, y1 = box
+    lines = wrap_text(text, font, x1 - x0)
+    y = y0
+    if middle:
+        y = max(y0, (y0 + y1 - len(lines) * line_h) // 2)
+    for line in lines:
+        if y + line_h > y1:
+            break
+        draw.text((x0, y), line, fill=fill, font=font)
+        y += line_h
+    return y
+
+
+def _hotspot_box(hotspot, w, h):
+    """Pixel rectangle of a hotspot (position is the normalized center)."""
+    cx, cy = hotspot["positionX"] * w, hotspot["positionY"] * h
+    hw, hh = hotspot["width"] * w / 2, hotspot["height"] * h / 2
+    return int(cx - hw), int(cy - hh), int(cx + hw), int(cy + hh)
+
+
+# =============================================================================
+# COMPILED LAYOUTS
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def compile_layout(kind):
+    """
+    Draw the static part of a layout once.
+
+    Returns:
+        (spec, base) — the LAYOUTS entry and its chrome as an RGB image.
+    """
+    spec = LAYOUTS.get(kind, LAYOUTS["Document"])
+    w, h = spec["size"]
+    ink_light = PALETTE["ink_light"]
+    brown = PALETTE["bureau_brown"]
+
+    if kind == "Disc":
+        base = Image.new("RGB", (w, h), spec["paper"])
+        draw = ImageDraw.Draw(base)
+        r = w // 2 - 20
+        draw.ellipse([w // 2 - r, h // 2 - r, w // 2 + r, h // 2 + r],
+                     fill=(150, 150, 156), outline=(90, 90, 96), width=3)
+        draw.ellipse([w // 2 - r + 40, h // 2 - r + 40, w // 2 + r - 40, h // 2 + r - 40],
+                     fill=PALETTE["paper_warm"])
+        draw.ellipse([w // 2 - 26, h // 2 - 26, w // 2 + 26, h // 2 + 26],
+                     fill=spec["paper"], outline=(90, 90, 96), width=2)
+        return spec, base
+
+    base = make_paper_texture(w, h, spec["paper"], grain_amount=8, fiber_density=1,
+                              seed=zlib.crc32(kind.encode()))
+    draw = ImageDraw.Draw(base)
+    draw.rectangle([12, 12, w - 13, h - 13], outline=brown, width=2)
+
+    if spec.get("header"):
+        y = draw_bureau_header(draw, base, w, 30, font_size=18)
+        draw_pattern_emblem(draw, w // 2, y + 22, 16, brown)
+        draw_footer(draw, base, w, h, color=ink_light)
+    elif kind == "Photo":
+        x0, y0, x1, y1 = spec["photo_box"]
+        draw.rectangle([x0 - 2, y0 - 2, x1 + 2, y1 + 2], outline=PALETTE["ink_mid"], width=2)
+    elif kind == "Item":
+        # Evidence tag: punched hole and a brown header band
+        draw.rectangle([12, 12, w - 13, 56], fill=brown)
+        draw.ellipse([w - 50, 22, w - 26, 46], fill=PALETTE["desk"])
+        _draw_centered(draw, w, 22, "BUREAU EVIDENCE", load_font("sans_bold", 18),
+                       PALETTE["paper"])
+    return spec, base
+
+
+# =============================================================================
+# PAGE RENDERERS
+# =============================================================================
+
+def _render_document(spec, img, page):
+    ev = page.evidence
+    w, h = img.size
+    draw = ImageDraw.Draw(img)
+    ink, ink_mid, brown = PALETTE["ink"], PALETTE["ink_mid"], PALETTE["bureau_brown"]
+
+    _draw_centered(draw, w, 120, ev["title"].upper(), load_font("serif_bold", 22), ink)
+    draw.rectangle([24, 152, w - 24, 174], fill=brown)
+    form = f"{ev['id'].upper()}  /  CASE: {page.case_id}"
+    if page.pages > 1:
+        form += f"  /  PAGE {page.page + 1} OF {page.pages}"
+    draw.text((32, 156), form, fill=PALETTE["paper"], font=load_font("mono", 11))
+
+    note_font = load_font("serif", 14)
+    for hotspot in ev.get("hotspots") or []:
+        if hotspot.get("pageIndex", 0) != page.page:
+            continue
+        x0, y0, x1, y1 = _hotspot_box(hotspot, w, h)
+        _draw_block(draw, (x0, y0, x1, y1), plain_note(hotspot["noteText"]), note_font,
+                    ink, 18, middle=True)
+
+    if page.page == 0:
+        draw.text((40, int(h * 0.70)), "SUMMARY:", fill=ink_mid,
+                  font=load_font("sans_bold", 12))
+        _draw_block(draw, (40, int(h * 0.70) + 18, w - 200, h - 40), ev["description"],
+                    load_font("sans", 12), ink_mid, 16)
+        top, bottom = spec["stamp"]
+        stamp_seal(img, w - 110, h - 110, 50, top, bottom,
+                   color=PALETTE["stamp_dark"], misalign=(3, -2))
+
+
+def _render_photo(spec, img, page):
+    ev = page.evidence
+    w, h = img.size
+    draw = ImageDraw.Draw(img)
+    x0, y0, x1, y1 = spec["photo_box"]
+
+    # Night exposure: dark gradient, brighter toward the street lamp
+    for y in range(y0, y1):
+        shade = 40 + int(50 * (y - y0) / (y1 - y0))
+        draw.line([(x0, y), (x1, y)], fill=(shade, shade, shade - 6))
+
+    # A dark figure in every hotspot, so the clue area shows something
+    pw, ph = x1 - x0, y1 - y0
+    for hotspot in ev.get("hotspots") or []:
+        if hotspot.get("pageIndex", 0) != page.page:
+            continue
+        bx0, by0, bx1, by1 = _hotspot_box(hotspot, pw, ph)
+        cx, bottom = x0 + (bx0 + bx1) // 2, y0 + by1
+        for dx in (-(bx1 - bx0) // 4, (bx1 - bx0) // 4):
+            head = max(6, (by1 - by0) // 6)
+            draw.ellipse([cx + dx - head, y0 + by0, cx + dx + head, y0 + by0 + 2 * head],
+                         fill=(18, 18, 20))
+            draw.rectangle([cx + dx - head, y0 + by0 + 2 * head, cx + dx + head, bottom],
+                           fill=(18, 18, 20))
+
+    ink = PALETTE["ink"]
+    draw.text((x0, y1 + 14), ev["title"].upper(), fill=ink, font=load_font("mono_bold", 14))
+    _draw_block(draw, (x0, y1 + 36, x1, h - 16), ev["description"],
+                load_font("mono", 11), PALETTE["ink_mid"], 14)
+
+
+def _render_disc(spec, img, page):
+    ev = page.evidence
+    w, h = img.size
+    draw = ImageDraw.Draw(img)
+    ink = PALETTE["ink"]
+    _draw_centered(draw, w, h // 2 - 110, ev["title"].upper(), load_font("sans_bold", 16), ink)
+    _draw_centered(draw, w, h // 2 + 60, ev["id"].upper(), load_font("mono", 12),
+                   PALETTE["ink_mid"])
+    _draw_centered(draw, w, h // 2 + 80, page.case_id, load_font("mono", 12),
+                   PALETTE["ink_mid"])
+
+
+def _render_item(spec, img, page):
+    ev = page.evidence
+    w, h = img.size
+    draw = ImageDraw.Draw(img)
+    ink = PALETTE["ink"]
+    draw.text((28, 72), ev["title"].upper(), fill=ink, font=load_font("serif_bold", 18))
+    draw.text((28, 100), f"{ev['id'].upper()}  /  {page.case_id}",
+              fill=PALETTE["ink_light"], font=load_font("mono", 11))
+    _draw_block(draw, (28, 124, w - 28, h - 24), ev["description"],
+                load_font("serif", 13), PALETTE["ink_mid"], 17)
+
+
+_RENDERERS = {
+    "Document": _render_document,
+    "Photo": _render_photo,
+    "Disc": _render_disc,
+    "Item": _render_item,
+}
+
+
+def render_page(page, skip_halftone=False):
+    """
+    Render one evidence page from its compiled layout.
+
+    Returns:
+        PIL Image (RGB).
+    """
+    kind = page.evidence.get("type", "Document")
+    spec, base = compile_layout(kind)
+    img = base.copy()
+    rng = RenderRNG(page.seed)
+    _RENDERERS.get(kind, _render_document)(spec, img, page)
+
+    if spec["creases"]:
+        add_paper_wear(img, creases=spec["creases"], edge_wear=1, seed=rng)
+    if not skip_halftone:
+        # Blended like apply_halftone_blend so the notes stay readable
+        halftoned = apply_halftone_screens(img, [
+            InkScreen(PALETTE["ink"], spec["dot_spacing"]),
+            InkScreen(PALETTE["bureau_brown"], spec["dot_spacing"] + 4, angle=15,
+                      intensity=0.12, tone=False),
+        ], bg_color=spec["paper"], seed=rng)
+        img = Image.blend(img, halftoned, spec["blend"])
+    return add_grain_overlay(img, amount=6, seed=rng)
+
+
+# =============================================================================
+# BATCH
+# =============================================================================
+
+def _render_to_file(page, out_dir, skip_halftone):
+    out_path = Path(out_dir) / page.case_dir / page.file_name
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    render_page(page, skip_halftone).save(out_path)
+    return out_path
+
+
+def render_batch(pages, out_dir=EVIDENCE_OUTPUT_DIR, workers=None, skip_halftone=False):
+    """
+    Render a batch of evidence pages, optionally across a process pool.
+
+    Args:
+        pages: List of EvidencePage
+        out_dir: Root directory; pages land in <out_dir>/<case_dir>/
+        workers: Process count. Default: this process only
+        skip_halftone: Skip the halftone pass (for debugging)
+
+    Returns:
+        List of written paths.
+    """
+    pages = sorted(pages, key=lambda p: p.evidence.get("type", ""))
+    if workers is None or workers <= 1 or len(pages) <= 1:
+        return [_render_to_file(page, out_dir, skip_halftone) for page in pages]
+
+    chunk = max(1, len(pages) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_to_file, pages, [out_dir] * len(pages),
+                             [skip_halftone] * len(pages), chunksize=chunk))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render every evidence page of the case JSONs"
+    )
+    parser.add_argument("cases", nargs="*",
+                        help=f"Case JSON files (default: all in {CASES_DIR})")
+    parser.add_argument("-o", "--output-dir", default=str(EVIDENCE_OUTPUT_DIR),
+                        help="Output root directory")
+    parser.add_argument("--type", action="append", dest="types",
+                        choices=sorted(LAYOUTS), help="Only these evidence types")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-halftone", action="store_true",
+                        help="Skip halftone overlay (for debugging)")
+    args = parser.parse_args()
+
+    case_paths = args.cases or sorted(CASES_DIR.glob("*.json"))
+    pages = load_pages(case_paths, set(args.types or ()))
+    if not pages:
+        print("No evidence pages found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    paths = render_batch(pages, args.output_dir, args.jobs, args.no_halftone)
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {len(paths)} evidence page(s) from {len(case_paths)} case(s) "
+          f"in {elapsed:.2f}s -> {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
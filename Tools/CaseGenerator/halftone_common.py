@@ -6,16 +6,38 @@ Provides:
 - Master palette constants
 - Halftone dot overlay generation
 - Paper texture generation
+- Paper wear effects (fold creases, worn edges, stains)
 - Common drawing helpers (borders, stamps, headers)
 - Font loading with fallback chain
+- Reproducible per-render random streams (RenderRNG)
 """
 
+import argparse
+import hashlib
+import json
 import math
+import os
 import random
+import sys
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from multiprocessing import shared_memory
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFont
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: 'numpy' package not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from text_layout import text_bbox
 
 OUTPUT_DIR = Path(__file__).parent / "output"
+CACHE_DIR = OUTPUT_DIR / ".cache"
 
 # =============================================================================
 # MASTER PALETTE — from art_style_bible.md
@@ -65,23 +87,149 @@ _FONT_DIRS = [
 
 _FONT_CACHE = {}
 
+# Lowercased font filename -> path, built once per process and persisted
+# so later runs only re-stat the font directories instead of walking them.
+FONT_INDEX_PATH = CACHE_DIR / "font_index.json"
+_FONT_INDEX_VERSION = 1
+_FONT_INDEX = None
+
+
+def _scan_font_dirs():
+    """Walk every font directory once. Returns (index, dir_mtimes)."""
+    index = {}
+    mtimes = {}
+    for d in _FONT_DIRS:
+        if not d.is_dir():
+            continue
+        for root, dirs, files in os.walk(d):
+            dirs.sort()
+            try:
+                mtimes[root] = os.stat(root).st_mtime_ns
+            except OSError:
+                continue
+            for f in sorted(files):
+                index.setdefault(f.lower(), os.path.join(root, f))
+    return index, mtimes
+
+
+def _font_index_is_fresh(data):
+    """True if no font directory appeared, vanished or changed since data."""
+    if data.get("version") != _FONT_INDEX_VERSION:
+        return False
+    if data.get("roots") != [str(d) for d in _FONT_DIRS]:
+        return False
+    mtimes = data.get("mtimes", {})
+    for d in _FONT_DIRS:
+        if str(d) not in mtimes and d.is_dir():
+            return False
+    for root, mtime in mtimes.items():
+        try:
+            if os.stat(root).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _font_index():
+    """Return the font filename index, loading or rebuilding it as needed."""
+    global _FONT_INDEX
+    if _FONT_INDEX is not None:
+        return _FONT_INDEX
+
+    try:
+        with open(FONT_INDEX_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if _font_index_is_fresh(data):
+            _FONT_INDEX = data["fonts"]
+            return _FONT_INDEX
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    index, mtimes = _scan_font_dirs()
+    _FONT_INDEX = index
+    data = {
+        "version": _FONT_INDEX_VERSION,
+        "roots": [str(d) for d in _FONT_DIRS],
+        "mtimes": mtimes,
+        "fonts": index,
+    }
+    try:
+        FONT_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = FONT_INDEX_PATH.with_name(f"font_index.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, FONT_INDEX_PATH)
+    except OSError:
+        pass
+    return _FONT_INDEX
+
+
 def _find_font_file(names):
-    """Search for font files by name across system font directories."""
+    """Look up font files by name in the system font index."""
+    index = _font_index()
     for name in names:
         # Try exact path first
         p = Path(name)
         if p.exists():
             return str(p)
-        # Search font directories
-        for d in _FONT_DIRS:
-            if not d.exists():
-                continue
-            for f in d.rglob("*"):
-                if f.name.lower() == name.lower():
-                    return str(f)
+        path = index.get(name.lower())
+        if path is not None:
+            return path
     return None
 
 
+# File names tried for each style, in order of preference
+FONT_CANDIDATES = {
+    "serif": [
+        "times.ttf", "timesbd.ttf", "Times New Roman.ttf",
+        "Georgia.ttf", "georgia.ttf",
+        "DejaVuSerif.ttf", "LiberationSerif-Regular.ttf",
+    ],
+    "serif_bold": [
+        "timesbd.ttf", "Times New Roman Bold.ttf",
+        "georgiab.ttf", "Georgia Bold.ttf",
+        "DejaVuSerif-Bold.ttf", "LiberationSerif-Bold.ttf",
+    ],
+    "sans": [
+        "arial.ttf", "Arial.ttf",
+        "Helvetica.ttf", "helvetica.ttf",
+        "DejaVuSans.ttf", "LiberationSans-Regular.ttf",
+    ],
+    "sans_bold": [
+        "arialbd.ttf", "Arial Bold.ttf",
+        "Helvetica-Bold.ttf",
+        "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf",
+    ],
+    "mono": [
+        "cour.ttf", "Courier New.ttf", "courbd.ttf",
+        "DejaVuSansMono.ttf", "LiberationMono-Regular.ttf",
+    ],
+    "mono_bold": [
+        "courbd.ttf", "Courier New Bold.ttf",
+        "DejaVuSansMono-Bold.ttf", "LiberationMono-Bold.ttf",
+    ],
+    "condensed": [
+        "arialn.ttf", "Arial Narrow.ttf",
+        "impact.ttf", "Impact.ttf",
+        "DejaVuSans-ExtraLight.ttf",
+    ],
+    "condensed_bold": [
+        "arialnb.ttf", "Arial Narrow Bold.ttf",
+        "impact.ttf", "Impact.ttf",
+    ],
+    "cursive": [
+        "segoesc.ttf", "Segoe Script.ttf",
+        "palai.ttf", "Palatino Linotype Italic.ttf",
+        "ITCEDSCR.TTF", "Edwardian Script ITC.ttf",
+    ],
+    "handwritten": [
+        "segoepr.ttf", "Segoe Print.ttf",
+        "comic.ttf", "Comic Sans MS.ttf",
+    ],
+}
+
+
 def load_font(style, size):
     """
     Load a TrueType font by style name and size.
@@ -98,56 +246,7 @@ def load_font(style, size):
     if key in _FONT_CACHE:
         return _FONT_CACHE[key]
 
-    candidates = {
-        "serif": [
-            "times.ttf", "timesbd.ttf", "Times New Roman.ttf",
-            "Georgia.ttf", "georgia.ttf",
-            "DejaVuSerif.ttf", "LiberationSerif-Regular.ttf",
-        ],
-        "serif_bold": [
-            "timesbd.ttf", "Times New Roman Bold.ttf",
-            "georgiab.ttf", "Georgia Bold.ttf",
-            "DejaVuSerif-Bold.ttf", "LiberationSerif-Bold.ttf",
-        ],
-        "sans": [
-            "arial.ttf", "Arial.ttf",
-            "Helvetica.ttf", "helvetica.ttf",
-            "DejaVuSans.ttf", "LiberationSans-Regular.ttf",
-        ],
-        "sans_bold": [
-            "arialbd.ttf", "Arial Bold.ttf",
-            "Helvetica-Bold.ttf",
-            "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf",
-        ],
-        "mono": [
-            "cour.ttf", "Courier New.ttf", "courbd.ttf",
-            "DejaVuSansMono.ttf", "LiberationMono-Regular.ttf",
-        ],
-        "mono_bold": [
-            "courbd.ttf", "Courier New Bold.ttf",
-            "DejaVuSansMono-Bold.ttf", "LiberationMono-Bold.ttf",
-        ],
-        "condensed": [
-            "arialn.ttf", "Arial Narrow.ttf",
-            "impact.ttf", "Impact.ttf",
-            "DejaVuSans-ExtraLight.ttf",
-        ],
-        "condensed_bold": [
-            "arialnb.ttf", "Arial Narrow Bold.ttf",
-            "impact.ttf", "Impact.ttf",
-        ],
-        "cursive": [
-            "segoesc.ttf", "Segoe Script.ttf",
-            "palai.ttf", "Palatino Linotype Italic.ttf",
-            "ITCEDSCR.TTF", "Edwardian Script ITC.ttf",
-        ],
-        "handwritten": [
-            "segoepr.ttf", "Segoe Print.ttf",
-            "comic.ttf", "Comic Sans MS.ttf",
-        ],
-    }
-
-    names = candidates.get(style, candidates["sans"])
+    names = FONT_CANDIDATES.get(style, FONT_CANDIDATES["sans"])
     path = _find_font_file(names)
 
     if path:
@@ -164,11 +263,437 @@ def load_font(style, size):
     return font
 
 
+def resolved_font_files():
+    """
+    Font file load_font would use for each style on this machine.
+
+    Returns:
+        Dict of style -> file path, or None where Pillow's default is used.
+    """
+    return {style: _find_font_file(names) for style, names in FONT_CANDIDATES.items()}
+
+
+# =============================================================================
+# RENDER RNG — named, independent random streams per render
+# =============================================================================
+
+# Rows per grain tile; fixed so the grain never depends on band height
+RNG_TILE_ROWS = 256
+
+
+def _stream_id(name):
+    """32-bit spawn-key word for a stream name or tile index."""
+    return zlib.crc32(repr(name).encode("utf-8"))
+
+
+class RenderRNG:
+    """
+    Random streams for one render, derived from a single seed.
+
+    Usage:
+        rng = RenderRNG(seed)
+        rand = rng.stdlib("typewriter")        # random.Random
+        noise = rng.numpy("photo").integers(...)
+        add_grain_overlay(img, 6, seed=rng)    # helpers pick their own stream
+        add_grain_overlay(img, 3, seed=rng.child("second pass"))
+
+    Every helper that takes seed= accepts a RenderRNG as well as an int or
+    numpy Generator.
+    """
+
+    def __init__(self, seed=None, path=()):
+        # seed=None: fresh entropy, still consistent within this render
+        self.seeded = seed is not None
+        if self.seeded and int(seed) < 0:
+            raise ValueError(f"seed must be a non-negative integer, got {seed}")
+        self.seed = int(seed) if self.seeded else np.random.SeedSequence().entropy
+        self.path = tuple(path)
+
+    def __repr__(self):
+        return f"RenderRNG({self.seed}, path={self.path!r})"
+
+    def child(self, *names):
+        """Context whose streams are independent of this one's."""
+        ctx = RenderRNG(self.seed, self.path + names)
+        ctx.seeded = self.seeded
+        return ctx
+
+    def tile(self, index):
+        """Context for one tile/band of tiled work."""
+        return self.child("tile", index)
+
+    def _sequence(self, name):
+        return np.random.SeedSequence(
+            self.seed, spawn_key=tuple(_stream_id(p) for p in self.path + (name,))
+        )
+
+    def numpy(self, name):
+        """Independent numpy Generator for the named stream."""
+        return np.random.default_rng(self._sequence(name))
+
+    def stdlib(self, name):
+        """Independent random.Random for the named stream."""
+        return random.Random(self.seed_for(name))
+
+    def seed_for(self, name):
+        """Int seed for the named stream (for int-seeded helpers and caches)."""
+        return int(self._sequence(name).generate_state(1, np.uint64)[0])
+
+
+def _numpy_rng(seed, stream):
+    """numpy Generator from an int, Generator, RenderRNG or None."""
+    if isinstance(seed, RenderRNG):
+        return seed.numpy(stream)
+    return np.random.default_rng(seed)
+
+
+def seed_arg(text):
+    """argparse type for --seed: a non-negative integer."""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seed: {text!r}") from None
+    if seed < 0:
+        raise argparse.ArgumentTypeError(f"seed must be non-negative, got {seed}")
+    return seed
+
+
 # =============================================================================
 # HALFTONE DOT OVERLAY
 # =============================================================================
 
-def apply_halftone(img, dot_spacing=8, dot_color=None, bg_color=None, angle=0):
+# Pages above this many pixels are halftoned in horizontal bands
+HALFTONE_BAND_PIXELS = 1 << 22
+
+
+def _grid_band(w, h, dot_spacing, angle, y0, y1):
+    """
+    Dot centers of the (optionally rotated) halftone grid with y0 <= cy < y1.
+
+    Returns (cx, cy, gi) int arrays in grid order — gi is each dot's index
+    in the whole-page grid.
+    """
+    cos_a = math.cos(math.radians(angle))
+    sin_a = math.sin(math.radians(angle))
+
+    gxs = np.arange(-dot_spacing, w + dot_spacing, dot_spacing, dtype=np.float64)
+    gys = np.arange(-dot_spacing, h + dot_spacing, dot_spacing, dtype=np.float64)
+
+    # cy is linear in gx, so each row's extremes sit at its two ends
+    off_y = h * (1 - cos_a - sin_a) / 2
+    ends = gys[:, None] * cos_a + gxs[[0, -1]][None, :] * sin_a + off_y
+    rows = np.nonzero((ends.max(axis=1) > y0 - 1) & (ends.min(axis=1) < y1))[0]
+
+    gy, gx = np.meshgrid(gys[rows], gxs, indexing="ij")
+    cx = np.trunc(gx * cos_a - gy * sin_a + w * (1 - cos_a + sin_a) / 2)
+    cy = np.trunc(gx * sin_a + gy * cos_a + h * (1 - cos_a - sin_a) / 2)
+    cx = cx.astype(np.int64).ravel()
+    cy = cy.astype(np.int64).ravel()
+    gi = (rows[:, None] * gxs.size + np.arange(gxs.size)[None, :]).ravel()
+
+    inside = (cx >= 0) & (cx < w) & (cy >= max(y0, 0)) & (cy < min(y1, h))
+    return cx[inside], cy[inside], gi[inside]
+
+
+@lru_cache(maxsize=64)
+def _halftone_grid(w, h, dot_spacing, angle):
+    """Dot centers (cx, cy, gi) of the halftone grid for a w x h image."""
+    grid = _grid_band(w, h, dot_spacing, angle, 0, h)
+    for arr in grid:
+        arr.flags.writeable = False
+    return grid
+
+
+def _bands(w, h, band_height):
+    """Row ranges [(y0, y1), ...] covering an image of height h."""
+    if band_height is None:
+        band_height = h if w * h <= HALFTONE_BAND_PIXELS else HALFTONE_BAND_PIXELS // w
+    band_height = max(int(band_height), 16)
+    return [(y0, min(y0 + band_height, h)) for y0 in range(0, h, band_height)]
+
+
+def _dot_reach(dot_spacing, scale):
+    """Rows beyond its center a dot of max radius dot_spacing * scale can ink."""
+    return math.ceil(dot_spacing * scale) + 1
+
+
+def _dot_uniform(key, gi):
+    """Uniform [0, 1) value per grid index (splitmix64 of a 64-bit key)."""
+    with np.errstate(over="ignore"):
+        z = np.uint64(key) + (gi.astype(np.uint64) + np.uint64(1)) * np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
+def _dot_key(rng):
+    """Draw the 64-bit key for one tint layer's dot variation."""
+    return int(rng.integers(2 ** 64, dtype=np.uint64))
+
+
+def _summed_area(gray, acc):
+    """Summed-area table of a 2-D uint8 array, padded with a zero row/col."""
+    h, w = gray.shape
+    sat = np.zeros((h + 1, w + 1), dtype=acc)
+    sat[1:, 1:] = gray.cumsum(axis=1, dtype=acc)
+    sat[1:, 1:].cumsum(axis=0, out=sat[1:, 1:])
+    return sat
+
+
+def _ranked(n, *values):
+    """
+    Sorted distinct values (ints in [0, n]) of the arrays, and each array
+    mapped to positions in that list.
+    """
+    marks = np.zeros(n + 1, dtype=bool)
+    for v in values:
+        marks[v] = True
+    rank = np.cumsum(marks) - 1
+    return (np.flatnonzero(marks),) + tuple(rank[v] for v in values)
+
+
+def _residues(idx, n, step):
+    """Distinct residues mod step of the idx values strictly inside (0, n)."""
+    return np.unique(idx[(idx > 0) & (idx < n)] % step)
+
+
+def _prefix_sums(a, idx, step, acc):
+    """
+    Sums of the rows a[:i] for every i in idx (sorted, unique, 0 <= i <= len(a)).
+
+    The inner idx must fall on few residues mod step (a grid of that
+    period): the rows are read once, as step-row blocks split at the
+    residues, and only the block sums are accumulated.
+    """
+    n = a.shape[0]
+    out = np.zeros((len(idx),) + a.shape[1:], dtype=acc)
+    out[idx == n] = a.sum(axis=0, dtype=acc)
+    inner = np.nonzero((idx > 0) & (idx < n))[0]
+    res = _residues(idx, n, step)
+    if not len(inner):
+        return out
+    rho, k = int(res[0]), len(res)
+    nb = (n - rho) // step
+    cuts = list(res - rho) + [step]
+
+    # seg[0]: rows above the first block; then k pieces per block
+    seg = np.empty((1 + nb * k,) + a.shape[1:], dtype=acc)
+    seg[0] = a[:rho].sum(axis=0, dtype=acc)
+    blocks = a[rho:rho + nb * step].reshape((nb, step) + a.shape[1:])
+    pieces = seg[1:].reshape((nb, k) + a.shape[1:])
+    for j in range(k):
+        blocks[:, cuts[j]:cuts[j + 1]].sum(axis=1, dtype=acc, out=pieces[:, j])
+    np.cumsum(seg, axis=0, out=seg)
+
+    rows = idx[inner]
+    pos = (rows - rho) // step * k + np.searchsorted(res, (rows - rho) % step + rho)
+    tail = pos > nb * k
+    out[inner[~tail]] = seg[pos[~tail]]
+    for i, r in zip(inner[tail], rows[tail]):
+        # Past the last whole block
+        out[i] = seg[-1] + a[rho + nb * step:r].sum(axis=0, dtype=acc)
+    return out
+
+
+def _cell_means(gray, cx, cy, dot_spacing):
+    """
+    Average brightness of the dot_spacing cell around every center.
+
+    On an unrotated grid only the rows and columns that bound a cell get
+    prefix sums. Returns (means, valid) — valid is False for empty cells.
+    """
+    h, w = gray.shape
+    half = dot_spacing // 2
+    x0 = np.maximum(0, cx - half)
+    y0 = np.maximum(0, cy - half)
+    x1 = np.minimum(w, cx + half)
+    y1 = np.minimum(h, cy + half)
+
+    area = np.maximum(x1 - x0, 0) * np.maximum(y1 - y0, 0)
+    valid = area > 0
+    x0, y0 = np.minimum(x0, x1), np.minimum(y0, y1)
+
+    # int32 holds any page up to ~8 megapixels; posters fall back to int64
+    acc = np.int32 if h * w * 255 < 2 ** 31 else np.int64
+    rows, r0, r1 = _ranked(h, y0, y1)
+    cols, c0, c1 = _ranked(w, x0, x1)
+    regular = (len(_residues(rows, h, dot_spacing)) <= 2
+               and len(_residues(cols, w, dot_spacing)) <= 2)
+    if regular:
+        by_row = _prefix_sums(gray, rows, dot_spacing, acc)
+        sat = _prefix_sums(np.ascontiguousarray(by_row.T), cols, dot_spacing, acc).T
+    else:
+        sat = _summed_area(gray, acc)
+        r0, r1, c0, c1 = y0, y1, x0, x1
+    total = (sat[r1, c1].astype(np.int64) - sat[r0, c1] - sat[r1, c0]
+             + sat[r0, c0])
+    means = total / np.where(valid, area, 1)
+    return means, valid
+
+
+@lru_cache(maxsize=256)
+def _dot_sprite(dw, dh):
+    """Pixel offsets PIL lights up for an ellipse with an integer dw x dh bbox."""
+    sprite = Image.new("L", (dw + 1, dh + 1), 0)
+    ImageDraw.Draw(sprite).ellipse([0, 0, dw, dh], fill=255)
+    ys, xs = np.nonzero(np.asarray(sprite))
+    return ys, xs
+
+
+def _dot_coverage(h, w, cx, cy, r, top=0):
+    """
+    Boolean (h, w) map of pixels covered by filled dots of radius r.
+
+    Pixel-identical to ImageDraw.ellipse([cx-r, cy-r, cx+r, cy+r]). top is
+    the page row the map starts at; centers stay in page coordinates.
+    """
+    if len(cx) == 0:
+        return np.zeros((h, w), dtype=bool)
+    x0 = np.trunc(cx - r).astype(np.int64)
+    y0 = np.trunc(cy - r).astype(np.int64)
+    dw = np.trunc(cx + r).astype(np.int64) - x0
+    dh = np.trunc(cy + r).astype(np.int64) - y0
+    y0 -= top
+
+    # Dots may hang off any side (or sit past a band edge) — pad for all
+    pad = int(max(dw.max(), dh.max(), -x0.min(), -y0.min(),
+                  (x0 + dw).max() - w, (y0 + dh).max() - h, 0)) + 1
+    stride = w + 2 * pad
+    hit = np.zeros((h + 2 * pad) * stride, dtype=bool)
+    origin = (y0 + pad) * stride + (x0 + pad)
+
+    sizes = dw * 4096 + dh
+    for size in np.unique(sizes):
+        sel = sizes == size
+        ys, xs = _dot_sprite(int(size // 4096), int(size % 4096))
+        hit[(origin[sel, None] + (ys * stride + xs)[None, :]).ravel()] = True
+
+    return hit.reshape(h + 2 * pad, stride)[pad:pad + h, pad:pad + w]
+
+
+@dataclass(frozen=True)
+class InkScreen:
+    """
+    One ink screen of a multi-screen halftone separation.
+
+    color:       Ink colour (R,G,B)
+    dot_spacing: Distance between dot centers
+    angle:       Grid rotation in degrees
+    intensity:   Ink opacity, 0.0-1.0
+    tone:        True  — dot size follows cell darkness (max 0.45 * spacing)
+                 False — registration tint: dots of 0.5-1.0 x 0.35 * spacing,
+                         varied at random regardless of the image
+    """
+    color: tuple
+    dot_spacing: int = 8
+    angle: float = 0
+    intensity: float = 1.0
+    tone: bool = True
+
+
+@lru_cache(maxsize=64)
+def _separation_palette(bg_color, inks):
+    """Palette for every combination of overlapping screens (bit i: screen i)."""
+    palette = []
+    for combo in range(1 << len(inks)):
+        color = bg_color
+        for bit, (ink, alpha) in enumerate(inks):
+            if combo >> bit & 1:
+                color = tuple((i * alpha + c * (255 - alpha) + 127) // 255
+                              for i, c in zip(ink, color))
+        palette.extend(color)
+    return palette
+
+
+def _separation_index(gray, screens, keys, y0, y1):
+    """Per-pixel screen bitmask for rows [y0, y1) of a grayscale page array."""
+    h, w = gray.shape
+    whole = y0 == 0 and y1 == h
+    index = np.zeros((y1 - y0, w), dtype=np.uint8)
+
+    margin = max((_dot_reach(s.dot_spacing, 0.45) + s.dot_spacing // 2
+                  for s in screens if s.tone), default=0)
+    g0, g1 = max(y0 - margin, 0), min(y1 + margin, h)
+
+    for bit, screen in enumerate(screens):
+        spacing = screen.dot_spacing
+        if whole:
+            cx, cy, gi = _halftone_grid(w, h, spacing, screen.angle)
+        else:
+            reach = _dot_reach(spacing, 0.45 if screen.tone else 0.35)
+            cx, cy, gi = _grid_band(w, h, spacing, screen.angle,
+                                    y0 - reach, y1 + reach)
+        if screen.tone:
+            means, valid = _cell_means(gray[g0:g1], cx, cy - g0, spacing)
+            # Darker = bigger dot (avg 0=black -> full radius, 255=white -> none)
+            r = spacing * 0.45 * (1.0 - (means / 255.0))
+            keep = valid & (r >= 0.5)
+            cx, cy, r = cx[keep], cy[keep], r[keep]
+        else:
+            r = spacing * 0.35 * (0.5 + _dot_uniform(keys[bit], gi) * 0.5)
+        hit = _dot_coverage(y1 - y0, w, cx, cy, r, top=y0).view(np.uint8)
+        index |= hit << bit if bit else hit
+    return index
+
+
+def apply_halftone_screens(img, screens, bg_color=None, seed=None,
+                           band_height=None, workers=None):
+    """
+    Print several ink screens onto blank stock in a single pass.
+
+    Equivalent to apply_halftone for the first screen followed by
+    apply_halftone_tint for each later one. Large pages are processed in
+    horizontal bands; the result is identical to a whole-page render.
+
+    Args:
+        img: PIL Image — the source to separate
+        screens: List of InkScreen (at most 8), printed in order
+        bg_color: Paper colour under the inks. Default: PALETTE["paper"]
+        seed: Int seed, numpy Generator or RenderRNG for the tint-screen
+              dot variation
+        band_height: Rows per band. Default: whole page unless it exceeds
+                     HALFTONE_BAND_PIXELS
+        workers: Process count for parallel bands. Default: this process only
+
+    Returns:
+        New PIL Image (RGB).
+    """
+    if bg_color is None:
+        bg_color = PALETTE["paper"]
+    if len(screens) > 8:
+        raise ValueError("apply_halftone_screens supports at most 8 screens")
+
+    w, h = img.size
+    rng = _numpy_rng(seed, "halftone")
+    keys = [None if s.tone else _dot_key(rng) for s in screens]
+    inks = tuple((tuple(s.color), int(255 * s.intensity)) for s in screens)
+    palette = _separation_palette(tuple(bg_color), inks)
+    gray = np.asarray(img.convert("L"))
+
+    if workers is not None and workers > 1:
+        bands = _parallel_bands(w, h, band_height, workers)
+        index = _run_bands(_separation_worker, (w, h), gray, bands, workers,
+                           tuple(screens), tuple(keys))
+        out = Image.fromarray(index, "P")
+        out.putpalette(palette)
+        return out.convert("RGB")
+
+    out = None
+    for y0, y1 in _bands(w, h, band_height):
+        band = Image.fromarray(_separation_index(gray, screens, keys, y0, y1), "P")
+        band.putpalette(palette)
+        band = band.convert("RGB")
+        if y1 - y0 == h:
+            return band
+        if out is None:
+            out = Image.new("RGB", (w, h))
+        out.paste(band, (0, y0))
+    return out
+
+
+def apply_halftone(img, dot_spacing=8, dot_color=None, bg_color=None, angle=0,
+                   workers=None):
     """
     Apply a halftone dot pattern overlay to an image.
 
@@ -183,64 +708,27 @@ def apply_halftone(img, dot_spacing=8, dot_color=None, bg_color=None, angle=0):
         dot_color: Tuple (R,G,B) for dots. Default: PALETTE["ink"]
         bg_color: Tuple (R,G,B) for background. Default: PALETTE["paper"]
         angle: Rotation angle in degrees for the dot grid
+        workers: Process count for parallel bands. Default: this process only
 
     Returns:
         New PIL Image with halftone effect applied.
     """
     if dot_color is None:
         dot_color = PALETTE["ink"]
-    if bg_color is None:
-        bg_color = PALETTE["paper"]
-
-    src = img.convert("L")  # grayscale
-    w, h = src.size
-    out = Image.new("RGB", (w, h), bg_color)
-    draw = ImageDraw.Draw(out)
+    screen = InkScreen(tuple(dot_color), dot_spacing, angle)
+    return apply_halftone_screens(img, [screen], bg_color, workers=workers)
 
-    max_r = dot_spacing * 0.45  # maximum dot radius
 
-    # Angle offset for grid
-    cos_a = math.cos(math.radians(angle))
-    sin_a = math.sin(math.radians(angle))
-
-    for gy in range(-dot_spacing, h + dot_spacing, dot_spacing):
-        for gx in range(-dot_spacing, w + dot_spacing, dot_spacing):
-            # Rotated grid position
-            cx = int(gx * cos_a - gy * sin_a + w * (1 - cos_a + sin_a) / 2)
-            cy = int(gx * sin_a + gy * cos_a + h * (1 - cos_a - sin_a) / 2)
-
-            if cx < 0 or cx >= w or cy < 0 or cy >= h:
-                continue
-
-            # Sample average brightness in cell
-            x0 = max(0, cx - dot_spacing // 2)
-            y0 = max(0, cy - dot_spacing // 2)
-            x1 = min(w, cx + dot_spacing // 2)
-            y1 = min(h, cy + dot_spacing // 2)
-
-            region = src.crop((x0, y0, x1, y1))
-            pixels = list(region.getdata())
-            if not pixels:
-                continue
-            avg = sum(pixels) / len(pixels)
-
-            # Darker = bigger dot (avg 0=black -> full radius, 255=white -> no dot)
-            darkness = 1.0 - (avg / 255.0)
-            r = max_r * darkness
-
-            if r < 0.5:
-                continue
-
-            draw.ellipse(
-                [cx - r, cy - r, cx + r, cy + r],
-                fill=dot_color
-            )
-
-    return out
+def _two_tone(mask, bg_color, dot_color):
+    """RGB image from a 0/1 uint8 mask: 0 = background, 1 = dot colour."""
+    # Mask doubles as palette indices, so PIL does the colour lookup in C
+    out = Image.fromarray(mask, "P")
+    out.putpalette(tuple(bg_color) + tuple(dot_color))
+    return out.convert("RGB")
 
 
 def apply_halftone_blend(img, dot_spacing=8, dot_color=None, bg_color=None,
-                          angle=0, blend=0.5):
+                          angle=0, blend=0.5, workers=None):
     """
     Apply halftone and blend with original for readable results.
 
@@ -253,15 +741,48 @@ def apply_halftone_blend(img, dot_spacing=8, dot_color=None, bg_color=None,
         dot_color, bg_color: Colors (default: ink on paper)
         angle: Grid rotation
         blend: 0.0 = original only, 1.0 = full halftone. Recommended: 0.4-0.6
+        workers: Process count for parallel bands. Default: this process only
 
     Returns:
         Blended PIL Image.
     """
-    halftoned = apply_halftone(img, dot_spacing, dot_color, bg_color, angle)
+    halftoned = apply_halftone(img, dot_spacing, dot_color, bg_color, angle,
+                               workers=workers)
     return Image.blend(img, halftoned, blend)
 
 
-def apply_halftone_tint(img, dot_spacing=8, tint_color=None, intensity=0.3, angle=15):
+@lru_cache(maxsize=64)
+def _tint_lut(tint_color, alpha):
+    """
+    768-entry Image.point table: every channel value alpha-composited under
+    tint_color. Rounds exactly like Image.alpha_composite over an opaque base.
+    """
+    lut = []
+    for c in tint_color:
+        lut.extend((c * alpha + v * (255 - alpha) + 127) // 255
+                   for v in range(256))
+    return lut
+
+
+def _tint_image(img, mask, tint_color, alpha):
+    """Composite tint_color at alpha over img where the uint8 mask is 255."""
+    tinted = img.point(_tint_lut(tuple(tint_color), alpha))
+    return Image.composite(tinted, img, Image.fromarray(mask, "L"))
+
+
+def _tint_mask(w, h, dot_spacing, angle, key, y0, y1):
+    """uint8 coverage mask (255 = dot) of the tint screen for rows [y0, y1)."""
+    if y1 - y0 == h:
+        cx, cy, gi = _halftone_grid(w, h, dot_spacing, angle)
+    else:
+        reach = _dot_reach(dot_spacing, 0.35)
+        cx, cy, gi = _grid_band(w, h, dot_spacing, angle, y0 - reach, y1 + reach)
+    r = dot_spacing * 0.35 * (0.5 + _dot_uniform(key, gi) * 0.5)  # slight variation
+    return _dot_coverage(y1 - y0, w, cx, cy, r, top=y0).view(np.uint8) * np.uint8(255)
+
+
+def apply_halftone_tint(img, dot_spacing=8, tint_color=None, intensity=0.3, angle=15,
+                        seed=None, band_height=None, workers=None):
     """
     Apply a colored halftone tint layer on top of an existing image.
 
@@ -274,6 +795,10 @@ def apply_halftone_tint(img, dot_spacing=8, tint_color=None, intensity=0.3, angl
         tint_color: Tuple (R,G,B) for tint dots
         intensity: 0.0-1.0, how visible the tint is
         angle: Grid rotation angle (offset from primary halftone)
+        seed: Int seed, numpy Generator or RenderRNG for reproducible dot
+              variation
+        band_height: Rows per band (see apply_halftone_screens)
+        workers: Process count for parallel bands. Default: this process only
 
     Returns:
         New PIL Image with tint applied.
@@ -281,87 +806,397 @@ def apply_halftone_tint(img, dot_spacing=8, tint_color=None, intensity=0.3, angl
     if tint_color is None:
         tint_color = PALETTE["bureau_brown"]
 
-    w, h = img.size
-    tint_layer = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(tint_layer)
-
-    max_r = dot_spacing * 0.35
+    base = img if img.mode == "RGB" else img.convert("RGB")
+    w, h = base.size
     alpha = int(255 * intensity)
-    fill = tint_color + (alpha,)
+    key = _dot_key(_numpy_rng(seed, "tint"))
+
+    if workers is not None and workers > 1:
+        bands = _parallel_bands(w, h, band_height, workers)
+        mask = _run_bands(_tint_worker, (w, h), None, bands, workers,
+                          dot_spacing, angle, key)
+        return _tint_image(base, mask, tint_color, alpha)
+
+    out = None
+    for y0, y1 in _bands(w, h, band_height):
+        mask = _tint_mask(w, h, dot_spacing, angle, key, y0, y1)
+        if y1 - y0 == h:
+            return _tint_image(base, mask, tint_color, alpha)
+        if out is None:
+            out = base.copy()
+        out.paste(_tint_image(base.crop((0, y0, w, y1)), mask, tint_color, alpha),
+                  (0, y0))
+    return out
 
-    cos_a = math.cos(math.radians(angle))
-    sin_a = math.sin(math.radians(angle))
 
-    for gy in range(-dot_spacing, h + dot_spacing, dot_spacing):
-        for gx in range(-dot_spacing, w + dot_spacing, dot_spacing):
-            cx = int(gx * cos_a - gy * sin_a + w * (1 - cos_a + sin_a) / 2)
-            cy = int(gx * sin_a + gy * cos_a + h * (1 - cos_a - sin_a) / 2)
+# =============================================================================
+# PARALLEL BANDS — workers share the page and result through shared memory
+# =============================================================================
+
+def _parallel_bands(w, h, band_height, workers):
+    """Bands for a pool of workers: at least two per worker to even out load."""
+    rows = -(-h // (workers * 2))
+    if band_height is None:
+        band_height = _bands(w, h, None)[0][1]
+    return _bands(w, h, min(rows, band_height))
+
+
+def _run_bands(worker, size, src_array, bands, workers, *args):
+    """
+    Fill an (h, w) uint8 array band by band in a process pool.
+
+    src_array (an (h, w) uint8 page, or None) is shared with the workers;
+    each task is worker(src_name, dst_name, size, y0, y1, *args) and writes
+    its own rows of the destination.
+
+    Returns:
+        The assembled (h, w) uint8 array.
+    """
+    w, h = size
+    blocks = []
+    try:
+        dst = shared_memory.SharedMemory(create=True, size=max(w * h, 1))
+        blocks.append(dst)
+        src_name = None
+        if src_array is not None:
+            src = shared_memory.SharedMemory(create=True, size=max(w * h, 1))
+            blocks.append(src)
+            np.ndarray((h, w), dtype=np.uint8, buffer=src.buf)[:] = src_array
+            src_name = src.name
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tasks = [pool.submit(worker, src_name, dst.name, size, y0, y1, *args)
+                     for y0, y1 in bands]
+            for task in tasks:
+                task.result()
+        return np.ndarray((h, w), dtype=np.uint8, buffer=dst.buf).copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _separation_worker(src_name, dst_name, size, y0, y1, screens, keys):
+    """Pool task: screen bitmask for one band of a shared page."""
+    w, h = size
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    try:
+        gray = np.ndarray((h, w), dtype=np.uint8, buffer=src.buf)
+        index = _separation_index(gray, screens, keys, y0, y1)
+        del gray
+        dst.buf[y0 * w:y1 * w] = index.tobytes()
+    finally:
+        src.close()
+        dst.close()
+
+
+def _tint_worker(src_name, dst_name, size, y0, y1, dot_spacing, angle, key):
+    """Pool task: tint coverage mask for one band (needs no source pixels)."""
+    w, h = size
+    dst = shared_memory.SharedMemory(name=dst_name)
+    try:
+        mask = _tint_mask(w, h, dot_spacing, angle, key, y0, y1)
+        dst.buf[y0 * w:y1 * w] = mask.tobytes()
+    finally:
+        dst.close()
+
+
+# =============================================================================
+# THRESHOLD-SCREEN HALFTONE
+# =============================================================================
+
+@lru_cache(maxsize=64)
+def _screen_vector(dot_spacing, angle):
+    """
+    Integer screen vector (a, b) closest to dot_spacing at angle degrees.
 
-            if cx < 0 or cx >= w or cy < 0 or cy >= h:
+    The lattice then repeats every (a^2 + b^2) / gcd(a, b) pixels.
+    """
+    theta = math.radians(angle)
+    best = None
+    reach = int(dot_spacing) + 2
+    for a in range(-reach, reach + 1):
+        for b in range(-reach, reach + 1):
+            length = math.hypot(a, b)
+            if length < 1:
                 continue
+            d_len = (length - dot_spacing) / dot_spacing
+            d_ang = math.atan2(b, a) - theta
+            d_ang = math.atan2(math.sin(d_ang), math.cos(d_ang))
+            cost = d_len * d_len + d_ang * d_ang
+            if best is None or cost < best[0]:
+                best = (cost, a, b)
+    return best[1], best[2]
+
+
+@lru_cache(maxsize=64)
+def _threshold_tile(dot_spacing, angle):
+    """
+    Periodic threshold tile for a clustered-dot screen.
+
+    A pixel is inked when its gray value is <= the tile value.
+    """
+    a, b = _screen_vector(dot_spacing, angle)
+    norm = a * a + b * b
+    period = norm // math.gcd(a, b)
+    max_r = math.sqrt(norm) * 0.45
+
+    y, x = np.mgrid[0:period, 0:period].astype(np.float64)
+    u = (x * a + y * b) / norm
+    v = (y * a - x * b) / norm
+    du = u - np.round(u)
+    dv = v - np.round(v)
+    dist = np.sqrt(du * du + dv * dv) * math.sqrt(norm)
+
+    # Same radius law as apply_halftone, sub-pixel dots dropped
+    reach = np.maximum(dist - 0.5, 0.5)
+    tile = np.floor(255.0 * (1.0 - reach / max_r))
+    tile = np.clip(tile, -1, 255).astype(np.int16)
+    tile.flags.writeable = False
+    return tile
+
+
+def apply_threshold_halftone(img, dot_spacing=8, dot_color=None, bg_color=None,
+                             angle=0):
+    """
+    Halftone by comparing the image against a cached threshold screen.
+
+    Same arguments and look as apply_halftone; cost does not depend on
+    dot_spacing.
+
+    Returns:
+        New PIL Image with halftone effect applied.
+    """
+    if dot_color is None:
+        dot_color = PALETTE["ink"]
+    if bg_color is None:
+        bg_color = PALETTE["paper"]
 
-            r = max_r * (0.5 + random.random() * 0.5)  # slight variation
-            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=fill)
+    gray = np.asarray(img.convert("L"))
+    h, w = gray.shape
 
-    base = img.convert("RGBA")
-    return Image.alpha_composite(base, tint_layer).convert("RGB")
+    tile = _threshold_tile(dot_spacing, angle)
+    period = tile.shape[0]
+    screen = np.tile(tile, (-(-h // period), -(-w // period)))[:h, :w]
+
+    mask = (gray <= screen).view(np.uint8)
+    return _two_tone(mask, bg_color, dot_color)
 
 
 # =============================================================================
 # PAPER TEXTURE
 # =============================================================================
 
-def make_paper_texture(w, h, base_color=None, grain_amount=12, fiber_density=0):
+# Seeded textures are cached in memory and under output/.cache/paper.
+# Bump the version whenever the texture algorithm changes.
+_PAPER_CACHE_VERSION = 1
+PAPER_CACHE_DIR = CACHE_DIR / "paper"
+PAPER_CACHE_MEMORY_BYTES = 256 * 1024 * 1024
+PAPER_CACHE_DISK_BYTES = 1024 * 1024 * 1024
+
+
+class _LRUCache:
+    """In-memory LRU cache bounded by the total byte size of its entries."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, nbytes):
+        if key in self._entries:
+            self.total -= self._entries.pop(key)[1]
+        if nbytes > self.max_bytes:
+            return
+        self._entries[key] = (value, nbytes)
+        self.total += nbytes
+        while self.total > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.total -= size
+
+    def clear(self):
+        self._entries.clear()
+        self.total = 0
+
+
+_PAPER_CACHE = _LRUCache(PAPER_CACHE_MEMORY_BYTES)
+
+
+def _disk_cache_load(path):
+    """Load a cached array and mark it recently used. None on a miss."""
+    try:
+        arr = np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return arr
+
+
+def _disk_cache_store(path, arr, max_bytes):
+    """Atomically write an array, then evict least recently used files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.save(f, arr, allow_pickle=False)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return
+
+    entries = []
+    for f in path.parent.glob("*.npy"):
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, f))
+    total = sum(size for _, size, _ in entries)
+    for _, size, f in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        if f == path:
+            continue
+        f.unlink(missing_ok=True)
+        total -= size
+
+
+def _paper_cache_key(w, h, base_color, grain_amount, fiber_density, seed):
+    raw = repr((_PAPER_CACHE_VERSION, w, h, tuple(base_color), grain_amount,
+                fiber_density, int(seed)))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def clear_paper_cache(disk=False):
+    """Drop cached paper textures from memory (and from disk if asked)."""
+    _PAPER_CACHE.clear()
+    if disk and PAPER_CACHE_DIR.exists():
+        for f in PAPER_CACHE_DIR.glob("*.npy"):
+            f.unlink(missing_ok=True)
+
+
+def _apply_grain(px, amount, rng):
+    """
+    Add one offset in [-amount, amount] per pixel to an RGB uint8 array.
+
+    With a RenderRNG, each RNG_TILE_ROWS-row tile draws from its own stream.
+    """
+    if isinstance(rng, RenderRNG):
+        for i, y0 in enumerate(range(0, px.shape[0], RNG_TILE_ROWS)):
+            _apply_grain(px[y0:y0 + RNG_TILE_ROWS], amount, rng.tile(i).numpy("grain"))
+        return px
+    noise = rng.integers(-amount, amount + 1, size=px.shape[:2], dtype=np.int16)
+    noise = noise[..., None] + px
+    np.clip(noise, 0, 255, out=noise)
+    px[...] = noise
+    return px
+
+
+def _draw_fibers(px, base, n_fibers, rng):
+    """
+    Draw n_fibers short, mostly horizontal fiber streaks into an RGB array.
+
+    All fibers are rasterized as one batch: every segment is sampled at
+    a fixed number of steps and written with a single scatter.
+    """
+    h, w = px.shape[:2]
+    fx = rng.integers(0, w, n_fibers)
+    fy = rng.integers(0, h, n_fibers)
+    length = rng.integers(3, 16, n_fibers)
+    angle = rng.uniform(-0.3, 0.3, n_fibers)  # mostly horizontal
+    shade = rng.integers(-8, 9, n_fibers)
+
+    dx = (length * np.cos(angle)).astype(np.int64)
+    dy = (length * np.sin(angle)).astype(np.int64)
+    steps = np.maximum(np.abs(dx), np.abs(dy))
+
+    t = np.arange(16)[None, :]
+    on = t <= steps[:, None]
+    frac = t / np.maximum(steps, 1)[:, None]
+    xs = np.floor(fx[:, None] + dx[:, None] * frac + 0.5).astype(np.int64)
+    ys = np.floor(fy[:, None] + dy[:, None] * frac + 0.5).astype(np.int64)
+    on &= (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+
+    fiber_color = np.clip(
+        base[None, :] + shade[:, None] - np.array([10, 10, 8]), 0, 255
+    ).astype(np.uint8)
+    colors = np.broadcast_to(fiber_color[:, None, :], xs.shape + (3,))
+    px[ys[on], xs[on]] = colors[on]
+
+
+def make_paper_texture(w, h, base_color=None, grain_amount=12, fiber_density=0,
+                       seed=None, cache=True):
     """
     Generate a paper texture background.
 
+    Textures built from an int seed are cached (memory LRU, then
+    output/.cache/paper on disk), so repeated backgrounds are reused.
+
     Args:
         w, h: Dimensions
         base_color: Base RGB tuple (default: PALETTE["paper"])
         grain_amount: Noise amplitude (0-30)
         fiber_density: 0=clean, 1=slight fibers, 2=visible fibers
+        seed: Int seed, numpy Generator or RenderRNG for reproducible
+              texture (default: fresh randomness every call)
+        cache: Set False to bypass the texture cache
 
     Returns:
-        PIL Image with paper texture.
+        PIL Image with paper texture (always a fresh copy, safe to draw on).
     """
     if base_color is None:
         base_color = PALETTE["paper"]
-
-    img = Image.new("RGB", (w, h), base_color)
-    pixels = img.load()
-
-    for y in range(h):
-        for x in range(w):
-            # Random grain
-            noise = random.randint(-grain_amount, grain_amount)
-            r = max(0, min(255, base_color[0] + noise))
-            g = max(0, min(255, base_color[1] + noise))
-            b = max(0, min(255, base_color[2] + noise))
-            pixels[x, y] = (r, g, b)
+    if isinstance(seed, RenderRNG):
+        # Seeded contexts map to an int so the texture stays cacheable
+        seed = seed.seed_for("paper") if seed.seeded else seed.numpy("paper")
+
+    key = None
+    if cache and isinstance(seed, (int, np.integer)):
+        key = _paper_cache_key(w, h, base_color, grain_amount, fiber_density,
+                               seed)
+        px = _PAPER_CACHE.get(key)
+        if px is None:
+            px = _disk_cache_load(PAPER_CACHE_DIR / f"{key}.npy")
+            if px is not None and px.shape == (h, w, 3):
+                _PAPER_CACHE.put(key, px, px.nbytes)
+            else:
+                px = None
+        if px is not None:
+            return Image.fromarray(px, "RGB")
+
+    rng = np.random.default_rng(seed)
+    base = np.array(base_color, dtype=np.int16)
+
+    px = np.empty((h, w, 3), dtype=np.uint8)
+    px[...] = base_color
+    _apply_grain(px, grain_amount, rng)
 
     # Add subtle fiber streaks
     if fiber_density > 0:
-        draw = ImageDraw.Draw(img)
         n_fibers = (w * h // 2000) * fiber_density
-        for _ in range(n_fibers):
-            fx = random.randint(0, w - 1)
-            fy = random.randint(0, h - 1)
-            length = random.randint(3, 15)
-            angle = random.uniform(-0.3, 0.3)  # mostly horizontal
-            ex = fx + int(length * math.cos(angle))
-            ey = fy + int(length * math.sin(angle))
-            shade = random.randint(-8, 8)
-            fiber_color = (
-                max(0, min(255, base_color[0] + shade - 10)),
-                max(0, min(255, base_color[1] + shade - 10)),
-                max(0, min(255, base_color[2] + shade - 8)),
-            )
-            draw.line([(fx, fy), (ex, ey)], fill=fiber_color, width=1)
+        _draw_fibers(px, base, n_fibers, rng)
 
-    return img
+    if key is not None:
+        px.flags.writeable = False
+        _PAPER_CACHE.put(key, px, px.nbytes)
+        _disk_cache_store(PAPER_CACHE_DIR / f"{key}.npy", px,
+                          PAPER_CACHE_DISK_BYTES)
+
+    return Image.fromarray(px, "RGB")
 
 
-def make_yellowed_paper(w, h, amount=1):
+def make_yellowed_paper(w, h, amount=1, seed=None):
     """Paper with yellowing effect. amount: 0=slight, 1=moderate, 2=heavy."""
     base = PALETTE["paper"]
     yellow_shift = 8 * (amount + 1)
@@ -371,13 +1206,17 @@ def make_yellowed_paper(w, h, amount=1):
         max(0, base[2] - yellow_shift),
     )
     return make_paper_texture(w, h, yellowed, grain_amount=10 + 4 * amount,
-                               fiber_density=amount)
+                               fiber_density=amount, seed=seed)
 
 
 # =============================================================================
 # DRAWING HELPERS
 # =============================================================================
 
+# Rows draw_bureau_header occupies below y_start
+BUREAU_HEADER_HEIGHT = 44
+
+
 def draw_bureau_header(draw, img, w, y_start, font_size=18):
     """Draw standard Bureau of Pattern Compliance header."""
     color = PALETTE["bureau_brown"]
@@ -390,7 +1229,7 @@ def draw_bureau_header(draw, img, w, y_start, font_size=18):
     # Header text
     header_font = load_font("serif_bold", font_size)
     text = "BUREAU OF PATTERN COMPLIANCE"
-    bbox = header_font.getbbox(text)
+    bbox = text_bbox(header_font, text)
     tw = bbox[2] - bbox[0]
     draw.text(((w - tw) // 2, y_start + 10), text, fill=color, font=header_font)
 
@@ -398,7 +1237,7 @@ def draw_bureau_header(draw, img, w, y_start, font_size=18):
     draw.line([(20, y_start + 34), (w - 20, y_start + 34)], fill=color, width=1)
     draw.line([(20, y_start + 38), (w - 20, y_start + 38)], fill=color, width=2)
 
-    return y_start + 44
+    return y_start + BUREAU_HEADER_HEIGHT
 
 
 def draw_pattern_emblem(draw, cx, cy, radius, color=None):
@@ -414,7 +1253,7 @@ def draw_pattern_emblem(draw, cx, cy, radius, color=None):
 
     # Inner P
     font = load_font("serif_bold", int(radius * 1.4))
-    bbox = font.getbbox("P")
+    bbox = text_bbox(font, "P")
     tw = bbox[2] - bbox[0]
     th = bbox[3] - bbox[1]
     draw.text((cx - tw // 2, cy - th // 2 - bbox[1]), "P", fill=color, font=font)
@@ -432,7 +1271,7 @@ def draw_stamp_circle(draw, cx, cy, radius, text_top, text_bottom, color=None,
         text_top: Text on upper arc
         text_bottom: Text on lower arc
         color: Stamp color (default: stamp_dark)
-        rotation: Not implemented yet — future enhancement
+        rotation: Degrees counter-clockwise (drawn from the cached stamp mask)
         misalign: (dx, dy) offset to simulate registration error
     """
     if color is None:
@@ -441,6 +1280,15 @@ def draw_stamp_circle(draw, cx, cy, radius, text_top, text_bottom, color=None,
     cx += misalign[0]
     cy += misalign[1]
 
+    if rotation % 360:
+        mask, (dx, dy) = stamp_mask(radius, text_top, text_bottom, rotation)
+        draw.bitmap((int(cx) + dx, int(cy) + dy), mask, fill=color)
+        return
+    _draw_stamp_artwork(draw, cx, cy, radius, text_top, text_bottom, color)
+
+
+def _draw_stamp_artwork(draw, cx, cy, radius, text_top, text_bottom, color):
+    """Rings, emblem and texts of an upright stamp centred on (cx, cy)."""
     # Outer ring (double)
     draw.ellipse(
         [cx - radius, cy - radius, cx + radius, cy + radius],
@@ -456,12 +1304,12 @@ def draw_stamp_circle(draw, cx, cy, radius, text_top, text_bottom, color=None,
 
     # Top text
     font = load_font("sans_bold", max(8, radius // 4))
-    bbox = font.getbbox(text_top)
+    bbox = text_bbox(font, text_top)
     tw = bbox[2] - bbox[0]
     draw.text((cx - tw // 2, cy - radius + 6), text_top, fill=color, font=font)
 
     # Bottom text
-    bbox = font.getbbox(text_bottom)
+    bbox = text_bbox(font, text_bottom)
     tw = bbox[2] - bbox[0]
     draw.text((cx - tw // 2, cy + radius - 18), text_bottom, fill=color, font=font)
 
@@ -472,47 +1320,298 @@ def draw_footer(draw, img, w, h, text="THE PATTERN PROVIDES", color=None,
     if color is None:
         color = PALETTE["ink_light"]
     font = load_font("sans", font_size)
-    bbox = font.getbbox(text)
+    bbox = text_bbox(font, text)
     tw = bbox[2] - bbox[0]
     y = h - 24
     draw.line([(20, y), (w - 20, y)], fill=color, width=1)
     draw.text(((w - tw) // 2, y + 4), text, fill=color, font=font)
 
 
-def add_grain_overlay(img, amount=15):
-    """Add random noise grain over the entire image."""
-    w, h = img.size
-    pixels = img.load()
-    for y in range(h):
-        for x in range(w):
-            r, g, b = pixels[x, y]
-            noise = random.randint(-amount, amount)
-            pixels[x, y] = (
-                max(0, min(255, r + noise)),
-                max(0, min(255, g + noise)),
-                max(0, min(255, b + noise)),
-            )
+# =============================================================================
+# STATIC CHROME LAYERS — borders, headers, emblems, footers as cached sprites
+# =============================================================================
+
+def _chrome_border(draw, img, w, h, inset=15, color=None, width=2):
+    if color is None:
+        color = PALETTE["bureau_brown"]
+    draw.rectangle([inset, inset, w - inset - 1, h - inset - 1], outline=color, width=width)
+
+
+def _chrome_header(draw, img, w, h, y=40, font_size=18):
+    draw_bureau_header(draw, img, w, y, font_size)
+
+
+def _chrome_emblem(draw, img, w, h, cx, cy, radius, color=None):
+    draw_pattern_emblem(draw, cx, cy, radius, color)
+
+
+def _chrome_stamp(draw, img, w, h, cx, cy, radius, text_top, text_bottom, color=None):
+    draw_stamp_circle(draw, cx, cy, radius, text_top, text_bottom, color)
+
+
+def _chrome_footer(draw, img, w, h, text="THE PATTERN PROVIDES", color=None, font_size=9):
+    draw_footer(draw, img, w, h, text, color, font_size)
+
+
+CHROME_ELEMENTS = {
+    "border": _chrome_border,
+    "bureau_header": _chrome_header,
+    "pattern_emblem": _chrome_emblem,
+    "stamp_circle": _chrome_stamp,
+    "footer": _chrome_footer,
+}
+
+
+def chrome(element, **params):
+    """
+    One static layer of a document type, in hashable form.
+
+    Args:
+        element: A CHROME_ELEMENTS name, or any module-level function
+                 draw_fn(draw, img, w, h, **params)
+        **params: Arguments for the element
+
+    Returns:
+        (element, params) tuple for chrome_layer / apply_chrome.
+    """
+    return element, tuple(sorted(params.items()))
+
+
+def _matte(w, h, paint):
+    """
+    Run paint(draw, img) on black and on white stock and recover the RGBA
+    sprite that reproduces it — antialiased text included — when pasted.
+
+    Returns:
+        (sprite, (x, y)) cropped to the painted area, or (None, (0, 0)).
+    """
+    stocks = [Image.new("RGB", (w, h), (v, v, v)) for v in (0, 255)]
+    for stock in stocks:
+        paint(ImageDraw.Draw(stock), stock)
+    on_black = np.asarray(stocks[0], dtype=np.int32)
+    on_white = np.asarray(stocks[1], dtype=np.int32)
+
+    # on_black = c*a, on_white = c*a + 255*(1-a)  ->  a = 255 - (white - black)
+    alpha = (255 - (on_white - on_black)).max(axis=2).clip(0, 255)
+    a = np.maximum(alpha, 1)[..., None]
+    rgb = ((on_black * 255 + a // 2) // a).clip(0, 255)
+    sprite = Image.fromarray(np.dstack([rgb, alpha]).astype(np.uint8), "RGBA")
+
+    bbox = sprite.getchannel("A").getbbox()
+    if bbox is None:
+        return None, (0, 0)
+    return sprite.crop(bbox), bbox[:2]
+
+
+@lru_cache(maxsize=32)
+def chrome_layer(w, h, layers):
+    """
+    All static layers of a w x h document type as one cached RGBA sprite.
+
+    Args:
+        w, h: Page size
+        layers: Tuple of chrome(...) entries, drawn in order
+
+    Returns:
+        (sprite, (x, y)) — sprite is None when nothing is drawn.
+    """
+    def paint(draw, img):
+        for element, params in layers:
+            fn = CHROME_ELEMENTS.get(element, element)
+            fn(draw, img, w, h, **dict(params))
+    return _matte(w, h, paint)
+
+
+def apply_chrome(img, layers):
+    """
+    Paste a document type's static chrome onto img (in place).
+
+    Args:
+        img: PIL Image (RGB) — the page
+        layers: Tuple of chrome(...) entries; keep it a module-level constant
+                so every page hits the same cached sprite
+
+    Returns:
+        The same image.
+    """
+    sprite, pos = chrome_layer(img.width, img.height, layers)
+    if sprite is not None:
+        img.paste(sprite, pos, sprite)
     return img
 
 
-def add_fold_crease(img, y_pos=None, horizontal=True):
-    """Add a subtle fold crease line across the image."""
-    w, h = img.size
-    draw = ImageDraw.Draw(img)
+def _stamp_extent(radius, text_top, text_bottom, pad=4):
+    """Half-size of a square that holds the stamp's rings and both texts."""
+    font = load_font("sans_bold", max(8, radius // 4))
+    extent = radius
+    for text, y in ((text_top, -radius + 6), (text_bottom, radius - 18)):
+        x0, y0, x1, y1 = text_bbox(font, text)
+        left = -((x1 - x0) // 2)
+        extent = max(extent, -(left + x0), left + x1, -(y + y0), y + y1)
+    return extent + pad
+
+
+@lru_cache(maxsize=128)
+def stamp_mask(radius, text_top, text_bottom, rotation=0):
+    """
+    Coverage mask ("L") of a draw_stamp_circle stamp, cached per shape.
 
+    Returns:
+        (mask, (dx, dy)) — the mask's top-left corner relative to the centre.
+    """
+    c = _stamp_extent(radius, text_top, text_bottom)
+    mask = Image.new("L", (2 * c + 1, 2 * c + 1), 0)
+    _draw_stamp_artwork(ImageDraw.Draw(mask), c, c, radius, text_top, text_bottom, 255)
+    if rotation % 360:
+        mask = mask.rotate(rotation, resample=Image.BICUBIC, expand=True)
+    # Rotation about the image centre keeps the stamp centre in the middle
+    ox, oy = mask.width // 2, mask.height // 2
+    bbox = mask.getbbox() or (0, 0, 1, 1)
+    return mask.crop(bbox), (bbox[0] - ox, bbox[1] - oy)
+
+
+def stamp_seal(img, cx, cy, radius, text_top, text_bottom, color=None,
+               misalign=(0, 0), rotation=0):
+    """Stamp a circular seal from the stamp mask cache (in place); see draw_stamp_circle."""
+    if color is None:
+        color = PALETTE["stamp_dark"]
+    mask, (dx, dy) = stamp_mask(radius, text_top, text_bottom, rotation)
+    img.paste(tuple(color), (int(cx) + misalign[0] + dx, int(cy) + misalign[1] + dy), mask)
+    return img
+
+
+def add_grain_overlay(img, amount=15, seed=None):
+    """
+    Add random noise grain over the entire image (in place).
+
+    Args:
+        img: PIL Image (RGB), modified in place and returned
+        amount: Noise amplitude
+        seed: Int seed, numpy Generator or RenderRNG for reproducible grain
+    """
+    px = np.array(img)
+    _apply_grain(px, amount, seed if isinstance(seed, RenderRNG)
+                 else np.random.default_rng(seed))
+    img.paste(Image.fromarray(px, "RGB"))
+    return img
+
+
+# =============================================================================
+# PAPER WEAR — creases, worn edges, stains
+# =============================================================================
+
+def _crease_delta(delta, pos, horizontal, rng):
+    """Darken one side of a fold line and lighten the other, wobbling ±1px."""
+    h, w = delta.shape[:2]
     if horizontal:
-        y = y_pos or h // 2
-        for x in range(w):
-            # Darken slightly above crease, lighten slightly below
-            offset = random.randint(-1, 1)
-            base_y = y + offset
-            if 0 <= base_y < h and 0 <= base_y + 1 < h:
-                r, g, b = img.getpixel((x, base_y))
-                img.putpixel((x, base_y), (
-                    max(0, r - 15), max(0, g - 15), max(0, b - 12)
-                ))
-                r2, g2, b2 = img.getpixel((x, base_y + 1))
-                img.putpixel((x, base_y + 1), (
-                    min(255, r2 + 8), min(255, g2 + 8), min(255, b2 + 6)
-                ))
+        length, extent = w, h
+    else:
+        length, extent = h, w
+    line = (pos or extent // 2) + rng.integers(-1, 2, length)
+    along = np.arange(length)
+    ok = (line >= 0) & (line + 1 < extent)
+    line, along = line[ok], along[ok]
+    if horizontal:
+        delta[line, along] += (-15, -15, -12)
+        delta[line + 1, along] += (8, 8, 6)
+    else:
+        delta[along, line] += (-15, -15, -12)
+        delta[along, line + 1] += (8, 8, 6)
+
+
+@lru_cache(maxsize=16)
+def _edge_profile(w, h, band):
+    """0..1 map that rises towards the paper edges over `band` pixels."""
+    x = np.arange(w, dtype=np.float32)
+    y = np.arange(h, dtype=np.float32)
+    dx = np.minimum(x, w - 1 - x)[None, :]
+    dy = np.minimum(y, h - 1 - y)[:, None]
+    profile = np.clip(1.0 - np.minimum(dx, dy) / band, 0.0, 1.0) ** 2
+    profile.flags.writeable = False
+    return profile
+
+
+def _smooth_noise(w, h, cell, rng):
+    """Low-frequency 0..1 noise: a coarse random grid upscaled bilinearly."""
+    coarse = rng.random((h // cell + 2, w // cell + 2)).astype(np.float32)
+    up = Image.fromarray(coarse, "F").resize((w, h), Image.BILINEAR)
+    return np.asarray(up)
+
+
+def _edge_wear_delta(delta, amount, rng):
+    """Browned, uneven edges — handled paper yellows and darkens at the rim."""
+    h, w = delta.shape[:2]
+    band = max(4.0, min(w, h) * 0.04 * amount)
+    wear = _edge_profile(w, h, band) * (0.4 + 0.6 * _smooth_noise(w, h, 24, rng))
+    delta += (wear[..., None] * np.array([-14, -20, -30], np.float32)
+              * amount).astype(np.int16)
+
+
+def _stain_delta(delta, n_stains, rng):
+    """Faint cup-ring stains: a darker rim around a lightly tinted interior."""
+    h, w = delta.shape[:2]
+    tint = np.array([-18, -26, -40], np.float32)
+    for _ in range(n_stains):
+        radius = rng.uniform(0.04, 0.12) * min(w, h)
+        cx, cy = rng.uniform(0, w), rng.uniform(0, h)
+        strength = rng.uniform(0.3, 0.7)
+        x0, x1 = max(0, int(cx - radius - 4)), min(w, int(cx + radius + 5))
+        y0, y1 = max(0, int(cy - radius - 4)), min(h, int(cy + radius + 5))
+        if x0 >= x1 or y0 >= y1:
+            continue
+        yy, xx = np.mgrid[y0:y1, x0:x1].astype(np.float32)
+        d = np.hypot(xx - cx, yy - cy)
+        rim = np.exp(-((d - radius) / 2.0) ** 2)
+        fill = (d < radius) * 0.25
+        alpha = (rim + fill) * strength
+        delta[y0:y1, x0:x1] += (alpha[..., None] * tint).astype(np.int16)
+
+
+def _apply_delta(img, delta):
+    """Add an int16 delta map to an RGB image in place, clipping once."""
+    px = np.asarray(img, dtype=np.int16) + delta
+    np.clip(px, 0, 255, out=px)
+    img.paste(Image.fromarray(px.astype(np.uint8), "RGB"))
     return img
+
+
+def add_paper_wear(img, creases=(), edge_wear=0, stains=0, seed=None):
+    """
+    Apply several wear effects to a document in one pass (in place).
+
+    Args:
+        img: PIL Image (RGB), modified in place and returned
+        creases: Iterable of (position, horizontal) fold lines. position is
+                 the row of a horizontal crease or the column of a vertical
+                 one; None folds through the middle.
+        edge_wear: 0=crisp, 1=handled, 2=heavily worn edges
+        stains: Number of faint ring stains
+        seed: Int seed, numpy Generator or RenderRNG for reproducible wear
+
+    Returns:
+        The same image.
+    """
+    rng = _numpy_rng(seed, "wear")
+    w, h = img.size
+    delta = np.zeros((h, w, 3), dtype=np.int16)
+    for pos, horizontal in creases:
+        _crease_delta(delta, pos, horizontal, rng)
+    if edge_wear > 0:
+        _edge_wear_delta(delta, edge_wear, rng)
+    if stains > 0:
+        _stain_delta(delta, stains, rng)
+    return _apply_delta(img, delta)
+
+
+def add_fold_crease(img, y_pos=None, horizontal=True, seed=None):
+    """
+    Add a subtle fold crease line across the image (in place).
+
+    Args:
+        img: PIL Image (RGB), modified in place and returned
+        y_pos: Row of a horizontal crease, or column of a vertical one
+               (default: middle of the page)
+        horizontal: False for a vertical crease
+        seed: Int seed, numpy Generator or RenderRNG for the crease wobble
+    """
+    return add_paper_wear(img, creases=[(y_pos, horizontal)], seed=seed)
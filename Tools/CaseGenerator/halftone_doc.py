@@ -22,28 +22,66 @@ Usage:
 """
 
 import argparse
-from pathlib import Path
 
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 
 from halftone_common import (
-    PALETTE, OUTPUT_DIR,
-    load_font, make_paper_texture,
-    draw_bureau_header, draw_stamp_circle, draw_footer, draw_pattern_emblem,
-    apply_halftone_blend, add_grain_overlay,
+    PALETTE, OUTPUT_DIR, BUREAU_HEADER_HEIGHT,
+    RenderRNG, load_font, make_paper_texture, seed_arg,
+    chrome, apply_chrome, stamp_seal,
+    InkScreen, apply_halftone_screens, add_grain_overlay,
 )
+from text_layout import text_bbox
+
+OUTPUT_NAME = "ev_access_log_halftone.png"
 
 # Document dimensions (source resolution)
 DOC_W = 800
 DOC_H = 1120
+HEADER_Y = 40
+
+
+def draw_classification_strip(draw, img, w, h, text="BUREAU USE ONLY"):
+    """Brown "BUREAU USE ONLY" tab across the top border."""
+    strip_font = load_font("sans_bold", 11)
+    bbox = text_bbox(strip_font, text)
+    tw = bbox[2] - bbox[0]
+    strip_w = tw + 20
+    strip_x = (w - strip_w) // 2
+    draw.rectangle([strip_x, 8, strip_x + strip_w, 28], fill=PALETTE["bureau_brown"])
+    draw.text((strip_x + 10, 10), text, fill=PALETTE["paper"], font=strip_font)
+
+
+# Static layers shared by every access log — drawn once, then pasted
+ACCESS_LOG_CHROME = (
+    chrome("border", inset=15, color=PALETTE["bureau_brown"], width=2),
+    chrome(draw_classification_strip),
+    chrome("bureau_header", y=HEADER_Y, font_size=20),
+    chrome("pattern_emblem", cx=DOC_W // 2, cy=HEADER_Y + BUREAU_HEADER_HEIGHT + 25,
+           radius=18, color=PALETTE["bureau_brown"]),
+)
+
+# Drawn over the finished body, as the last layer before the halftone
+ACCESS_LOG_FOOTER = (
+    chrome("footer", color=PALETTE["ink_light"]),
+)
+
 
+def generate_access_log(dot_spacing=12, skip_halftone=False, seed=None):
+    """
+    Generate the Bureau Depot Access Log document.
 
-def generate_access_log(dot_spacing=12, skip_halftone=False):
-    """Generate the Bureau Depot Access Log document."""
+    Args:
+        dot_spacing: Halftone dot spacing
+        skip_halftone: Skip the halftone passes (for debugging)
+        seed: Int seed (or RenderRNG) for reproducible paper, dot
+              variation and grain. Default: different every render
+    """
+    rng = seed if isinstance(seed, RenderRNG) else RenderRNG(seed)
 
     # --- Background: aged paper with grain ---
     img = make_paper_texture(DOC_W, DOC_H, PALETTE["paper"], grain_amount=8,
-                              fiber_density=1)
+                              fiber_density=1, seed=rng)
     draw = ImageDraw.Draw(img)
 
     ink = PALETTE["ink"]
@@ -52,31 +90,14 @@ def generate_access_log(dot_spacing=12, skip_halftone=False):
     brown = PALETTE["bureau_brown"]
     stamp = PALETTE["stamp_dark"]
 
-    # --- Outer border (single line, Bureau standard) ---
-    draw.rectangle([15, 15, DOC_W - 16, DOC_H - 16], outline=brown, width=2)
-
-    # --- Classification strip ---
-    strip_text = "BUREAU USE ONLY"
-    strip_font = load_font("sans_bold", 11)
-    bbox = strip_font.getbbox(strip_text)
-    tw = bbox[2] - bbox[0]
-    strip_w = tw + 20
-    strip_x = (DOC_W - strip_w) // 2
-    draw.rectangle([strip_x, 8, strip_x + strip_w, 28], fill=brown)
-    draw.text((strip_x + 10, 10), strip_text, fill=PALETTE["paper"],
-              font=strip_font)
-
-    # --- Bureau header ---
-    y = draw_bureau_header(draw, img, DOC_W, 40, font_size=20)
-
-    # --- Pattern emblem ---
-    draw_pattern_emblem(draw, DOC_W // 2, y + 25, 18, brown)
-    y += 55
+    # --- Border, classification strip, header, emblem ---
+    apply_chrome(img, ACCESS_LOG_CHROME)
+    y = HEADER_Y + BUREAU_HEADER_HEIGHT + 55
 
     # --- State name ---
     state_font = load_font("serif", 14)
     for line in ["REPUBLIC OF DRAZHOVIA", "SECURITY DIVISION"]:
-        bbox = state_font.getbbox(line)
+        bbox = text_bbox(state_font, line)
         tw = bbox[2] - bbox[0]
         draw.text(((DOC_W - tw) // 2, y), line, fill=ink_mid, font=state_font)
         y += 20
@@ -89,7 +110,7 @@ def generate_access_log(dot_spacing=12, skip_halftone=False):
     # --- Document title ---
     title_font = load_font("serif_bold", 28)
     title = "NIGHTLY ACCESS LOG"
-    bbox = title_font.getbbox(title)
+    bbox = text_bbox(title_font, title)
     tw = bbox[2] - bbox[0]
     draw.text(((DOC_W - tw) // 2, y), title, fill=ink, font=title_font)
     y += 40
@@ -215,8 +236,8 @@ def generate_access_log(dot_spacing=12, skip_halftone=False):
         y += 16
 
     # --- Bureau stamp (lower right, slightly misaligned) ---
-    draw_stamp_circle(
-        draw,
+    stamp_seal(
+        img,
         cx=DOC_W - 140, cy=y + 10,
         radius=55,
         text_top="SECTOR 3",
@@ -226,19 +247,19 @@ def generate_access_log(dot_spacing=12, skip_halftone=False):
     )
 
     # --- Footer ---
-    draw_footer(draw, img, DOC_W, DOC_H, color=ink_light)
+    apply_chrome(img, ACCESS_LOG_FOOTER)
 
     # --- Apply halftone overlay ---
     if not skip_halftone:
-        img = apply_halftone(img, dot_spacing=dot_spacing,
-                              dot_color=ink, bg_color=PALETTE["paper"])
-        # Second pass: brown tint at offset angle
-        from halftone_common import apply_halftone_tint
-        img = apply_halftone_tint(img, dot_spacing=dot_spacing + 4,
-                                   tint_color=brown, intensity=0.15, angle=15)
+        img = apply_halftone_screens(img, [
+            InkScreen(ink, dot_spacing),
+            # Second screen: brown tint at offset angle
+            InkScreen(brown, dot_spacing + 4, angle=15, intensity=0.15,
+                      tone=False),
+        ], bg_color=PALETTE["paper"], seed=rng)
 
     # --- Final grain ---
-    img = add_grain_overlay(img, amount=6)
+    img = add_grain_overlay(img, amount=6, seed=rng)
 
     return img
 
@@ -252,6 +273,8 @@ def main():
                         help="Halftone dot spacing (default: 12, lower=finer)")
     parser.add_argument("--no-halftone", action="store_true",
                         help="Skip halftone overlay (for debugging)")
+    parser.add_argument("--seed", type=seed_arg, default=None,
+                        help="Random seed for a reproducible render")
     args = parser.parse_args()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -259,9 +282,10 @@ def main():
     img = generate_access_log(
         dot_spacing=args.dot_spacing,
         skip_halftone=args.no_halftone,
+        seed=args.seed,
     )
 
-    out_path = args.output or str(OUTPUT_DIR / "ev_access_log_halftone.png")
+    out_path = args.output or str(OUTPUT_DIR / OUTPUT_NAME)
     img.save(out_path)
     print(f"Generated: {out_path}  ({img.width}x{img.height})")
 
@@ -12,58 +12,195 @@ Generates a Drazhovia Worker Identification Card with:
 - "THE PATTERN PROVIDES" footer micro-text
 - Worn paper texture, slightly yellowed
 
+Batch mode renders one card per CitizenID of citizens_database.csv.
+
 Usage:
     python halftone_id_card.py
     python halftone_id_card.py --no-halftone
     python halftone_id_card.py -o id_card.png
+    python halftone_id_card.py --screen threshold     # Cached threshold screen
+    python halftone_id_card.py --batch                 # One card per citizen
+    python halftone_id_card.py --batch --jobs 8 -o /tmp/cards
+    python halftone_id_card.py --benchmark 2000        # Cards/min, no files written
 """
 
 import argparse
-import random
+import csv
+import io
+import itertools
+import os
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 
 from PIL import Image, ImageDraw
 
 from halftone_common import (
-    PALETTE, OUTPUT_DIR,
-    load_font, make_yellowed_paper, draw_pattern_emblem,
-    apply_halftone, apply_halftone_tint, add_grain_overlay,
+    PALETTE, OUTPUT_DIR, RenderRNG, seed_arg,
+    load_font, make_yellowed_paper, draw_pattern_emblem, chrome, apply_chrome,
+    apply_halftone, apply_threshold_halftone, apply_halftone_tint, add_grain_overlay,
 )
+from procedural_patches import portrait_photo
+from text_layout import text_bbox
+
+OUTPUT_NAME = "id_card_zelnik_halftone.png"
+
+# Halftone modes: "dots" draws every dot, "threshold" compares the card
+# against a cached threshold screen (flat cost, suited to spacing 5)
+SCREENS = {
+    "dots": apply_halftone,
+    "threshold": apply_threshold_halftone,
+}
 
 CARD_W = 400
 CARD_H = 250
+STRIPE_H = 28
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CITIZENS_CSV = PROJECT_ROOT / "Assets" / "StreamingAssets" / "content" / "citizens_database.csv"
+ID_CARD_DIR = OUTPUT_DIR / "id_cards"
+
+# Batch cards share a few paper stocks instead of one cached texture each
+PAPER_VARIANTS = 8
+
+# Occupation sector -> stripe colour, checked in order; keywords match
+# anywhere in the lower-cased occupation. Unmatched occupations are clerical.
+OCCUPATION_SECTORS = [
+    ("Industrial / Technical", "worker_orange", (
+        "factory", "construction", "warehouse", "water", "repair", "maintenance",
+        "mechanic", "carpenter", "plumber", "electrician", "engineer", "mining",
+        "miner", "guard", "firefighter", "driver", "foreman", "brickyard",
+    )),
+    ("Commerce / Agriculture", "worker_green", (
+        "vendor", "market", "food", "ration", "farm", "agricultur", "cannery",
+        "restaurant", "bartender", "baker", "butcher", "cook", "soap", "bank",
+    )),
+    ("Service / Clerical", "worker_amber", (
+        "postal", "courier", "janitor", "monitor", "clerk", "orderly", "nurse",
+        "domestic", "teacher", "social", "accountant",
+    )),
+]
+DEFAULT_SECTOR = ("Service / Clerical", "worker_amber")
+
+# Miroslav Zelnik — the card generate_id_card draws without a citizen
+DEFAULT_FIELDS = [
+    ("NAME:", "ZELNIK, Miroslav"),
+    ("BLOCK:", "D"),
+    ("OCCUPATION:", "Night Guard"),
+    ("SECTOR:", "Industrial / Technical"),
+    ("BADGE NO.:", "M-1187"),
+    ("RATION CARD:", "RC-44-D-1187"),
+]
+
+
+def occupation_sector(occupation):
+    """
+    Occupation sector of a job title.
+
+    Returns:
+        (sector name, PALETTE key of its stripe colour)
+    """
+    occupation = occupation.lower()
+    for sector, color_key, keywords in OCCUPATION_SECTORS:
+        if any(kw in occupation for kw in keywords):
+            return sector, color_key
+    return DEFAULT_SECTOR
+
+
+def citizen_fields(citizen):
+    """
+    Card contents for one citizens_database.csv row.
+
+    Returns:
+        (fields, stripe PALETTE key, status stamp text)
+    """
+    sector, color_key = occupation_sector(citizen["Occupation"])
+    fields = [
+        ("NAME:", f"{citizen['LastName'].upper()}, {citizen['FirstName']}"),
+        ("BORN:", citizen["DOB"]),
+        ("OCCUPATION:", citizen["Occupation"]),
+        ("SECTOR:", sector),
+        ("ADDRESS:", citizen["Address"]),
+        # Short value last: the status stamp overlaps the end of this line
+        ("CITIZEN ID:", citizen["CitizenID"]),
+    ]
+    deceased = citizen.get("Deceased", "").strip().upper() == "TRUE"
+    return fields, color_key, "DECEASED" if deceased else "ACTIVE"
+
+
+def draw_card_stripe(draw, img, w, h, color):
+    """Occupation colour stripe with the card title and a paper-colour emblem."""
+    draw.rectangle([2, 2, w - 3, STRIPE_H], fill=color)
+
+    header_font = load_font("sans_bold", 11)
+    header = "REPUBLIC OF DRAZHOVIA — WORKER IDENTIFICATION"
+    bbox = text_bbox(header_font, header)
+    tw = bbox[2] - bbox[0]
+    draw.text(((w - tw) // 2, 7), header, fill=PALETTE["paper"], font=header_font)
+
+    # Pattern emblem (small, left of stripe)
+    draw_pattern_emblem(draw, 18, 15, 8, PALETTE["paper"])
+
+
+def draw_card_footer(draw, img, w, h):
+    """Micro-text motto along the bottom edge."""
+    footer_font = load_font("sans", 7)
+    footer = "THE PATTERN PROVIDES"
+    bbox = text_bbox(footer_font, footer)
+    ftw = bbox[2] - bbox[0]
+    draw.text(((w - ftw) // 2, h - 14), footer, fill=PALETTE["ink_light"],
+              font=footer_font)
+
+
+def card_chrome(color_key):
+    """Static layers of a card with the given stripe colour."""
+    return (
+        chrome("border", inset=1, color=PALETTE["ink_mid"], width=2),
+        chrome(draw_card_stripe, color=PALETTE[color_key]),
+    )
+
+
+# Drawn over the finished card body
+CARD_FOOTER = (
+    chrome(draw_card_footer),
+)
 
 
-def generate_id_card(dot_spacing=5, skip_halftone=False):
-    """Generate Miroslav Zelnik's Worker ID card."""
+def generate_id_card(dot_spacing=5, skip_halftone=False, citizen=None, seed=None,
+                     screen="dots"):
+    """
+    Generate a Worker ID card.
+
+    Args:
+        dot_spacing: Halftone dot spacing
+        skip_halftone: Skip the halftone passes (for debugging)
+        citizen: citizens_database.csv row (dict). Default: Miroslav Zelnik
+        seed: Int seed or RenderRNG for paper variant, photo noise, tint
+              and grain (default: different every render)
+        screen: Halftone mode, a SCREENS key
+    """
+    if citizen is None:
+        fields, color_key, status = DEFAULT_FIELDS, "worker_orange", "ACTIVE"
+    else:
+        fields, color_key, status = citizen_fields(citizen)
+    rng = seed if isinstance(seed, RenderRNG) else RenderRNG(seed)
 
     # --- Background: yellowed, worn paper ---
-    img = make_yellowed_paper(CARD_W, CARD_H, amount=1)
+    paper_seed = rng.seed % PAPER_VARIANTS if rng.seeded else rng
+    img = make_yellowed_paper(CARD_W, CARD_H, amount=1, seed=paper_seed)
     draw = ImageDraw.Draw(img)
 
     ink = PALETTE["ink"]
     ink_mid = PALETTE["ink_mid"]
     ink_light = PALETTE["ink_light"]
-    orange = PALETTE["worker_orange"]
+    stripe = PALETTE[color_key]
     stamp = PALETTE["stamp_dark"]
 
-    # --- Card border ---
-    draw.rectangle([1, 1, CARD_W - 2, CARD_H - 2], outline=ink_mid, width=2)
-
-    # --- Occupation color stripe (top) ---
-    stripe_h = 28
-    draw.rectangle([2, 2, CARD_W - 3, stripe_h], fill=orange)
-
-    # Header text on stripe
-    header_font = load_font("sans_bold", 11)
-    header = "REPUBLIC OF DRAZHOVIA — WORKER IDENTIFICATION"
-    bbox = header_font.getbbox(header)
-    tw = bbox[2] - bbox[0]
-    draw.text(((CARD_W - tw) // 2, 7), header, fill=PALETTE["paper"],
-              font=header_font)
-
-    # --- Pattern emblem (small, left of stripe) ---
-    draw_pattern_emblem(draw, 18, 15, 8, PALETTE["paper"])
+    # --- Card border, occupation stripe ---
+    apply_chrome(img, card_chrome(color_key))
+    stripe_h = STRIPE_H
 
     # --- Photo placeholder (left side) ---
     photo_x = 15
@@ -72,23 +209,7 @@ def generate_id_card(dot_spacing=5, skip_halftone=False):
     photo_h = 100
 
     # Gray halftone rectangle simulating a photo
-    for py in range(photo_y, photo_y + photo_h):
-        for px in range(photo_x, photo_x + photo_w):
-            # Coarse halftone pattern — worker quality printing
-            cell = 5
-            gx = (px - photo_x) // cell
-            gy = (py - photo_y) // cell
-            # Simulate a face silhouette (darker center, lighter edges)
-            cx_rel = (px - photo_x - photo_w // 2) / (photo_w // 2)
-            cy_rel = (py - photo_y - photo_h * 0.4) / (photo_h * 0.4)
-            dist = (cx_rel ** 2 + cy_rel ** 2) ** 0.5
-            base_gray = 100 + int(60 * min(dist, 1.0))
-            # Halftone quantization
-            if (gx + gy) % 2 == 0:
-                base_gray += 15
-            noise = random.randint(-10, 10)
-            v = max(60, min(200, base_gray + noise))
-            img.putpixel((px, py), (v, v - 3, v - 6))
+    img.paste(portrait_photo(photo_w, photo_h, seed=rng), (photo_x, photo_y))
 
     draw.rectangle([photo_x, photo_y, photo_x + photo_w, photo_y + photo_h],
                     outline=ink_mid, width=1)
@@ -100,15 +221,6 @@ def generate_id_card(dot_spacing=5, skip_halftone=False):
     label_font = load_font("sans", 10)
     value_font = load_font("sans_bold", 12)
 
-    fields = [
-        ("NAME:", "ZELNIK, Miroslav"),
-        ("BLOCK:", "D"),
-        ("OCCUPATION:", "Night Guard"),
-        ("SECTOR:", "Industrial / Technical"),
-        ("BADGE NO.:", "M-1187"),
-        ("RATION CARD:", "RC-44-D-1187"),
-    ]
-
     for label, value in fields:
         draw.text((fields_x, field_y), label, fill=ink_light, font=label_font)
         field_y += 13
@@ -119,10 +231,9 @@ def generate_id_card(dot_spacing=5, skip_halftone=False):
         draw.line([(fields_x, field_y - 3),
                     (CARD_W - 20, field_y - 3)], fill=ink_light, width=1)
 
-    # --- "ACTIVE" stamp (lower right, slightly rotated feel via misalignment) ---
+    # --- Status stamp (lower right, slightly rotated feel via misalignment) ---
     active_font = load_font("sans_bold", 18)
-    active_text = "ACTIVE"
-    bbox = active_font.getbbox(active_text)
+    bbox = text_bbox(active_font, status)
     atw = bbox[2] - bbox[0]
 
     # Stamp box
@@ -131,53 +242,160 @@ def generate_id_card(dot_spacing=5, skip_halftone=False):
     padding = 6
     draw.rectangle([sx - padding, sy - padding, sx + atw + padding,
                      sy + 22 + padding], outline=stamp, width=2)
-    draw.text((sx + 1, sy), active_text, fill=stamp, font=active_font)
+    draw.text((sx + 1, sy), status, fill=stamp, font=active_font)
 
     # --- Footer micro-text ---
-    footer_font = load_font("sans", 7)
-    footer = "THE PATTERN PROVIDES"
-    bbox = footer_font.getbbox(footer)
-    ftw = bbox[2] - bbox[0]
-    draw.text(((CARD_W - ftw) // 2, CARD_H - 14), footer, fill=ink_light,
-              font=footer_font)
+    apply_chrome(img, CARD_FOOTER)
 
     # --- Halftone overlay (coarse — worker quality) ---
     # For small cards, blend halftone with original to preserve readability.
     # Full replacement works at 800x1120 but destroys text at 400x250.
     if not skip_halftone:
-        halftoned = apply_halftone(img, dot_spacing=dot_spacing,
+        halftoned = SCREENS[screen](img, dot_spacing=dot_spacing,
                                     dot_color=ink,
                                     bg_color=PALETTE["paper"])
         img = Image.blend(img, halftoned, 0.45)  # 45% halftone, 55% original
-        # Orange tint pass
+        # Occupation colour tint pass
         img = apply_halftone_tint(img, dot_spacing=dot_spacing + 3,
-                                   tint_color=orange, intensity=0.10, angle=18)
+                                   tint_color=stripe, intensity=0.10, angle=18,
+                                   seed=rng)
 
     # --- Grain (moderate — cheap printing) ---
-    img = add_grain_overlay(img, amount=10)
+    img = add_grain_overlay(img, amount=10, seed=rng)
 
     return img
 
 
+# =============================================================================
+# BATCH MODE
+# =============================================================================
+
+def iter_citizens(csv_path=CITIZENS_CSV):
+    """Stream citizens_database.csv rows as dicts, one at a time."""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def citizen_seed(citizen):
+    """Stable seed per CitizenID, so re-running a batch reproduces each card."""
+    return zlib.crc32(citizen["CitizenID"].encode())
+
+
+def _render_card_chunk(citizens, out_dir, dot_spacing, skip_halftone, screen):
+    """
+    Pool task: render a chunk of cards.
+
+    out_dir=None encodes each PNG in memory only (for benchmarking).
+    Returns the number of cards rendered.
+    """
+    for citizen in citizens:
+        img = generate_id_card(dot_spacing, skip_halftone, citizen, citizen_seed(citizen),
+                               screen)
+        if out_dir is None:
+            img.save(io.BytesIO(), "PNG")
+        else:
+            img.save(Path(out_dir) / f"{citizen['CitizenID']}.png")
+    return len(citizens)
+
+
+def render_id_cards(citizens, out_dir=ID_CARD_DIR, workers=None, chunk_size=16,
+                    dot_spacing=5, skip_halftone=False, screen="dots"):
+    """
+    Render one card per citizen across a process pool.
+
+    citizens is consumed a few chunks ahead of the workers, so it may be a
+    stream such as iter_citizens().
+
+    Args:
+        citizens: Iterable of citizens_database.csv rows
+        out_dir: Output directory, or None to encode in memory only
+        workers: Process count. Default: one per CPU core
+        chunk_size: Cards per pool task
+        dot_spacing, skip_halftone, screen: As for generate_id_card
+
+    Returns:
+        Number of cards rendered.
+    """
+    if out_dir is not None:
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunks = iter(lambda it=iter(citizens): list(itertools.islice(it, chunk_size)), [])
+
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(_render_card_chunk, chunk, out_dir,
+                                    dot_spacing, skip_halftone, screen))
+            if len(pending) >= workers * 2:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                done += sum(f.result() for f in finished)
+        done += sum(f.result() for f in pending)
+    return done
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate halftone Worker ID card"
     )
-    parser.add_argument("-o", "--output", help="Output file path")
+    parser.add_argument("-o", "--output", help="Output file path (directory with --batch)")
     parser.add_argument("--dot-spacing", type=int, default=5,
                         help="Halftone dot spacing (default: 5, coarse worker quality)")
     parser.add_argument("--no-halftone", action="store_true",
                         help="Skip halftone overlay")
+    parser.add_argument("--screen", choices=sorted(SCREENS), default="dots",
+                        help="Halftone mode (default: dots; threshold is faster)")
+    parser.add_argument("--seed", type=seed_arg, default=None,
+                        help="Random seed for a reproducible render")
+    parser.add_argument("--batch", action="store_true",
+                        help="One card per citizen in the citizens database")
+    parser.add_argument("--csv", default=str(CITIZENS_CSV),
+                        help="Citizens database for --batch/--benchmark")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--benchmark", type=int, metavar="N",
+                        help="Render N cards (cycling the database) in memory "
+                             "and report throughput")
     args = parser.parse_args()
 
+    if args.benchmark:
+        citizens = list(iter_citizens(args.csv))
+        if not citizens:
+            print(f"No citizens in {args.csv}")
+            sys.exit(1)
+        # Distinct IDs so every card gets its own seed
+        rows = ({**c, "CitizenID": f"{c['CitizenID']}-{i}"}
+                for i, c in enumerate(itertools.islice(itertools.cycle(citizens),
+                                                       args.benchmark)))
+        start = time.perf_counter()
+        count = render_id_cards(rows, None, args.jobs, dot_spacing=args.dot_spacing,
+                                skip_halftone=args.no_halftone, screen=args.screen)
+        elapsed = time.perf_counter() - start
+        print(f"Rendered {count} cards in {elapsed:.2f}s with "
+              f"{args.jobs or os.cpu_count()} worker(s): "
+              f"{count / elapsed * 60:.0f} cards/min ({elapsed / count * 1000:.1f} ms/card)")
+        return
+
+    if args.batch:
+        out_dir = args.output or str(ID_CARD_DIR)
+        start = time.perf_counter()
+        count = render_id_cards(iter_citizens(args.csv), out_dir, args.jobs,
+                                dot_spacing=args.dot_spacing,
+                                skip_halftone=args.no_halftone, screen=args.screen)
+        elapsed = time.perf_counter() - start
+        print(f"Generated {count} ID cards in {out_dir}  ({elapsed:.2f}s)")
+        return
+
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     img = generate_id_card(
         dot_spacing=args.dot_spacing,
         skip_halftone=args.no_halftone,
+        screen=args.screen,
+        seed=args.seed,
     )
 
-    out_path = args.output or str(OUTPUT_DIR / "id_card_zelnik_halftone.png")
+    out_path = args.output or str(OUTPUT_DIR / OUTPUT_NAME)
     img.save(out_path)
     print(f"Generated: {out_path}  ({img.width}x{img.height})")
 
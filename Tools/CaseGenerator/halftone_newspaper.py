@@ -17,18 +17,19 @@ Usage:
 """
 
 import argparse
-import random
-import textwrap
-from pathlib import Path
 
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 
 from halftone_common import (
     PALETTE, OUTPUT_DIR,
-    load_font, make_paper_texture,
-    draw_pattern_emblem, apply_halftone, apply_halftone_tint,
+    RenderRNG, load_font, make_paper_texture, seed_arg,
+    draw_pattern_emblem, InkScreen, apply_halftone_screens,
     add_grain_overlay, add_fold_crease,
 )
+from procedural_patches import file_photo
+from text_layout import text_bbox, wrap_text
+
+OUTPUT_NAME = "newspaper_day2_halftone.png"
 
 NEWS_W = 600
 NEWS_H = 800
@@ -56,12 +57,21 @@ BODY_TEXT = (
 )
 
 
-def generate_newspaper(dot_spacing=10, skip_halftone=False):
-    """Generate THE PATTERN TIMES newspaper."""
+def generate_newspaper(dot_spacing=10, skip_halftone=False, seed=None):
+    """
+    Generate THE PATTERN TIMES newspaper.
+
+    Args:
+        dot_spacing: Halftone dot spacing
+        skip_halftone: Skip the halftone passes (for debugging)
+        seed: Int seed or RenderRNG for a reproducible print
+              (default: different every render)
+    """
+    rng = seed if isinstance(seed, RenderRNG) else RenderRNG(seed)
 
     # --- Background: newsprint yellow with grain ---
     img = make_paper_texture(NEWS_W, NEWS_H, PALETTE["newspaper_yellow"],
-                              grain_amount=10, fiber_density=2)
+                              grain_amount=10, fiber_density=2, seed=rng)
     draw = ImageDraw.Draw(img)
 
     ink = PALETTE["ink"]
@@ -78,7 +88,7 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
     date_font = load_font("serif", 10)
     draw.text((20, y), "VOL. XLVII  No. 287", fill=ink_mid, font=date_font)
     date_text = "Day 2 — Republic of Drazhovia — For the Collective"
-    bbox = date_font.getbbox(date_text)
+    bbox = text_bbox(date_font, date_text)
     tw = bbox[2] - bbox[0]
     draw.text((NEWS_W - 20 - tw, y), date_text, fill=ink_mid, font=date_font)
     y += 18
@@ -89,7 +99,7 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
 
     mast_font = load_font("serif_bold", 48)
     masthead = "THE PATTERN TIMES"
-    bbox = mast_font.getbbox(masthead)
+    bbox = text_bbox(mast_font, masthead)
     tw = bbox[2] - bbox[0]
     draw.text(((NEWS_W - tw) // 2, y), masthead, fill=ink, font=mast_font)
     y += 56
@@ -107,13 +117,13 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
     # --- Main headline ---
     headline_font = load_font("serif_bold", 32)
     headline = "RATION DEPOT THIEF"
-    bbox = headline_font.getbbox(headline)
+    bbox = text_bbox(headline_font, headline)
     tw = bbox[2] - bbox[0]
     draw.text(((NEWS_W - tw) // 2, y), headline, fill=ink, font=headline_font)
     y += 38
 
     headline2 = "APPREHENDED"
-    bbox = headline_font.getbbox(headline2)
+    bbox = text_bbox(headline_font, headline2)
     tw = bbox[2] - bbox[0]
     draw.text(((NEWS_W - tw) // 2, y), headline2, fill=ink, font=headline_font)
     y += 42
@@ -121,7 +131,7 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
     # --- Subheadline ---
     sub_font = load_font("serif", 14)
     sub = "Bureau Analysis Praised — Security Guard Zelnik Confesses"
-    bbox = sub_font.getbbox(sub)
+    bbox = text_bbox(sub_font, sub)
     tw = bbox[2] - bbox[0]
     draw.text(((NEWS_W - tw) // 2, y), sub, fill=ink_mid, font=sub_font)
     y += 22
@@ -137,16 +147,7 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
     photo_y = y
 
     # Gray halftone rectangle with dot pattern
-    for py in range(photo_y, photo_y + photo_h):
-        for px in range(photo_x, photo_x + photo_w):
-            # Simulate a coarse halftone photo — checkerboard with noise
-            cell = 6
-            gx = (px - photo_x) // cell
-            gy = (py - photo_y) // cell
-            base_gray = 120 + int(40 * ((gx + gy) % 3 == 0))
-            noise = random.randint(-20, 20)
-            v = max(60, min(200, base_gray + noise))
-            img.putpixel((px, py), (v, v - 5, v - 10))
+    img.paste(file_photo(photo_w, photo_h, seed=rng), (photo_x, photo_y))
 
     # Photo border
     draw.rectangle([photo_x, photo_y, photo_x + photo_w, photo_y + photo_h],
@@ -168,10 +169,7 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
     col1_y = photo_y
 
     # Wrap text for narrow column next to photo
-    chars_per_line_narrow = col1_w // 6  # approximate
-    chars_per_line_wide = (NEWS_W - 55) // 2 // 6
-
-    wrapped = textwrap.wrap(BODY_TEXT, width=chars_per_line_narrow)
+    wrapped = wrap_text(BODY_TEXT, body_font, col1_w)
 
     # Draw lines next to photo
     ty = col1_y
@@ -187,7 +185,7 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
     col_w = (NEWS_W - 40 - col_gap) // 2
 
     remaining = " ".join(wrapped[line_idx:])
-    full_wrapped = textwrap.wrap(remaining, width=chars_per_line_wide)
+    full_wrapped = wrap_text(remaining, body_font, col_w - 5)
 
     # Split roughly in half for two columns
     half = len(full_wrapped) // 2
@@ -224,19 +222,19 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
 
     sidebar_font = load_font("sans_bold", 11)
     sidebar_title = "COUNCIL REMINDS:"
-    bbox = sidebar_font.getbbox(sidebar_title)
+    bbox = text_bbox(sidebar_font, sidebar_title)
     stw = bbox[2] - bbox[0]
     draw.text((sidebar_x + (sidebar_w - stw) // 2, sidebar_y + 8),
               sidebar_title, fill=ink, font=sidebar_font)
 
     motto_font = load_font("serif_bold", 16)
     motto = "SILENCE"
-    bbox = motto_font.getbbox(motto)
+    bbox = text_bbox(motto_font, motto)
     mtw = bbox[2] - bbox[0]
     draw.text((sidebar_x + (sidebar_w - mtw) // 2, sidebar_y + 22),
               motto, fill=ink, font=motto_font)
     motto2 = "IS ORDER"
-    bbox = motto_font.getbbox(motto2)
+    bbox = text_bbox(motto_font, motto2)
     mtw = bbox[2] - bbox[0]
     draw.text((sidebar_x + (sidebar_w - mtw) // 2, sidebar_y + 40),
               motto2, fill=ink, font=motto_font)
@@ -253,18 +251,18 @@ def generate_newspaper(dot_spacing=10, skip_halftone=False):
               fill=ink_mid, font=price_font)
 
     # --- Fold crease across middle ---
-    img = add_fold_crease(img, y_pos=NEWS_H // 2)
+    img = add_fold_crease(img, y_pos=NEWS_H // 2, seed=rng)
 
     # --- Halftone overlay ---
     if not skip_halftone:
-        img = apply_halftone(img, dot_spacing=dot_spacing,
-                              dot_color=ink, bg_color=PALETTE["newspaper_yellow"])
-        img = apply_halftone_tint(img, dot_spacing=dot_spacing + 6,
-                                   tint_color=PALETTE["bureau_brown"],
-                                   intensity=0.08, angle=12)
+        img = apply_halftone_screens(img, [
+            InkScreen(ink, dot_spacing),
+            InkScreen(PALETTE["bureau_brown"], dot_spacing + 6, angle=12,
+                      intensity=0.08, tone=False),
+        ], bg_color=PALETTE["newspaper_yellow"], seed=rng)
 
     # --- Final grain ---
-    img = add_grain_overlay(img, amount=8)
+    img = add_grain_overlay(img, amount=8, seed=rng)
 
     return img
 
@@ -278,6 +276,8 @@ def main():
                         help="Halftone dot spacing (default: 10)")
     parser.add_argument("--no-halftone", action="store_true",
                         help="Skip halftone overlay")
+    parser.add_argument("--seed", type=seed_arg, default=None,
+                        help="Random seed for a reproducible render")
     args = parser.parse_args()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -285,9 +285,10 @@ def main():
     img = generate_newspaper(
         dot_spacing=args.dot_spacing,
         skip_halftone=args.no_halftone,
+        seed=args.seed,
     )
 
-    out_path = args.output or str(OUTPUT_DIR / "newspaper_day2_halftone.png")
+    out_path = args.output or str(OUTPUT_DIR / OUTPUT_NAME)
     img.save(out_path)
     print(f"Generated: {out_path}  ({img.width}x{img.height})")
 
@@ -17,17 +17,17 @@ Usage:
 """
 
 import argparse
-import random
-from pathlib import Path
 
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 
 from halftone_common import (
-    PALETTE, OUTPUT_DIR,
-    load_font, make_paper_texture,
-    draw_bureau_header, draw_pattern_emblem, draw_footer,
+    PALETTE, OUTPUT_DIR, BUREAU_HEADER_HEIGHT,
+    RenderRNG, load_font, make_paper_texture, seed_arg, chrome, apply_chrome,
     apply_halftone, add_grain_overlay,
 )
+from text_layout import text_bbox
+
+OUTPUT_NAME = "letter_overseer_day4.png"
 
 LETTER_W = 600
 LETTER_H = 800
@@ -63,27 +63,49 @@ BODY_LINES = [
     "",
 ]
 
+HEADER_Y = 30
+
+# Letterhead shared by every overseer letter
+LETTER_CHROME = (
+    chrome("bureau_header", y=HEADER_Y, font_size=16),
+    chrome("pattern_emblem", cx=LETTER_W // 2, cy=HEADER_Y + BUREAU_HEADER_HEIGHT + 18,
+           radius=14, color=PALETTE["bureau_brown"]),
+)
+
+# Drawn over the finished body
+LETTER_FOOTER = (
+    chrome("footer", color=PALETTE["ink_light"]),
+)
 
-def generate_overseer_letter(dot_spacing=14, skip_halftone=False):
-    """Generate Terzic's Day 4 commendation letter."""
+
+def generate_overseer_letter(dot_spacing=14, skip_halftone=False, seed=None):
+    """
+    Generate Terzic's Day 4 commendation letter.
+
+    Args:
+        dot_spacing: Halftone dot spacing
+        skip_halftone: Skip the halftone pass (for debugging)
+        seed: Int seed or RenderRNG for reproducible paper, typewriter
+              jitter and grain (default: different every render)
+    """
+    rng = seed if isinstance(seed, RenderRNG) else RenderRNG(seed)
 
     # --- Background: high quality paper (smooth, warm) ---
     # Slightly warmer than standard paper — implies quality stock
     quality_paper = (244, 236, 218)
     img = make_paper_texture(LETTER_W, LETTER_H, quality_paper, grain_amount=4,
-                              fiber_density=0)  # smooth — no fibers
+                              fiber_density=0, seed=rng)  # smooth — no fibers
     draw = ImageDraw.Draw(img)
 
     ink = PALETTE["ink"]
     ink_mid = PALETTE["ink_mid"]
     ink_light = PALETTE["ink_light"]
-    brown = PALETTE["bureau_brown"]
 
     # --- Faint watermark: "SILENCE IS ORDER" ---
     # Drawn first so it's behind everything
     watermark_font = load_font("serif_bold", 60)
     watermark_text = "SILENCE IS ORDER"
-    bbox = watermark_font.getbbox(watermark_text)
+    bbox = text_bbox(watermark_font, watermark_text)
     tw = bbox[2] - bbox[0]
     th = bbox[3] - bbox[1]
 
@@ -97,16 +119,13 @@ def generate_overseer_letter(dot_spacing=14, skip_halftone=False):
               watermark_text, fill=watermark_color, font=watermark_font)
 
     # --- Bureau letterhead ---
-    y = draw_bureau_header(draw, img, LETTER_W, 30, font_size=16)
-
-    # Pattern emblem in header
-    draw_pattern_emblem(draw, LETTER_W // 2, y + 18, 14, brown)
-    y += 40
+    apply_chrome(img, LETTER_CHROME)
+    y = HEADER_Y + BUREAU_HEADER_HEIGHT + 40
 
     # Sub-header
     sub_font = load_font("serif", 10)
     sub_text = "OFFICE OF THE OVERSEER  —  INTERNAL CORRESPONDENCE"
-    bbox = sub_font.getbbox(sub_text)
+    bbox = text_bbox(sub_font, sub_text)
     tw = bbox[2] - bbox[0]
     draw.text(((LETTER_W - tw) // 2, y), sub_text, fill=ink_light, font=sub_font)
     y += 20
@@ -117,6 +136,7 @@ def generate_overseer_letter(dot_spacing=14, skip_halftone=False):
     # --- Body text (typewriter monospace) ---
     mono_font = load_font("mono", 14)
     line_h = 22
+    rand = rng.stdlib("typewriter")
 
     for line in BODY_LINES:
         if line == "---":
@@ -128,13 +148,13 @@ def generate_overseer_letter(dot_spacing=14, skip_halftone=False):
 
         # Slight typewriter imperfection — occasional darker/lighter chars
         # simulated by drawing the whole line with slight position jitter
-        x_jitter = random.randint(-1, 1)
+        x_jitter = rand.randint(-1, 1)
 
         # Typewriter ink: not perfectly black, warm dark
         type_color = (
-            ink[0] + random.randint(0, 15),
-            ink[1] + random.randint(0, 15),
-            ink[2] + random.randint(0, 12),
+            ink[0] + rand.randint(0, 15),
+            ink[1] + rand.randint(0, 15),
+            ink[2] + rand.randint(0, 12),
         )
 
         draw.text((50 + x_jitter, y), line, fill=type_color, font=mono_font)
@@ -158,7 +178,7 @@ def generate_overseer_letter(dot_spacing=14, skip_halftone=False):
     draw.text((350, y), "PATTERN COMPLIANCE", fill=ink_mid, font=title_font)
 
     # --- Footer ---
-    draw_footer(draw, img, LETTER_W, LETTER_H, color=ink_light)
+    apply_chrome(img, LETTER_FOOTER)
 
     # --- Halftone overlay (fine — this is high quality printing) ---
     if not skip_halftone:
@@ -166,7 +186,7 @@ def generate_overseer_letter(dot_spacing=14, skip_halftone=False):
                               dot_color=ink, bg_color=quality_paper)
 
     # --- Very light grain (quality paper) ---
-    img = add_grain_overlay(img, amount=3)
+    img = add_grain_overlay(img, amount=3, seed=rng)
 
     return img
 
@@ -180,6 +200,8 @@ def main():
                         help="Halftone dot spacing (default: 14, fine)")
     parser.add_argument("--no-halftone", action="store_true",
                         help="Skip halftone overlay")
+    parser.add_argument("--seed", type=seed_arg, default=None,
+                        help="Random seed for a reproducible render")
     args = parser.parse_args()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -187,9 +209,10 @@ def main():
     img = generate_overseer_letter(
         dot_spacing=args.dot_spacing,
         skip_halftone=args.no_halftone,
+        seed=args.seed,
     )
 
-    out_path = args.output or str(OUTPUT_DIR / "letter_overseer_day4.png")
+    out_path = args.output or str(OUTPUT_DIR / OUTPUT_NAME)
     img.save(out_path)
     print(f"Generated: {out_path}  ({img.width}x{img.height})")
 
@@ -5,16 +5,24 @@ Pixel Art Document Generator — Papers Please style.
 Draws evidence documents at low native resolution (~120x168)
 using a custom bitmap pixel font, then upscales with nearest-neighbor.
 
+Pages are drawn on a palette-indexed canvas; one render serves every scale.
+Documents are layouts run by render_layout (see pixel_evidence.py).
+
 Usage:
     python pixel_doc.py                  # Generate sample access log
     python pixel_doc.py --scale 5        # 5x upscale (default 4x)
+    python pixel_doc.py --scales 1 2 4 5 # Every shipped scale from one render
 """
 
 import argparse
+import textwrap
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw
 
 OUTPUT_DIR = Path(__file__).parent / "output"
+OUTPUT_NAME = "ev_access_log_pixel.png"
 
 # ==============================================================================
 # COLOR PALETTE — Papers Please inspired, limited to ~8 colors
@@ -34,6 +42,33 @@ PALETTE = {
     "white":       (216, 208, 196),   # highlight / white-ish
 }
 
+# Indexed canvas: palette entry i is the i-th PALETTE colour. Drawing with a
+# PALETTE RGB tuple on the canvas resolves to that entry.
+PALETTE_INDEX = {name: i for i, name in enumerate(PALETTE)}
+_PALETTE_DATA = [c for rgb in PALETTE.values() for c in rgb]
+
+# UI scales the game ships
+SHIPPED_SCALES = (1, 2, 4, 5)
+
+
+def new_canvas(w, h, background="bg"):
+    """Native-resolution palette-mode ("P") canvas filled with a PALETTE colour."""
+    img = Image.new("P", (w, h), PALETTE_INDEX[background])
+    img.putpalette(_PALETTE_DATA)
+    return img
+
+
+def upscale(native, scale):
+    """Nearest-neighbour integer upscale; keeps the canvas indexed."""
+    if scale == 1:
+        return native
+    return native.resize((native.width * scale, native.height * scale), Image.NEAREST)
+
+
+def render_scales(native, scales=SHIPPED_SCALES):
+    """Every requested scale of one native render, as {scale: image}."""
+    return {scale: upscale(native, scale) for scale in scales}
+
 # ==============================================================================
 # PIXEL FONT — 4x6 bitmap font (uppercase, digits, punctuation)
 # Each char is a list of 6 rows, each row is 4 bits wide (0/1)
@@ -476,23 +511,38 @@ CHAR_W = 5
 CHAR_H = 6
 
 
+# ==============================================================================
+# GLYPH MASKS — the bitmap font compiled once into 1-bit images
+# ==============================================================================
+
+def bitmap_mask(rows):
+    """1-bit mask image from a list of 0/1 rows."""
+    mask = Image.new("1", (len(rows[0]), len(rows)))
+    mask.putdata([pixel for row in rows for pixel in row])
+    return mask
+
+
+GLYPH_MASKS = {ch: bitmap_mask(glyph) for ch, glyph in FONT_4x6.items()}
+
+
+@lru_cache(maxsize=1024)
+def text_mask(text):
+    """Cached 1-bit mask of a whole text run (CHAR_W per character)."""
+    mask = Image.new("1", (max(len(text), 1) * CHAR_W, CHAR_H))
+    for i, ch in enumerate(text):
+        glyph = GLYPH_MASKS.get(ch)
+        if glyph is not None:  # unknown chars leave a blank cell
+            mask.paste(glyph, (i * CHAR_W, 0))
+    return mask
+
+
 def draw_text(img, x, y, text, color, draw=None):
     """Draw pixel text at (x, y) using the 4x6 bitmap font."""
     if draw is None:
         draw = ImageDraw.Draw(img)
-
-    cx = x
-    for ch in text:
-        glyph = FONT_4x6.get(ch)
-        if glyph is None:
-            cx += CHAR_W  # skip unknown chars
-            continue
-        for row_i, row in enumerate(glyph):
-            for col_i, pixel in enumerate(row):
-                if pixel:
-                    draw.point((cx + col_i, y + row_i), fill=color)
-        cx += CHAR_W
-    return cx  # return end x position
+    if text:
+        draw.bitmap((x, y), text_mask(text), fill=color)
+    return x + len(text) * CHAR_W  # return end x position
 
 
 def text_width(text):
@@ -532,29 +582,70 @@ def draw_filled_rect(draw, x, y, w, h, color):
 # STAMP — pixel art rubber stamp (dithered circle with text)
 # ==============================================================================
 
-def draw_stamp(img, cx, cy, radius, draw=None):
-    """Draw a pixelated circular rubber stamp."""
-    if draw is None:
-        draw = ImageDraw.Draw(img)
-    color = PALETTE["stamp_red"]
+# The rings and text of a stamp are one cached 1-bit mask per (radius, text,
+# dither), so stamping is a single masked fill with no per-pixel distance test.
+
+STAMP_TEXT = ("SECTOR 3", "VERIFIED")
+
+# Dither moduli of the (outer, inner) rings: a pixel is inked when
+# (dx + dy) % n == 0 — 2 is a checkerboard, 3 every third diagonal
+STAMP_DITHER = (2, 3)
+
+
+@lru_cache(maxsize=64)
+def stamp_mask(radius, lines=STAMP_TEXT, dither=STAMP_DITHER):
+    """
+    Cached 1-bit mask of a pixel stamp.
+
+    Args:
+        radius: Outer ring radius
+        lines: Text lines, centred on the stamp CHAR_H apart
+        dither: (outer, inner) ring dither moduli
 
-    # Draw dithered circle
+    Returns:
+        (mask, (dx, dy)) — the mask's top-left corner relative to the centre.
+    """
+    outer, inner = dither
+    ink = set()
     for dy in range(-radius, radius + 1):
         for dx in range(-radius, radius + 1):
             dist = (dx * dx + dy * dy) ** 0.5
-            # Ring at the edge (outline)
+            # Ring at the edge (outline), faded by the dither
             if abs(dist - radius) < 1.2:
-                # Dither: checkerboard pattern for faded look
-                if (dx + dy) % 2 == 0:
-                    draw.point((cx + dx, cy + dy), fill=color)
+                if (dx + dy) % outer == 0:
+                    ink.add((dx, dy))
             # Inner ring
             elif abs(dist - (radius - 3)) < 0.8:
-                if (dx + dy) % 3 == 0:
-                    draw.point((cx + dx, cy + dy), fill=color)
-
-    # Stamp text (tiny, use direct pixel placement)
-    draw_text_centered(img, cy - 4, "SECTOR 3", color, cx * 2, draw)
-    draw_text_centered(img, cy + 2, "VERIFIED", color, cx * 2, draw)
+                if (dx + dy) % inner == 0:
+                    ink.add((dx, dy))
+
+    # Text rows sit at cy - 4 / cy + 2 for two lines, as on the printed stamp
+    top = 2 - 3 * len(lines)
+    runs = [((-text_width(t)) // 2, top + i * CHAR_H, t) for i, t in enumerate(lines)]
+    x0 = min([-radius] + [x for x, _, _ in runs])
+    y0 = min(-radius, top)
+    x1 = max([radius] + [x + text_width(t) - 1 for x, _, t in runs])
+    y1 = max(radius, top + len(lines) * CHAR_H - 1)
+
+    mask = Image.new("1", (x1 - x0 + 1, y1 - y0 + 1))
+    for dx, dy in ink:
+        mask.putpixel((dx - x0, dy - y0), 1)
+    for x, y, text in runs:
+        if text:
+            glyphs = text_mask(text)
+            mask.paste(1, (x - x0, y - y0), glyphs)
+    return mask, (x0, y0)
+
+
+def draw_stamp(img, cx, cy, radius, draw=None, lines=STAMP_TEXT, color=None,
+               dither=STAMP_DITHER):
+    """Draw a pixelated circular rubber stamp (dithered rings with text)."""
+    if draw is None:
+        draw = ImageDraw.Draw(img)
+    if color is None:
+        color = PALETTE["stamp_red"]
+    mask, (dx, dy) = stamp_mask(radius, tuple(lines), tuple(dither))
+    draw.bitmap((cx + dx, cy + dy), mask, fill=color)
 
 
 # ==============================================================================
@@ -570,172 +661,347 @@ EMBLEM_7x7 = [
     [0,1,0,0,0,1,0],
     [0,0,1,1,1,0,0],
 ]
+EMBLEM_MASK = bitmap_mask(EMBLEM_7x7)
 
 def draw_emblem(draw, x, y, color):
     """Draw the Pattern emblem (circle with P)."""
-    for row_i, row in enumerate(EMBLEM_7x7):
-        for col_i, pixel in enumerate(row):
-            if pixel:
-                draw.point((x + col_i, y + row_i), fill=color)
+    draw.bitmap((x, y), EMBLEM_MASK, fill=color)
 
 
 # ==============================================================================
-# DOCUMENT: Depot Access Log
+# LAYOUT ENGINE — pixel documents as data
 # ==============================================================================
+# Elements are drawn top to bottom from the cursor row, or from their own y
+# (negative: from the bottom edge). Text parameters are str.format
+# templates over the document's fields; colours are PALETTE names.
+
 
-def generate_access_log(scale=4):
-    """Generate the Depot Access Log as pixel art."""
+class _Fields(dict):
+    """Template fields; a field the document lacks renders empty."""
+
+    def __missing__(self, key):
+        return ""
+
+
+@dataclass
+class LayoutPage:
+    """Drawing state of one document while its layout runs."""
+    img: Image.Image
+    draw: ImageDraw.ImageDraw
+    fields: dict
+
+    @property
+    def w(self):
+        return self.img.width
+
+    @property
+    def h(self):
+        return self.img.height
+
+    def fill(self, template):
+        """A text template with the document's fields filled in."""
+        return template.format_map(self.fields)
+
+    def row(self, y):
+        """Absolute row of y (negative: from the bottom edge)."""
+        return y if y >= 0 else self.h + y
+
+
+def wrap_chars(text, width):
+    """Split text into lines of at most width characters, and at each newline."""
+    lines = []
+    for line in text.split("\n"):
+        # Short lines keep their spacing ("S=SCHED  G=GUARD")
+        lines.extend([line] if len(line) <= width else textwrap.wrap(line, width))
+    return lines
+
+
+def _ellipsize(line, width):
+    """line cut at a word break to end in "..." within width characters."""
+    line = line.rstrip(" ,;:.")
+    while len(line) + 3 > width and " " in line:
+        line = line.rsplit(" ", 1)[0].rstrip(" ,;:.")
+    return line[:max(width - 3, 0)] + "..."
+
+
+def _draw_lines(page, y, lines, x, align, color, leading, bottom, width):
+    """
+    Draw text lines from row y down to the bottom row.
+
+    Lines that do not fit are dropped and the last drawn line ends in "..."
+    (width: characters per line).
+    """
+    limit = page.row(bottom) if bottom is not None else page.h
+    fit = max(0, (limit - CHAR_H - y) // leading + 1) if y + CHAR_H <= limit else 0
+    if len(lines) > fit:
+        lines = lines[:fit]
+        if lines:
+            lines[-1] = _ellipsize(lines[-1], width)
+    color = PALETTE[color]
+    for line in lines:
+        if align == "center":
+            draw_text_centered(page.img, y, line, color, page.w, page.draw)
+        else:
+            draw_text(page.img, x, y, line, color, page.draw)
+        y += leading
+    return y
+
+
+def _el_border(page, y, color="border"):
+    draw_rect_outline(page.draw, 0, 0, page.w, page.h, PALETTE[color])
+    return y
+
+
+def _el_strip(page, y, text, color="red", fill="bg_dark", outline="border"):
+    """Classification tab centred on row y."""
+    text = page.fill(text)
+    strip_w = text_width(text) + 6
+    strip_x = (page.w - strip_w) // 2
+    draw_filled_rect(page.draw, strip_x, y, strip_w, 8, PALETTE[fill])
+    draw_rect_outline(page.draw, strip_x, y, strip_w, 8, PALETTE[outline])
+    draw_text(page.img, strip_x + 3, y + 1, text, PALETTE[color], page.draw)
+    return y + 8
+
+
+def _el_rule(page, y, colors=("border",), inset=4):
+    """One horizontal rule per colour, on consecutive rows."""
+    for color in colors:
+        draw_hline(page.draw, inset, page.w - 1 - inset, y, PALETTE[color])
+        y += 1
+    return y
+
+
+def _el_emblem(page, y, color="text"):
+    draw_emblem(page.draw, (page.w - 7) // 2, y, PALETTE[color])
+    return y + 7
+
+
+def _el_lines(page, y, text, align="center", x=6, color="text", leading=7,
+              max_lines=None, bottom=None):
+    """Text wrapped to the page width, centred or from column x."""
+    width = (page.w - 2 * x) // CHAR_W
+    lines = wrap_chars(page.fill(text), width)
+    if max_lines is not None and len(lines) > max_lines:
+        lines = lines[:max_lines]
+        lines[-1] = _ellipsize(lines[-1], width)
+    return _draw_lines(page, y, lines, x, align, color, leading, bottom, width)
+
+
+def _el_list(page, y, key, bullet="-", x=6, color="text", leading=7, gap=3,
+             bottom=None):
+    """Each item of the list field `key` as a bulleted, wrapped paragraph."""
+    indent = text_width(bullet + " ")
+    width = (page.w - 2 * x - indent) // CHAR_W
+    for item in page.fields[key] or ():
+        lines = wrap_chars(item, width)
+        limit = page.row(bottom) if bottom is not None else page.h
+        if not lines or y + CHAR_H > limit:
+            break
+        draw_text(page.img, x, y, bullet, PALETTE[color], page.draw)
+        y = _draw_lines(page, y, lines, x + indent, "left", color, leading, bottom,
+                        width) + gap
+    return y
+
+
+def _el_bar(page, y, text, color="text_light", fill="bg_dark", inset=4, height=8):
+    """Filled bar across the page with a line of text in it."""
+    draw_filled_rect(page.draw, inset, y, page.w - 2 * inset, height, PALETTE[fill])
+    draw_text(page.img, inset + 2, y + 1, page.fill(text), PALETTE[color], page.draw)
+    return y + height
+
+
+def _el_fields(page, y, rows, leading=8, label_color="text_light", value_color="text"):
+    """
+    Label / value pairs, one row of pairs per entry of rows.
+
+    Each pair is (label, value template, label x, value x).
+    """
+    for row in rows:
+        for label, value, label_x, value_x in row:
+            draw_text(page.img, label_x, y, label, PALETTE[label_color], page.draw)
+            draw_text(page.img, value_x, y, page.fill(value), PALETTE[value_color],
+                      page.draw)
+        y += leading
+    return y
+
+
+def _el_table(page, y, columns, rows, inset=4, row_h=10, alert_column=None,
+              marker="?!", empty_rows=0):
+    """
+    Ruled table with a header bar and dotted column dividers.
+
+    Args:
+        columns: (header, x offset) per column
+        rows: Field name of the row list; each row holds one value per
+              column and a final flag that highlights it
+        alert_column: Column printed in red on flagged rows
+        marker: Printed right of the table on flagged rows
+        empty_rows: Ruled blank rows below the entries
+    """
+    draw = page.draw
+    x, w = inset, page.w - 2 * inset
+    text, light = PALETTE["text"], PALETTE["text_light"]
+    red = PALETTE["red"]
+
+    draw_filled_rect(draw, x, y, w, 8, PALETTE["bg_dark"])
+    draw_rect_outline(draw, x, y, w, 8, PALETTE["border"])
+    for header, dx in columns:
+        draw_text(page.img, x + dx, y + 1, header, text, draw)
+
+    entries = page.fields[rows] or ()
+    for i, (*values, flagged) in enumerate(entries):
+        row_y = y + 9 + i * row_h
+        if flagged:
+            draw_filled_rect(draw, x + 1, row_y + 1, w - 2, 8, PALETTE["bg_accent"])
+        draw_hline(draw, x, x + w - 1, row_y, light)
+        for col, (value, (_, dx)) in enumerate(zip(values, columns)):
+            color = red if flagged and col == alert_column else text
+            draw_text(page.img, x + dx, row_y + 2, value, color, draw)
+        if flagged and marker:
+            draw_text(page.img, x + w + 2, row_y + 2, marker, red, draw)
+
+    bottom = y + 9 + len(entries) * row_h
+    draw_hline(draw, x, x + w - 1, bottom, PALETTE["border"])
+    draw_rect_outline(draw, x, y, w, bottom - y, PALETTE["border"])
+    # Dotted dividers left of every column but the first
+    for _, dx in columns[1:]:
+        draw.point([(x + dx - 2, y + dy) for dy in range(0, bottom - y + 1, 2)], fill=light)
+
+    for i in range(empty_rows):
+        draw_hline(draw, x, x + w - 1, bottom + 1 + i * row_h + row_h - 1, light)
+    return bottom + 1 + empty_rows * row_h
+
+
+def _el_stamp(page, y, x, lines=STAMP_TEXT, dy=0, radius=14, color="stamp_red"):
+    """Rubber stamp centred at (x, y + dy); x < 0 counts from the right edge."""
+    cx = x if x >= 0 else page.w + x
+    draw_stamp(page.img, cx, y + dy, radius, page.draw,
+               tuple(page.fill(line) for line in lines), PALETTE[color])
+    return y
+
+
+def _el_footer(page, y, text="THE PATTERN PROVIDES", color="text_light"):
+    draw_hline(page.draw, 4, page.w - 5, y, PALETTE[color])
+    draw_text_centered(page.img, y + 2, page.fill(text), PALETTE[color], page.w, page.draw)
+    return y + 2 + CHAR_H
+
+
+def _el_dog_ear(page, y, size=6, fill="bg_dark", fold="border"):
+    """Folded top-right corner."""
+    w = page.w
+    page.draw.point([(w - 1 - j, i) for i in range(size) for j in range(size - i)],
+                    fill=PALETTE[fill])
+    page.draw.point([(w - size + i, size - 1 - i) for i in range(size)],
+                    fill=PALETTE[fold])
+    return y
+
+
+def _el_space(page, y, rows):
+    return y + rows
+
+
+LAYOUT_ELEMENTS = {
+    "border": _el_border,
+    "strip": _el_strip,
+    "rule": _el_rule,
+    "emblem": _el_emblem,
+    "lines": _el_lines,
+    "list": _el_list,
+    "bar": _el_bar,
+    "fields": _el_fields,
+    "table": _el_table,
+    "stamp": _el_stamp,
+    "footer": _el_footer,
+    "dog_ear": _el_dog_ear,
+    "space": _el_space,
+}
+
+
+def element(kind, **params):
+    """
+    One element of a pixel layout, in hashable form.
+
+    Args:
+        kind: A LAYOUT_ELEMENTS name
+        **params: Arguments for the element, plus an optional y
+
+    Returns:
+        (kind, params) tuple for render_layout.
+    """
+    return kind, tuple(sorted(params.items()))
+
+
+def render_layout(layout, fields, size):
+    """
+    Draw a document from its layout at native resolution.
 
-    # Native resolution — small, like Papers Please
-    W, H = 160, 200
-
-    img = Image.new("RGB", (W, H), PALETTE["bg"])
-    draw = ImageDraw.Draw(img)
-
-    # --- BORDER ---
-    draw_rect_outline(draw, 0, 0, W, H, PALETTE["border"])
-
-    # --- CLASSIFICATION STRIP ---
-    strip_text = "BUREAU USE ONLY"
-    strip_w = text_width(strip_text) + 6
-    strip_x = (W - strip_w) // 2
-    draw_filled_rect(draw, strip_x, 2, strip_w, 8, PALETTE["bg_dark"])
-    draw_rect_outline(draw, strip_x, 2, strip_w, 8, PALETTE["border"])
-    draw_text(img, strip_x + 3, 3, strip_text, PALETTE["red"], draw)
-
-    # --- HEADER BORDER (top) ---
-    draw_hline(draw, 4, W - 5, 13, PALETTE["border"])
-    draw_hline(draw, 4, W - 5, 14, PALETTE["text_light"])
-
-    # --- EMBLEM ---
-    emblem_x = (W - 7) // 2
-    draw_emblem(draw, emblem_x, 17, PALETTE["text"])
-
-    # --- STATE NAME ---
-    draw_text_centered(img, 26, "REPUBLIC OF", PALETTE["text"], W, draw)
-    draw_text_centered(img, 33, "DRAZHOVIA", PALETTE["text"], W, draw)
-
-    # --- HEADER BORDER (bottom) ---
-    draw_hline(draw, 4, W - 5, 41, PALETTE["text_light"])
-    draw_hline(draw, 4, W - 5, 42, PALETTE["border"])
-
-    # --- DOCUMENT TITLE ---
-    draw_text_centered(img, 46, "NIGHTLY ACCESS", PALETTE["text"], W, draw)
-    draw_text_centered(img, 53, "LOG", PALETTE["text"], W, draw)
-
-    # --- SUBTITLE BAR ---
-    draw_filled_rect(draw, 4, 60, W - 8, 8, PALETTE["bg_dark"])
-    draw_text(img, 6, 61, "FORM PA-7  SECURITY DIV.", PALETTE["text_light"], draw)
-
-    # --- FACILITY INFO ---
-    y = 72
-    draw_text(img, 6, y, "FACILITY:", PALETTE["text_light"], draw)
-    draw_text(img, 56, y, "BLOCK C DEPOT", PALETTE["text"], draw)
-
-    y += 8
-    draw_text(img, 6, y, "DATE:", PALETTE["text_light"], draw)
-    draw_text(img, 36, y, "14/03/47", PALETTE["text"], draw)
-
-    draw_text(img, 90, y, "SHIFT:", PALETTE["text_light"], draw)
-    draw_text(img, 120, y, "NIGHT", PALETTE["text"], draw)
-
-    draw_hline(draw, 4, W - 5, y + 8, PALETTE["text_light"])
-
-    # --- TABLE ---
-    table_y = 92
-    table_x = 4
-    table_w = W - 8
-
-    # Table header bar
-    draw_filled_rect(draw, table_x, table_y, table_w, 8, PALETTE["bg_dark"])
-    draw_rect_outline(draw, table_x, table_y, table_w, 8, PALETTE["border"])
-
-    # Column positions — wider spacing
-    col_no = table_x + 2
-    col_name = table_x + 12
-    col_in = table_x + 70
-    col_out = table_x + 100
-    col_auth = table_x + 136
-
-    draw_text(img, col_no, table_y + 1, "N", PALETTE["text"], draw)
-    draw_text(img, col_name, table_y + 1, "NAME", PALETTE["text"], draw)
-    draw_text(img, col_in, table_y + 1, "IN", PALETTE["text"], draw)
-    draw_text(img, col_out, table_y + 1, "OUT", PALETTE["text"], draw)
-    draw_text(img, col_auth, table_y + 1, "A", PALETTE["text"], draw)
-
-    # Table rows
-    rows = [
+    Args:
+        layout: Tuple of element(...) entries, drawn in order
+        fields: Values for the layout's text templates and data fields
+        size: (w, h) of the native canvas
+
+    Returns:
+        PIL Image in mode "P" (see upscale / render_scales).
+    """
+    img = new_canvas(*size)
+    page = LayoutPage(img, ImageDraw.Draw(img), _Fields(fields))
+    y = 0
+    for kind, params in layout:
+        params = dict(params)
+        at = params.pop("y", None)
+        if at is not None:
+            y = page.row(at)
+        y = LAYOUT_ELEMENTS[kind](page, y, **params)
+    return img
+
+
+# ==============================================================================
+# DOCUMENT: Depot Access Log
+# ==============================================================================
+
+ACCESS_LOG_SIZE = (160, 200)
+
+ACCESS_LOG = (
+    element("border"),
+    element("strip", y=2, text="BUREAU USE ONLY"),
+    element("rule", y=13, colors=("border", "text_light")),
+    element("emblem", y=17),
+    element("lines", y=26, text="REPUBLIC OF\nDRAZHOVIA"),
+    element("rule", y=41, colors=("text_light", "border")),
+    element("lines", y=46, text="NIGHTLY ACCESS\nLOG"),
+    element("bar", y=60, text="FORM PA-7  SECURITY DIV."),
+    element("fields", y=72, rows=(
+        (("FACILITY:", "{facility}", 6, 56),),
+        (("DATE:", "{date}", 6, 36), ("SHIFT:", "{shift}", 90, 120)),
+    )),
+    element("rule", colors=("text_light",)),
+    element("table", y=92, rows="entries", alert_column=3, empty_rows=2,
+            columns=(("N", 2), ("NAME", 12), ("IN", 70), ("OUT", 100), ("A", 136))),
+    element("space", rows=3),
+    element("stamp", x=125, dy=6),
+    element("lines", align="left", leading=8, color="text_light",
+            text="S=SCHED  G=GUARD\nM=MAINT  E=EMERG"),
+    element("footer", y=-12),
+    element("dog_ear"),
+)
+
+ACCESS_LOG_FIELDS = {
+    "facility": "BLOCK C DEPOT",
+    "date": "14/03/47",
+    "shift": "NIGHT",
+    "entries": (
         ("1", "BABIC D",   "22:02", "06:05", "S", False),
         ("2", "HORVAT M",  "22:00", "06:01", "S", False),
         ("3", "KOVAC P",   "23:15", "05:48", "S", False),
         ("4", "ZELNIK M",  "02:17", "--:--", "G", True),  # SUSPICIOUS
-    ]
-
-    for i, (no, name, time_in, time_out, auth, suspicious) in enumerate(rows):
-        row_y = table_y + 9 + (i * 10)
-
-        # Highlight suspicious row
-        if suspicious:
-            draw_filled_rect(draw, table_x + 1, row_y + 1, table_w - 2, 8, PALETTE["bg_accent"])
-
-        # Row separator
-        draw_hline(draw, table_x, table_x + table_w - 1, row_y, PALETTE["text_light"])
-
-        text_color = PALETTE["text"]
-        draw_text(img, col_no, row_y + 2, no, text_color, draw)
-        draw_text(img, col_name, row_y + 2, name, text_color, draw)
-        draw_text(img, col_in, row_y + 2, time_in, text_color, draw)
-        draw_text(img, col_out, row_y + 2, time_out,
-                  PALETTE["red"] if suspicious else text_color, draw)
-        draw_text(img, col_auth, row_y + 2, auth, text_color, draw)
-
-        # Red exclamation on suspicious row
-        if suspicious:
-            draw_text(img, table_x + table_w + 2, row_y + 2, "?!", PALETTE["red"], draw)
-
-    # Table bottom border
-    table_bottom = table_y + 9 + len(rows) * 10
-    draw_hline(draw, table_x, table_x + table_w - 1, table_bottom, PALETTE["border"])
-    draw_rect_outline(draw, table_x, table_y, table_w, table_bottom - table_y, PALETTE["border"])
-
-    # Vertical divider lines (drawn after rows so we know height)
-    for vx in [col_name - 2, col_in - 2, col_out - 2, col_auth - 2]:
-        for vy_off in range(table_bottom - table_y + 1):
-            if vy_off % 2 == 0:
-                draw.point((vx, table_y + vy_off), fill=PALETTE["text_light"])
-
-    # --- EMPTY ROWS (show the form has more space) ---
-    for i in range(2):
-        empty_y = table_bottom + 1 + (i * 10)
-        draw_hline(draw, table_x, table_x + table_w - 1, empty_y + 9, PALETTE["text_light"])
-
-    # --- AUTH LEGEND ---
-    legend_y = table_bottom + 24
-    draw_text(img, 6, legend_y, "S=SCHED  G=GUARD", PALETTE["text_light"], draw)
-    draw_text(img, 6, legend_y + 8, "M=MAINT  E=EMERG", PALETTE["text_light"], draw)
-
-    # --- STAMP (dithered, lower right) ---
-    draw_stamp(img, 125, legend_y + 6, 14, draw)
-
-    # --- FOOTER ---
-    footer_y = H - 12
-    draw_hline(draw, 4, W - 5, footer_y, PALETTE["text_light"])
-    draw_text_centered(img, footer_y + 2, "THE PATTERN PROVIDES", PALETTE["text_light"], W, draw)
-
-    # --- DOG EAR (top-right corner) ---
-    for i in range(6):
-        for j in range(6 - i):
-            px = W - 1 - j
-            py = i
-            draw.point((px, py), fill=PALETTE["bg_dark"])
-    # Fold line
-    for i in range(6):
-        draw.point((W - 6 + i, 5 - i), fill=PALETTE["border"])
-
-    # --- Upscale with nearest-neighbor ---
-    final = img.resize((W * scale, H * scale), Image.NEAREST)
-
-    return final, img
+    ),
+}
+
+
+def generate_access_log(scale=4):
+    """Generate the Depot Access Log as pixel art."""
+    img = render_layout(ACCESS_LOG, ACCESS_LOG_FIELDS, ACCESS_LOG_SIZE)
+    return upscale(img, scale), img
 
 
 def main():
@@ -743,13 +1009,25 @@ def main():
     parser.add_argument("--scale", type=int, default=4, help="Upscale factor (default 4)")
     parser.add_argument("--output", "-o", help="Output path")
     parser.add_argument("--native", action="store_true", help="Also save 1x native resolution")
+    parser.add_argument("--scales", type=int, nargs="+",
+                        help=f"Write each scale from one render, as <name>_<N>x.png "
+                             f"(e.g. {' '.join(map(str, SHIPPED_SCALES))})")
     args = parser.parse_args()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+    if args.scales:
+        _, native = generate_access_log(scale=1)
+        stem = Path(args.output or OUTPUT_DIR / OUTPUT_NAME).with_suffix("")
+        for scale, img in render_scales(native, args.scales).items():
+            path = f"{stem}_{scale}x.png"
+            img.save(path, optimize=True)
+            print(f"Generated: {path}  ({img.width}x{img.height}, {scale}x)")
+        return
+
     final, native = generate_access_log(scale=args.scale)
 
-    out_path = args.output or str(OUTPUT_DIR / "ev_access_log_pixel.png")
+    out_path = args.output or str(OUTPUT_DIR / OUTPUT_NAME)
     final.save(out_path)
     print(f"Generated: {out_path}  ({final.width}x{final.height}, {args.scale}x upscale)")
 
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Pixel-art evidence renderer — the pixel_doc style for every case.
+
+Reads the case JSONs like evidence_renderer.py and fills a pixel_doc
+layout from each evidence entry whose type has a PIXEL_LAYOUTS entry.
+
+Usage:
+    python pixel_evidence.py                          # All cases, 4x
+    python pixel_evidence.py ../../Assets/.../core_03_curfew_runner.json
+    python pixel_evidence.py --scales 1 2 4 5 -j 4
+    python pixel_evidence.py -o /tmp/evidence_pixel
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from evidence_renderer import CASES_DIR, load_pages, plain_note
+from pixel_doc import OUTPUT_DIR, SHIPPED_SCALES, element, render_layout, render_scales
+
+PIXEL_OUTPUT_DIR = OUTPUT_DIR / "evidence_pixel"
+
+# Typography the 4x6 font has no glyphs for
+_ASCII = str.maketrans({"\u2014": "-", "\u2013": "-", "\u2018": "'", "\u2019": "'",
+                        "\u201c": '"', "\u201d": '"', "\u2026": "..."})
+
+
+# =============================================================================
+# LAYOUTS
+# =============================================================================
+# Case file form: the access log's header, then the evidence's hotspot notes
+# (the clues the player tags) and, on the first page, its description.
+
+EVIDENCE_FORM = (
+    element("border"),
+    element("strip", y=2, text="BUREAU USE ONLY"),
+    element("rule", y=13, colors=("border", "text_light")),
+    element("emblem", y=17),
+    element("lines", y=26, text="REPUBLIC OF\nDRAZHOVIA"),
+    element("rule", y=41, colors=("text_light", "border")),
+    element("lines", y=46, text="{title}", max_lines=2),
+    element("bar", y=60, text="{evidence_id}"),
+    element("fields", y=72, rows=(
+        (("CASE:", "{case_id}", 6, 36), ("PAGE:", "{page_of}", 100, 130)),
+    )),
+    element("rule", colors=("text_light",)),
+    element("space", rows=4),
+    element("list", key="notes", bottom=-70),
+    element("space", rows=2),
+    element("lines", align="left", color="text_light", text="{description}",
+            bottom=-52),
+    element("stamp", y=-34, x=-36, lines=("SECTOR 3", "FILED")),
+    element("footer", y=-12),
+    element("dog_ear"),
+)
+
+# Evidence type -> (layout, native size)
+PIXEL_LAYOUTS = {
+    "Document": (EVIDENCE_FORM, (160, 240)),
+}
+
+
+def evidence_fields(page):
+    """Layout fields of one EvidencePage."""
+    ev = page.evidence
+    return {
+        "title": ev["title"],
+        "evidence_id": ev["id"],
+        "case_id": page.case_id,
+        "page_of": f"{page.page + 1}/{page.pages}",
+        "notes": [plain_note(h["noteText"]).translate(_ASCII)
+                  for h in ev.get("hotspots") or []
+                  if h.get("pageIndex", 0) == page.page],
+        "description": ev["description"].translate(_ASCII) if page.page == 0 else "",
+    }
+
+
+def render_page(page):
+    """
+    Render one evidence page at native resolution.
+
+    Returns:
+        PIL Image in mode "P".
+    """
+    layout, size = PIXEL_LAYOUTS[page.evidence.get("type", "Document")]
+    return render_layout(layout, evidence_fields(page), size)
+
+
+# =============================================================================
+# BATCH
+# =============================================================================
+
+def _render_to_files(page, out_dir, scales):
+    """Render a page once and write each scale; returns the written paths."""
+    base = Path(out_dir) / page.case_dir / page.file_name
+    base.parent.mkdir(parents=True, exist_ok=True)
+    native = render_page(page)
+    if len(scales) == 1:
+        targets = {scales[0]: base}
+    else:
+        targets = {s: base.with_name(f"{base.stem}_{s}x.png") for s in scales}
+    for scale, img in render_scales(native, scales).items():
+        img.save(targets[scale], optimize=True)
+    return list(targets.values())
+
+
+def render_batch(pages, out_dir=PIXEL_OUTPUT_DIR, workers=None, scales=(4,)):
+    """
+    Render a batch of pixel evidence pages, optionally across a process pool.
+
+    Args:
+        pages: List of EvidencePage (types without a pixel layout are skipped)
+        out_dir: Root directory; pages land in <out_dir>/<case_dir>/
+        workers: Process count. Default: this process only
+        scales: Upscale factors; several write <id>_<N>x.png per page
+
+    Returns:
+        List of written paths.
+    """
+    pages = [p for p in pages if p.evidence.get("type", "Document") in PIXEL_LAYOUTS]
+    scales = tuple(scales)
+    if workers is None or workers <= 1 or len(pages) <= 1:
+        results = [_render_to_files(page, out_dir, scales) for page in pages]
+    else:
+        # Few, large chunks: every worker reuses its text and stamp masks
+        chunk = max(1, len(pages) // workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_render_to_files, pages, [out_dir] * len(pages),
+                                    [scales] * len(pages), chunksize=chunk))
+    return [path for paths in results for path in paths]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render the pixel-art evidence pages of the case JSONs"
+    )
+    parser.add_argument("cases", nargs="*",
+                        help=f"Case JSON files (default: all in {CASES_DIR})")
+    parser.add_argument("-o", "--output-dir", default=str(PIXEL_OUTPUT_DIR),
+                        help="Output root directory")
+    parser.add_argument("--scales", type=int, nargs="+", default=[4],
+                        help=f"Upscale factors (default: 4; shipped: "
+                             f"{' '.join(map(str, SHIPPED_SCALES))})")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    case_paths = args.cases or sorted(CASES_DIR.glob("*.json"))
+    pages = load_pages(case_paths, set(PIXEL_LAYOUTS))
+    if not pages:
+        print("No pixel-style evidence pages found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    paths = render_batch(pages, args.output_dir, args.jobs, args.scales)
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {len(pages)} evidence page(s) ({len(paths)} file(s)) from "
+          f"{len(case_paths)} case(s) in {elapsed:.2f}s -> {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Procedural image patches for the document generators.
+
+Provides:
+- Halftoned photo placeholders (ID card portrait, newspaper file photo)
+- Eli's crayon stick-figure drawing (RGBA sprite)
+- Scribble stroke masks (pen scribbles, faint paper wrinkles)
+
+Patches are built as NumPy arrays and cached per (size, seed). Seeds may
+be an int, a RenderRNG or None (fresh randomness, not cached).
+"""
+
+import math
+import sys
+from functools import lru_cache
+
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: 'numpy' package not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from halftone_common import RenderRNG
+
+
+def _patch_seed(seed, stream):
+    """Int seed for a patch, or None for an uncached fresh one."""
+    if isinstance(seed, RenderRNG):
+        return seed.seed_for(stream) if seed.seeded else None
+    return None if seed is None else int(seed)
+
+
+def _frozen(a):
+    a.flags.writeable = False
+    return a
+
+
+def _scatter(px, xs, ys, color):
+    """Write color at the in-bounds (xs, ys) points of an image array."""
+    h, w = px.shape[:2]
+    ok = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    px[ys[ok], xs[ok]] = color
+
+
+# =============================================================================
+# PHOTO PLACEHOLDERS
+# =============================================================================
+
+def _gray_to_photo(gray, tint):
+    """Clamp a gray int array to 60..200 and warm it: (v, v - t, v - 2t)."""
+    v = np.clip(gray, 60, 200)
+    return np.stack([v, v - tint, v - 2 * tint], axis=-1).astype(np.uint8)
+
+
+@lru_cache(maxsize=64)
+def _portrait(w, h, seed, cell):
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:h, 0:w]
+    # Face silhouette: darker centre, lighter edges
+    dist = np.hypot((x - w // 2) / (w // 2), (y - h * 0.4) / (h * 0.4))
+    gray = 100 + (60 * np.minimum(dist, 1.0)).astype(np.int16)
+    # Coarse halftone quantization — worker quality printing
+    gray += 15 * (((x // cell) + (y // cell)) % 2 == 0)
+    gray += rng.integers(-10, 11, (h, w), dtype=np.int16)
+    return _frozen(_gray_to_photo(gray, 3))
+
+
+@lru_cache(maxsize=64)
+def _file_photo(w, h, seed, cell):
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:h, 0:w]
+    # Coarse halftone checkerboard with heavy noise
+    gray = 120 + 40 * (((x // cell) + (y // cell)) % 3 == 0).astype(np.int16)
+    gray += rng.integers(-20, 21, (h, w), dtype=np.int16)
+    return _frozen(_gray_to_photo(gray, 5))
+
+
+def portrait_photo(w, h, seed=None, cell=5):
+    """
+    Halftoned ID-card portrait placeholder: a blurred head silhouette.
+
+    Args:
+        w, h: Patch size
+        seed: Int seed, RenderRNG or None
+        cell: Halftone cell size in pixels
+
+    Returns:
+        PIL Image (RGB).
+    """
+    seed = _patch_seed(seed, "portrait")
+    if seed is None:
+        return Image.fromarray(_portrait.__wrapped__(w, h, None, cell), "RGB")
+    return Image.fromarray(_portrait(w, h, seed, cell), "RGB")
+
+
+def file_photo(w, h, seed=None, cell=6):
+    """
+    Halftoned newspaper file-photo placeholder.
+
+    Args:
+        w, h: Patch size
+        seed: Int seed, RenderRNG or None
+        cell: Halftone cell size in pixels
+
+    Returns:
+        PIL Image (RGB).
+    """
+    seed = _patch_seed(seed, "file_photo")
+    if seed is None:
+        return Image.fromarray(_file_photo.__wrapped__(w, h, None, cell), "RGB")
+    return Image.fromarray(_file_photo(w, h, seed, cell), "RGB")
+
+
+# =============================================================================
+# SCRIBBLES
+# =============================================================================
+
+def _stroke_points(x0, y0, length, angle, wobble, rng):
+    """Pixel coordinates of straight strokes, one row of samples per stroke."""
+    t = np.arange(int(length.max()) if len(length) else 0)
+    on = t[None, :] < length[:, None]
+    xs = x0[:, None] + t[None, :] * np.cos(angle)[:, None]
+    ys = y0[:, None] + t[None, :] * np.sin(angle)[:, None]
+    if wobble:
+        ys = ys + rng.integers(-wobble, wobble + 1, ys.shape)
+    return np.trunc(xs[on]).astype(np.int64), np.trunc(ys[on]).astype(np.int64)
+
+
+@lru_cache(maxsize=64)
+def _scribble(w, h, seed, strokes, length, angle, margin, wobble):
+    rng = np.random.default_rng(seed)
+    x0 = rng.integers(margin, w - margin + 1, strokes)
+    y0 = rng.integers(margin, h - margin + 1, strokes)
+    lengths = rng.integers(length[0], length[1] + 1, strokes)
+    angles = rng.uniform(angle[0], angle[1], strokes)
+    xs, ys = _stroke_points(x0, y0, lengths, angles, wobble, rng)
+
+    mask = np.zeros((h, w), dtype=np.uint8)
+    ok = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    # Crossing strokes darken twice, like overdrawn pencil
+    np.add.at(mask, (ys[ok], xs[ok]), 1)
+    return _frozen(mask)
+
+
+def scribble_mask(w, h, seed=None, strokes=8, length=(40, 120),
+                  angle=(0.0, math.pi), margin=0, wobble=0):
+    """
+    Random straight strokes as a per-pixel hit count.
+
+    Args:
+        w, h: Mask size
+        seed: Int seed, RenderRNG or None
+        strokes: Number of strokes
+        length: (min, max) stroke length in pixels
+        angle: (min, max) stroke angle in radians
+        margin: Keep stroke starts this far from the edges
+        wobble: Max vertical jitter per pixel (0 = ruler-straight)
+
+    Returns:
+        uint8 array (h, w): how many strokes cover each pixel (read-only
+        when cached).
+    """
+    seed = _patch_seed(seed, "scribble")
+    args = (w, h, seed, strokes, tuple(length), tuple(angle), margin, wobble)
+    if seed is None:
+        return _scribble.__wrapped__(*args)
+    return _scribble(*args)
+
+
+def shade_strokes(img, mask, shade):
+    """
+    Darken img by shade for every stroke covering a pixel (in place).
+
+    Args:
+        img: PIL Image (RGB), modified in place and returned
+        mask: From scribble_mask(), same size as img
+        shade: Per-channel RGB amount subtracted per stroke
+    """
+    ys, xs = np.nonzero(mask)
+    if len(ys) == 0:
+        return img
+    # Strokes cover a small fraction of the page: only touch their box
+    y0, y1, x0, x1 = ys.min(), ys.max() + 1, xs.min(), xs.max() + 1
+    box = np.array(img.crop((x0, y0, x1, y1)))
+    ys, xs = ys - y0, xs - x0
+    shaded = box[ys, xs].astype(np.int16) - (mask[ys + y0, xs + x0, None]
+                                             * np.array(shade, np.int16))
+    box[ys, xs] = np.clip(shaded, 0, 255)
+    img.paste(Image.fromarray(box, "RGB"), (int(x0), int(y0)))
+    return img
+
+
+# =============================================================================
+# CHILD'S DRAWING
+# =============================================================================
+# Eli's stick figure of Marlo with his cardboard badge, a sun and "DAD".
+# Coordinates are relative to the centre of the head.
+
+_CHILD_LEFT = 32        # sprite x of the head centre
+_CHILD_TOP = 42         # sprite y of the head centre
+_CHILD_SIZE = (84, 118)
+
+CRAYON = {
+    "red": (200, 80, 60),
+    "blue": (80, 100, 180),
+    "green": (70, 150, 80),
+    "yellow": (210, 190, 60),
+    "brown": (140, 100, 60),
+}
+
+# Pixels of a 3x3 PIL ellipse (a plus sign), relative to its centre
+_DOT = np.array([(0, -1), (-1, 0), (0, 0), (1, 0), (0, 1)])
+
+
+def _dots(xs, ys):
+    """Expand centre points into 3x3 crayon dots."""
+    return ((xs[:, None] + _DOT[None, :, 0]).ravel(),
+            (ys[:, None] + _DOT[None, :, 1]).ravel())
+
+
+def _circle(r, step, start=0, stop=360):
+    """int-truncated points on a circle, every `step` degrees."""
+    a = np.radians(np.arange(start, stop, step))
+    return np.trunc(r * np.cos(a)).astype(np.int64), np.trunc(r * np.sin(a)).astype(np.int64)
+
+
+@lru_cache(maxsize=1)
+def _child_static():
+    """Seed-independent strokes: (color, xs, ys) in drawing order."""
+    smile = _circle(6, 10, 200, 340)
+    eyes = _dots(np.array([-4, 4]), np.array([-3, -3]))
+
+    # Sun: dotted ring plus eight rays
+    sun_x, sun_y = 35, -25
+    ring = _circle(8, 15)
+    sun = _dots(ring[0] + sun_x, ring[1] + sun_y)
+    a = np.radians(np.arange(0, 360, 45))[:, None]
+    dr = np.arange(10, 16)[None, :]
+    rays = (np.trunc(dr * np.cos(a)).ravel().astype(np.int64) + sun_x,
+            np.trunc(dr * np.sin(a)).ravel().astype(np.int64) + sun_y)
+
+    # "DAD" in wobbly child handwriting
+    ly = 66
+    letters = [(x, ly + dy) for dy in range(8) for x in (-10, -2, 2, 6)]
+    letters += [(x + dx, ly + dy) for dx in range(4) for x in (-10, 6) for dy in (0, 7)]
+    letters += [(x, ly + dy) for x in (-6, 10) for dy in (2, 5)]
+    letters += [(dx, ly + dy) for dx in (-1, 0, 1) for dy in (0, 4)]
+    letters = np.array(letters).T
+
+    star = (np.array([0, -1, 1]), np.array([20, 19, 19]))
+    return (
+        ("brown", smile), ("brown", eyes),
+        ("yellow", star), ("yellow", sun), ("yellow", rays), ("red", letters),
+    )
+
+
+@lru_cache(maxsize=16)
+def _child_drawing(seed):
+    rng = np.random.default_rng(seed)
+
+    def n(lo, hi, size):
+        return rng.integers(lo, hi + 1, size)
+
+    r = 12 + n(-1, 1, 45)
+    a = np.radians(np.arange(0, 360, 8))
+    head = _dots(np.trunc(r * np.cos(a)).astype(np.int64),
+                 np.trunc(r * np.sin(a)).astype(np.int64))
+    body = (n(-1, 0, 30), 12 + np.arange(30))
+    arms = (np.arange(-18, 19), 22 + n(-1, 1, 37))
+    legs = (np.concatenate([-8 + n(-1, 0, 20), 8 + n(0, 1, 20)]),
+            np.tile(42 + np.arange(20), 2))
+    by, bx = np.mgrid[-3:4, -4:5]
+    keep = rng.random(bx.shape) > 0.15
+    badge = (bx[keep], 20 + by[keep])
+    ground = (np.arange(-30, 31), 62 + n(-1, 1, 61))
+
+    static = _child_static()
+    strokes = (
+        ("brown", head), static[0], static[1],
+        ("brown", body), ("brown", arms), ("brown", legs),
+        ("red", badge), static[2], ("green", ground),
+        static[3], static[4], static[5],
+    )
+
+    w, h = _CHILD_SIZE
+    px = np.zeros((h, w, 4), dtype=np.uint8)
+    for color, (xs, ys) in strokes:
+        _scatter(px, xs + _CHILD_LEFT, ys + _CHILD_TOP, CRAYON[color] + (255,))
+    return _frozen(px)
+
+
+def child_drawing(seed=None):
+    """
+    Eli's crayon drawing as an RGBA sprite.
+
+    Returns:
+        (sprite, (dx, dy)) — paste the sprite at (x + dx, y + dy) to put
+        the head centre at (x, y).
+    """
+    seed = _patch_seed(seed, "child_drawing")
+    px = _child_drawing.__wrapped__(None) if seed is None else _child_drawing(seed)
+    return Image.fromarray(px, "RGBA"), (-_CHILD_LEFT, -_CHILD_TOP)
+
+
+def clear_patch_caches():
+    """Drop all cached patches."""
+    _portrait.cache_clear()
+    _file_photo.cache_clear()
+    _scribble.cache_clear()
+    _child_drawing.cache_clear()
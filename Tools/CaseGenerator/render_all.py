@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Render every evidence document generator in one go.
+
+Discovers the generate_* functions of the document modules and runs each
+in its own worker process.
+
+Usage:
+    python render_all.py                       # All documents, one worker per core
+    python render_all.py --jobs 2              # Limit the pool size
+    python render_all.py --only newspaper      # Only matching generators
+    python render_all.py --output-dir /tmp/art # Write somewhere else
+    python render_all.py --no-cache            # Re-render even if unchanged
+    python render_all.py --export webp         # Also write indexed copies to output/export
+
+Renders are cached by content (see render_cache.py).
+"""
+
+import argparse
+import importlib
+import inspect
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows: no peak-RSS reporting
+
+from asset_export import FORMATS, export_assets
+from halftone_common import seed_arg
+from render_cache import render_key, lookup, store, materialize
+
+
+SCRIPT_DIR = Path(__file__).parent
+OUTPUT_DIR = SCRIPT_DIR / "output"
+
+# Modules holding document generators. Each defines OUTPUT_NAME and one or
+# more generate_* functions that run with default arguments.
+GENERATOR_MODULES = (
+    "halftone_doc",
+    "halftone_id_card",
+    "halftone_letter",
+    "halftone_newspaper",
+    "halftone_overseer",
+    "pixel_doc",
+)
+
+# Workers exit after one document so each peak RSS belongs to one render.
+# max_tasks_per_child needs Python 3.11; older versions reuse workers and
+# leave the RSS column blank, since ru_maxrss would span several renders.
+FRESH_WORKERS = sys.version_info >= (3, 11)
+
+
+def discover_generators(modules=GENERATOR_MODULES):
+    """
+    Find the generator functions defined in each document module.
+
+    Returns:
+        List of (module_name, function_name, output_name) tuples.
+    """
+    jobs = []
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        funcs = [name for name, obj in inspect.getmembers(module, inspect.isfunction)
+                 if name.startswith("generate_") and obj.__module__ == module_name]
+        for func_name in funcs:
+            # A module with several generators gets one file per function
+            output_name = module.OUTPUT_NAME
+            if len(funcs) > 1:
+                output_name = f"{Path(output_name).stem}_{func_name[9:]}.png"
+            jobs.append((module_name, func_name, output_name))
+    return jobs
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def render_one(module_name, func_name, out_path, seed=None, key=None):
+    """
+    Run one generator and save its (first) image. Executed inside a pool worker.
+
+    Generators without a seed argument get the random module seeded instead.
+
+    Args:
+        module_name, func_name: Generator to run
+        out_path: PNG to write
+        seed: Seed for the render
+        key: render_cache key — store the render there and link out_path to it
+
+    Returns:
+        (out_path, (width, height), wall_seconds, peak_rss_mb, "rendered")
+    """
+    start = time.perf_counter()
+    func = getattr(importlib.import_module(module_name), func_name)
+    kwargs = {}
+    if "seed" in inspect.signature(func).parameters:
+        kwargs["seed"] = seed
+    elif seed is not None:
+        random.seed(seed)
+    img = func(**kwargs)
+    if isinstance(img, tuple):
+        img = img[0]
+    if key is None:
+        img.save(out_path)
+    else:
+        cached = store(key, img, module=module_name, function=func_name, seed=seed)
+        materialize(cached, out_path)
+    rss = _peak_rss_mb() if FRESH_WORKERS else None
+    return out_path, img.size, time.perf_counter() - start, rss, "rendered"
+
+
+def render_all(jobs, output_dir=OUTPUT_DIR, workers=None, seed=0, use_cache=True):
+    """
+    Render generator jobs across a process pool, one document per worker.
+
+    Documents whose render key is cached are linked without a worker.
+
+    Args:
+        jobs: List from discover_generators()
+        output_dir: Directory for the PNGs
+        workers: Pool size. Default: one per CPU core
+        seed: Seed for every render (part of the cache key)
+        use_cache: False to always re-render
+
+    Returns:
+        List of (module_name, function_name, result) in completion order,
+        where result is render_one's tuple or the raised exception.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    results = []
+    pending = []
+    for module_name, func_name, output_name in jobs:
+        out_path = str(output_dir / output_name)
+        key = render_key(module_name, func_name, seed=seed) if use_cache else None
+        cached = lookup(key) if key else None
+        if cached is None:
+            pending.append((module_name, func_name, out_path, key))
+            continue
+        start = time.perf_counter()
+        how = materialize(cached, out_path)
+        result = (out_path, _png_size(cached), time.perf_counter() - start, None, how)
+        results.append((module_name, func_name, result))
+        _print_result(module_name, func_name, result)
+
+    if not pending:
+        return results
+
+    pool_kwargs = {"max_tasks_per_child": 1} if FRESH_WORKERS else {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(pending)), **pool_kwargs) as pool:
+        futures = {
+            pool.submit(render_one, module_name, func_name, out_path,
+                        seed, key): (module_name, func_name)
+            for module_name, func_name, out_path, key in pending
+        }
+        for future in as_completed(futures):
+            module_name, func_name = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = e
+            results.append((module_name, func_name, result))
+            _print_result(module_name, func_name, result)
+    return results
+
+
+def _png_size(path):
+    """Width and height from a PNG header, without decoding the image."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+    return int.from_bytes(header[16:20], "big"), int.from_bytes(header[20:24], "big")
+
+
+def _print_result(module_name, func_name, result):
+    label = f"{module_name}.{func_name}"
+    if isinstance(result, Exception):
+        print(f"  FAILED  {label:<45} {type(result).__name__}: {result}")
+        return
+    out_path, (w, h), wall, rss, how = result
+    rss_text = f"{rss:7.1f} MB" if rss is not None else "       --"
+    note = "" if how == "rendered" else f"  [cached, {how}]"
+    print(f"  {wall:6.2f}s  {rss_text}  {label:<45} -> {Path(out_path).name} ({w}x{h}){note}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render all evidence documents in parallel"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--only", action="append", default=[],
+                        help="Only run generators whose module or function name "
+                             "contains this text (repeatable)")
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR),
+                        help=f"Output directory (default: {OUTPUT_DIR})")
+    parser.add_argument("--seed", type=seed_arg, default=0,
+                        help="Random seed for every document (default: 0)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-render even when a cached render matches")
+    parser.add_argument("--export", choices=FORMATS,
+                        help="Also export palette-indexed copies (see asset_export.py) "
+                             "to <output-dir>/export")
+    args = parser.parse_args()
+
+    jobs = discover_generators()
+    if args.only:
+        jobs = [job for job in jobs
+                if any(text in f"{job[0]}.{job[1]}" for text in args.only)]
+    if not jobs:
+        print("No generators matched.")
+        sys.exit(1)
+
+    print(f"Rendering {len(jobs)} document(s)  (wall time, peak RSS)")
+    start = time.perf_counter()
+    results = render_all(jobs, args.output_dir, args.jobs,
+                         seed=args.seed, use_cache=not args.no_cache)
+    total = time.perf_counter() - start
+
+    failed = sum(isinstance(result, Exception) for _, _, result in results)
+    slowest = max((r[2] for _, _, r in results if not isinstance(r, Exception)),
+                  default=0.0)
+    print(f"\nDone in {total:.2f}s (slowest document {slowest:.2f}s), "
+          f"{len(results) - failed} ok, {failed} failed")
+
+    if args.export:
+        rendered = [r[0] for _, _, r in results if not isinstance(r, Exception)]
+        exported = export_assets(rendered, Path(args.output_dir) / "export",
+                                 args.export, workers=args.jobs)
+        ok = []
+        for path, e in zip(rendered, exported):
+            if isinstance(e, Exception):
+                print(f"  EXPORT FAILED  {path}: {type(e).__name__}: {e}")
+            else:
+                ok.append(e)
+        size_in = sum(e[1] for e in ok)
+        size_out = sum(e[2] for e in ok)
+        print(f"Exported {len(ok)} indexed {args.export.upper()} file(s): "
+              f"{size_in / 1024:.0f} KB -> {size_out / 1024:.0f} KB, "
+              f"{len(exported) - len(ok)} failed")
+        failed += len(exported) - len(ok)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Content-addressed cache for rendered evidence documents.
+
+A render is identified by everything that can change its pixels:
+- the source of the generator module and of every local module it imports
+- the generator's parameters, defaults included (dot_spacing, skip_halftone, scale, ...)
+- the font files load_font resolves to on this machine
+- the seed
+
+Matching renders are hard-linked (or copied) from output/.cache/renders
+instead of being drawn again.
+
+Usage:
+    from render_cache import render_key, lookup, store, materialize
+
+    key = render_key("halftone_doc", "generate_access_log", {"dot_spacing": 12}, seed=0)
+    cached = lookup(key)
+    if cached is None:
+        cached = store(key, generate_access_log(dot_spacing=12))
+    materialize(cached, "output/ev_access_log_halftone.png")
+"""
+
+import ast
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import shutil
+from pathlib import Path
+
+from halftone_common import CACHE_DIR, resolved_font_files
+
+SCRIPT_DIR = Path(__file__).parent
+RENDER_CACHE_DIR = CACHE_DIR / "renders"
+
+# Bump when the key layout changes so stale entries are never matched
+_RENDER_KEY_VERSION = 2
+
+
+# =============================================================================
+# KEYS
+# =============================================================================
+
+def _imported_names(path):
+    """Top-level module names imported anywhere in a source file."""
+    names = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), str(path))):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def local_dependencies(module_name):
+    """
+    The module plus every module of this directory it imports, transitively.
+
+    Returns:
+        Sorted list of (module name, source path).
+    """
+    found = {}
+    todo = [module_name]
+    while todo:
+        name = todo.pop()
+        path = SCRIPT_DIR / f"{name}.py"
+        if name in found or not path.is_file():
+            continue
+        found[name] = path
+        todo.extend(_imported_names(path) - found.keys())
+    return sorted(found.items())
+
+
+def _font_fingerprint():
+    """Resolved font file per style, with size and mtime so swaps are noticed."""
+    fonts = {}
+    for style, path in sorted(resolved_font_files().items()):
+        if path is None:
+            fonts[style] = None
+            continue
+        st = os.stat(path)
+        fonts[style] = [path, st.st_size, st.st_mtime_ns]
+    return fonts
+
+
+def render_key(module_name, func_name, params=None, seed=None):
+    """
+    Hash identifying one render of a generator function.
+
+    Args:
+        module_name: Generator module, e.g. "halftone_doc"
+        func_name: Generator function, e.g. "generate_access_log"
+        params: Keyword arguments for the generator (defaults are filled in)
+        seed: Seed the render runs with
+
+    Returns:
+        Hex digest string.
+    """
+    module = importlib.import_module(module_name)
+    func = getattr(module, func_name)
+    bound = inspect.signature(func).bind(**(params or {}))
+    bound.apply_defaults()
+
+    h = hashlib.sha256()
+    h.update(f"v{_RENDER_KEY_VERSION}:{module_name}.{func_name}\n".encode())
+    for name, path in local_dependencies(module_name):
+        h.update(f"{name}\n".encode())
+        h.update(path.read_bytes())
+    h.update(json.dumps(
+        {"params": bound.arguments, "seed": seed, "fonts": _font_fingerprint()},
+        sort_keys=True, default=repr,
+    ).encode())
+    return h.hexdigest()
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def _entry_paths(key):
+    return RENDER_CACHE_DIR / f"{key}.png", RENDER_CACHE_DIR / f"{key}.json"
+
+
+def lookup(key):
+    """
+    Cached PNG for a render key, or None.
+
+    An entry whose file changed since it was stored (e.g. written through a
+    hard link) no longer counts as a hit.
+    """
+    png, meta = _entry_paths(key)
+    try:
+        info = json.loads(meta.read_text(encoding="utf-8"))
+        st = png.stat()
+    except (OSError, ValueError):
+        return None
+    if [st.st_size, st.st_mtime_ns] != info.get("stat"):
+        return None
+    return png
+
+
+def store(key, img, **meta):
+    """
+    Save a rendered image under its key.
+
+    Args:
+        key: From render_key()
+        img: PIL Image
+        **meta: Extra JSON-serializable details recorded next to the entry
+
+    Returns:
+        Path of the cached PNG.
+    """
+    RENDER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    png, meta_path = _entry_paths(key)
+    tmp = png.with_name(f"{png.stem}.{os.getpid()}.tmp.png")
+    img.save(tmp)
+    os.replace(tmp, png)
+
+    st = png.stat()
+    meta.update(stat=[st.st_size, st.st_mtime_ns], size=list(img.size))
+    tmp = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(meta, indent=2, default=repr), encoding="utf-8")
+    os.replace(tmp, meta_path)
+    return png
+
+
+def materialize(cached, out_path):
+    """
+    Put a cached render at out_path, sharing the file where possible.
+
+    Returns:
+        "current" if out_path already is the cached file, "linked" for a
+        new hard link, or "copied" when linking is not possible.
+    """
+    out_path = Path(out_path)
+    try:
+        if out_path.exists() and os.path.samefile(cached, out_path):
+            return "current"
+    except OSError:
+        pass
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    try:
+        os.link(cached, tmp)
+        how = "linked"
+    except OSError:
+        # Different filesystem, or no hard links (e.g. some Windows shares)
+        shutil.copyfile(cached, tmp)
+        how = "copied"
+    os.replace(tmp, out_path)
+    return how
+
+
+def clear_render_cache():
+    """Delete every cached render."""
+    shutil.rmtree(RENDER_CACHE_DIR, ignore_errors=True)
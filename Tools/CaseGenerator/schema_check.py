@@ -0,0 +1,350 @@
+"""
+Compiled case-schema validation shared by validate.py and case_browser.py.
+
+The schema is compiled once per process into a generated Python predicate
+(cached on disk by schema hash); jsonschema only runs to report errors.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from pathlib import Path
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+SCRIPT_DIR = Path(__file__).parent
+SCHEMA_CACHE_DIR = SCRIPT_DIR / "output" / ".cache" / "schema"
+
+# Bump when the generated code changes, so stale cached sources are ignored
+CODEGEN_VERSION = 1
+
+# Keywords that never affect validity (format is not asserted by default
+# in Draft 2020-12, as in jsonschema without a format_checker)
+_ANNOTATIONS = frozenset({
+    "$schema", "$comment", "$defs", "definitions", "title", "description",
+    "default", "examples", "format", "deprecated", "readOnly", "writeOnly",
+})
+
+# type keyword -> Python test of `v` (bools are not numbers in JSON Schema)
+_TYPE_TESTS = {
+    "string": "isinstance(v, str)",
+    "object": "isinstance(v, dict)",
+    "array": "isinstance(v, list)",
+    "boolean": "isinstance(v, bool)",
+    "null": "v is None",
+    "number": "(isinstance(v, (int, float)) and not isinstance(v, bool))",
+    "integer": "(not isinstance(v, bool) and (isinstance(v, int) or "
+               "(isinstance(v, float) and v.is_integer())))",
+}
+
+# Keywords by the instance type they apply to
+_STRING_KEYWORDS = ("minLength", "maxLength", "pattern")
+_NUMBER_KEYWORDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+_ARRAY_KEYWORDS = ("items", "minItems", "maxItems")
+_OBJECT_KEYWORDS = ("required", "properties", "additionalProperties")
+
+_SUPPORTED = frozenset(("type", "enum", "$ref") + _STRING_KEYWORDS + _NUMBER_KEYWORDS
+                       + _ARRAY_KEYWORDS + _OBJECT_KEYWORDS) | _ANNOTATIONS
+
+
+class UnsupportedSchema(Exception):
+    """The schema uses a keyword or value the code generator does not handle."""
+
+
+def _number(value):
+    """Source literal of a finite schema number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) \
+            or not math.isfinite(value):
+        raise UnsupportedSchema(f"non-finite or non-numeric bound {value!r}")
+    return repr(value)
+
+
+def _count(value):
+    """Source literal of a length / item-count bound."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise UnsupportedSchema(f"invalid count {value!r}")
+    return repr(value)
+
+
+# =============================================================================
+# CODE GENERATION
+# =============================================================================
+
+class _Codegen:
+    """Translate a schema into Python source: one function per subschema."""
+
+    def __init__(self, root):
+        self.root = root
+        self.lines = []
+        self.consts = []
+        self.refs = {}
+        self.count = 0
+
+    def const(self, source):
+        name = f"_C{len(self.consts)}"
+        self.consts.append(f"{name} = {source}")
+        return name
+
+    def ref(self, pointer):
+        """Function validating the local subschema at a "#/..." pointer."""
+        if pointer not in self.refs:
+            if not pointer.startswith("#/"):
+                raise UnsupportedSchema(f"non-local $ref {pointer!r}")
+            node = self.root
+            for part in pointer[2:].split("/"):
+                part = part.replace("~1", "/").replace("~0", "~")
+                try:
+                    node = node[int(part)] if isinstance(node, list) else node[part]
+                except (KeyError, IndexError, ValueError):
+                    raise UnsupportedSchema(f"unresolvable $ref {pointer!r}")
+            # Reserve the name first, so recursive schemas terminate
+            self.refs[pointer] = f"_f{self.count}"
+            self.count += 1
+            self.function(node, self.refs[pointer])
+        return self.refs[pointer]
+
+    def function(self, node, name=None):
+        """Emit a function for a subschema; returns its name."""
+        if name is None:
+            name = f"_f{self.count}"
+            self.count += 1
+        body = self.body(node)
+        self.lines.append(f"def {name}(v):")
+        self.lines.extend(f"    {line}" for line in body)
+        self.lines.append("    return True")
+        self.lines.append("")
+        return name
+
+    def body(self, node):
+        if node is True:
+            return []
+        if node is False:
+            return ["return False"]
+        if not isinstance(node, dict):
+            raise UnsupportedSchema(f"schema node {node!r}")
+        unknown = set(node) - _SUPPORTED
+        if unknown:
+            raise UnsupportedSchema(f"keywords {sorted(unknown)}")
+
+        out = []
+        types = node.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types is not None:
+            if any(t not in _TYPE_TESTS for t in types):
+                raise UnsupportedSchema(f"type {types!r}")
+            test = " or ".join(_TYPE_TESTS[t] for t in types)
+            out.append(f"if not ({test}):")
+            out.append("    return False")
+        # A single declared type makes the per-type guards below redundant
+        known = types[0] if types and len(types) == 1 else None
+        if known == "integer":
+            known = "number"
+
+        if "enum" in node:
+            values = node["enum"]
+            if not all(isinstance(x, str) for x in values):
+                raise UnsupportedSchema("non-string enum")
+            enum = self.const(f"frozenset({sorted(values)!r})")
+            out.append(f"if not (isinstance(v, str) and v in {enum}):")
+            out.append("    return False")
+
+        if "$ref" in node:
+            out.append(f"if not {self.ref(node['$ref'])}(v):")
+            out.append("    return False")
+
+        out += self.guarded(known, "string", "isinstance(v, str)", self.string(node))
+        out += self.guarded(known, "number", _TYPE_TESTS["number"], self.number(node))
+        out += self.guarded(known, "array", "isinstance(v, list)", self.array(node))
+        out += self.guarded(known, "object", "isinstance(v, dict)", self.object(node))
+        return out
+
+    @staticmethod
+    def guarded(known, kind, test, lines):
+        if not lines or known == kind:
+            return lines
+        if known is not None:
+            return []  # the type check already rejected other kinds
+        return [f"if {test}:"] + [f"    {line}" for line in lines]
+
+    def string(self, node):
+        out = []
+        if "minLength" in node:
+            out += [f"if len(v) < {_count(node['minLength'])}:", "    return False"]
+        if "maxLength" in node:
+            out += [f"if len(v) > {_count(node['maxLength'])}:", "    return False"]
+        if "pattern" in node:
+            pattern = self.const(f"re.compile({node['pattern']!r})")
+            out += [f"if not {pattern}.search(v):", "    return False"]
+        return out
+
+    def number(self, node):
+        out = []
+        for keyword, op in (("minimum", "<"), ("maximum", ">"),
+                            ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")):
+            if keyword in node:
+                out += [f"if v {op} {_number(node[keyword])}:", "    return False"]
+        return out
+
+    def array(self, node):
+        out = []
+        if "minItems" in node:
+            out += [f"if len(v) < {_count(node['minItems'])}:", "    return False"]
+        if "maxItems" in node:
+            out += [f"if len(v) > {_count(node['maxItems'])}:", "    return False"]
+        if "items" in node:
+            if not isinstance(node["items"], (dict, bool)):
+                raise UnsupportedSchema("array-form items")
+            item = self.function(node["items"])
+            out += ["for x in v:", f"    if not {item}(x):", "        return False"]
+        return out
+
+    def object(self, node):
+        out = []
+        if node.get("required"):
+            required = self.const(f"frozenset({sorted(node['required'])!r})")
+            out += [f"if not {required} <= v.keys():", "    return False"]
+        props = node.get("properties", {})
+        for key, sub in props.items():
+            check = self.function(sub)
+            out += [f"if {key!r} in v and not {check}(v[{key!r}]):", "    return False"]
+        extra = node.get("additionalProperties", True)
+        if extra is not True:
+            known = self.const(f"frozenset({sorted(props)!r})")
+            if extra is False:
+                out += [f"if not v.keys() <= {known}:", "    return False"]
+            else:
+                check = self.function(extra)
+                out += ["for k, x in v.items():",
+                        f"    if k not in {known} and not {check}(x):",
+                        "        return False"]
+        return out
+
+    def source(self, digest):
+        entry = self.function(self.root)
+        body = "\n".join(["import re", "", *self.consts, "", *self.lines,
+                          f"validate = {entry}", ""])
+        return _header(digest, body) + body
+
+
+def _header(digest, body):
+    """First line of a generated module: schema digest and body checksum."""
+    checksum = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    return f"# schema_check codegen v{CODEGEN_VERSION} schema {digest} body {checksum}\n"
+
+
+def _verified(source, digest):
+    """True if source is the unmodified generated module for digest."""
+    header, _, body = source.partition("\n")
+    return header + "\n" == _header(digest, body)
+
+
+def generate_source(schema, digest=""):
+    """
+    Python source of a validity predicate for schema.
+
+    Returns:
+        Module source defining validate(instance) -> bool.
+
+    Raises:
+        UnsupportedSchema: The schema uses keywords the generator lacks.
+    """
+    return _Codegen(schema).source(digest)
+
+
+# =============================================================================
+# PER-PROCESS CACHE
+# =============================================================================
+
+def schema_hash(schema):
+    """Stable digest of a schema's content."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{CODEGEN_VERSION}:{canonical}".encode("utf-8")).hexdigest()
+
+
+# id(schema) -> (schema, digest); the schema is kept so its id stays valid.
+# Schemas are treated as immutable once validated against.
+_DIGESTS = {}
+_VALIDATORS = {}
+_FAST = {}
+
+
+def _digest(schema):
+    entry = _DIGESTS.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = _DIGESTS[id(schema)] = (schema, schema_hash(schema))
+    return entry[1]
+
+
+def compiled_validator(schema):
+    """The jsonschema Draft202012Validator for schema, built once per process."""
+    if jsonschema is None:
+        raise ImportError("jsonschema is required to report schema errors")
+    digest = _digest(schema)
+    validator = _VALIDATORS.get(digest)
+    if validator is None:
+        jsonschema.Draft202012Validator.check_schema(schema)
+        validator = _VALIDATORS[digest] = jsonschema.Draft202012Validator(schema)
+    return validator
+
+
+def _load_generated(schema, digest):
+    """
+    Generated predicate for schema, from the disk cache when present.
+
+    A cached file whose header does not match the schema digest and its own
+    body is regenerated instead of executed.
+    """
+    path = SCHEMA_CACHE_DIR / f"{digest}.py"
+    try:
+        source = path.read_text(encoding="utf-8")
+    except OSError:
+        source = None
+    if source is None or not _verified(source, digest):
+        source = generate_source(schema, digest)
+        try:
+            SCHEMA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{digest}.{os.getpid()}.tmp")
+            tmp.write_text(source, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    namespace = {"re": re}
+    exec(compile(source, str(path), "exec"), namespace)
+    return namespace["validate"]
+
+
+def fast_validator(schema):
+    """
+    Validity predicate for schema, compiled once per process.
+
+    The generated code when the schema only uses supported keywords,
+    otherwise the cached jsonschema validator's is_valid.
+    """
+    digest = _digest(schema)
+    check = _FAST.get(digest)
+    if check is None:
+        try:
+            check = _load_generated(schema, digest)
+        except UnsupportedSchema:
+            check = compiled_validator(schema).is_valid
+        _FAST[digest] = check
+    return check
+
+
+def schema_errors(case, schema):
+    """
+    Schema errors of a case.
+
+    Returns:
+        [] when the case is valid (decided by the fast predicate), else the
+        list of jsonschema ValidationError from the full validator.
+    """
+    if fast_validator(schema)(case):
+        return []
+    return list(compiled_validator(schema).iter_errors(case))
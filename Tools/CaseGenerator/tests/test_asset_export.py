@@ -0,0 +1,83 @@
+"""Nearest-colour LUT and indexed export."""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import asset_export
+from asset_export import (
+    LUT_BITS, export_image, halftone_palette, nearest_lut, pixel_palette, quantize,
+)
+
+
+@pytest.fixture
+def lut_cache(tmp_path, monkeypatch):
+    """A private, empty LUT cache (memory and disk)."""
+    monkeypatch.setattr(asset_export, "LUT_CACHE_DIR", tmp_path)
+    nearest_lut.cache_clear()
+    yield tmp_path
+    nearest_lut.cache_clear()
+
+
+def brute_force_distance(pixels, colors):
+    """Squared distance from each pixel to its nearest palette colour."""
+    diff = pixels[:, None, :].astype(np.float64) - np.array(colors, np.float64)[None]
+    return (diff ** 2).sum(-1).min(1)
+
+
+@pytest.mark.parametrize("palette", [halftone_palette, pixel_palette])
+def test_lut_picks_the_nearest_colour_of_each_cell(lut_cache, palette):
+    colors = palette()
+    n = 1 << LUT_BITS
+    cells = np.random.default_rng(0).integers(0, n ** 3, 4000)
+    rgb = np.stack([cells >> (2 * LUT_BITS), (cells >> LUT_BITS) & (n - 1), cells & (n - 1)], 1)
+    centres = (rgb + 0.5) * (256 / n)
+    chosen = np.array(colors, np.float64)[nearest_lut(colors)[cells]]
+    got = ((centres - chosen) ** 2).sum(-1)
+    assert np.allclose(got, brute_force_distance(centres, colors), rtol=1e-4, atol=1e-2)
+
+
+@pytest.mark.parametrize("palette", [halftone_palette, pixel_palette])
+def test_quantize_is_close_to_brute_force(lut_cache, palette):
+    colors = palette()
+    px = np.random.default_rng(1).integers(0, 256, (40, 50, 3)).astype(np.uint8)
+    out = np.asarray(quantize(Image.fromarray(px, "RGB"), colors).convert("RGB"))
+    got = np.sqrt(((px.reshape(-1, 3) - out.reshape(-1, 3).astype(np.float64)) ** 2).sum(-1))
+    best = np.sqrt(brute_force_distance(px.reshape(-1, 3), colors))
+    # A pixel is within half a cell diagonal of the centre its LUT entry
+    # was picked for, so the pick can be worse by at most twice that
+    half_diagonal = np.sqrt(3) * (1 << (8 - LUT_BITS)) / 2
+    assert (got - best <= 2 * half_diagonal + 1e-9).all()
+
+
+def test_pixel_palette_round_trips(lut_cache):
+    colors = pixel_palette()
+    px = np.array(colors, np.uint8)[np.arange(120) % len(colors)].reshape(10, 12, 3)
+    out = quantize(Image.fromarray(px, "RGB"), colors).convert("RGB")
+    assert np.array_equal(np.asarray(out), px)
+
+
+def test_lut_disk_cache_hit_and_corrupt_entry(lut_cache, monkeypatch):
+    colors = pixel_palette()
+    lut = nearest_lut(colors).copy()
+    assert len(list(lut_cache.glob("*.npy"))) == 1
+
+    nearest_lut.cache_clear()
+    monkeypatch.setattr(asset_export, "_build_lut", lambda c: pytest.fail("LUT rebuilt"))
+    assert np.array_equal(nearest_lut(colors), lut)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(asset_export, "LUT_CACHE_DIR", lut_cache)
+    nearest_lut.cache_clear()
+    for f in lut_cache.glob("*.npy"):
+        np.save(f, np.zeros(3, np.uint8))
+    assert np.array_equal(nearest_lut(colors), lut)
+
+
+def test_export_keeps_rgb_when_quantizing_would_blur(lut_cache, tmp_path):
+    src = tmp_path / "noise.png"
+    px = np.random.default_rng(2).integers(0, 256, (30, 30, 3)).astype(np.uint8)
+    Image.fromarray(px, "RGB").save(src)
+    dst, _, _, used = export_image(src, tmp_path / "out" / "noise.png")
+    assert used == "rgb"
+    assert np.array_equal(np.asarray(Image.open(dst).convert("RGB")), px)
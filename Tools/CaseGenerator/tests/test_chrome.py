@@ -0,0 +1,54 @@
+"""Cached document chrome sprites and stamp masks."""
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from halftone_common import (
+    CHROME_ELEMENTS, PALETTE, apply_chrome, chrome, chrome_layer,
+    draw_stamp_circle, stamp_mask, stamp_seal,
+)
+
+LAYERS = (
+    chrome("border", inset=10),
+    chrome("pattern_emblem", cx=60, cy=70, radius=30),
+    chrome("stamp_circle", cx=150, cy=120, radius=40,
+           text_top="APPROVED", text_bottom="BUREAU"),
+    chrome("footer"),
+)
+
+
+def test_chrome_sprite_matches_direct_drawing():
+    w, h = 220, 200
+    direct = Image.new("RGB", (w, h), PALETTE["paper"])
+    draw = ImageDraw.Draw(direct)
+    for element, params in LAYERS:
+        CHROME_ELEMENTS[element](draw, direct, w, h, **dict(params))
+
+    pasted = apply_chrome(Image.new("RGB", (w, h), PALETTE["paper"]), LAYERS)
+    diff = np.abs(np.asarray(pasted, np.int16) - np.asarray(direct, np.int16))
+    assert diff.max() <= 2
+
+
+def test_chrome_layer_is_cached_and_empty_layers_draw_nothing():
+    sprite, pos = chrome_layer(220, 200, LAYERS)
+    assert sprite.mode == "RGBA" and pos == (10, 10)
+    assert chrome_layer(220, 200, LAYERS)[0] is sprite
+    assert chrome_layer(50, 50, ()) == (None, (0, 0))
+
+
+def test_stamp_seal_matches_direct_stamp():
+    direct = Image.new("RGB", (160, 160), PALETTE["paper"])
+    draw_stamp_circle(ImageDraw.Draw(direct), 80, 80, 45, "CERTIFIED", "BUREAU")
+    sealed = stamp_seal(Image.new("RGB", (160, 160), PALETTE["paper"]),
+                        80, 80, 45, "CERTIFIED", "BUREAU")
+    diff = np.abs(np.asarray(sealed, np.int16) - np.asarray(direct, np.int16))
+    assert diff.max() <= 2
+
+
+def test_rotated_stamp_masks_stay_centred():
+    upright, (dx, dy) = stamp_mask(45, "CERTIFIED", "BUREAU")
+    turned, (tx, ty) = stamp_mask(45, "CERTIFIED", "BUREAU", rotation=30)
+    assert stamp_mask(45, "CERTIFIED", "BUREAU", rotation=30)[0] is turned
+    for mask, (x, y) in ((upright, (dx, dy)), (turned, (tx, ty))):
+        cx, cy = x + mask.width / 2, y + mask.height / 2
+        assert abs(cx) <= 3 and abs(cy) <= 3
@@ -0,0 +1,46 @@
+"""The persisted system font index."""
+
+import os
+
+import pytest
+
+import halftone_common
+from halftone_common import _font_index
+
+
+@pytest.fixture
+def font_dir(tmp_path, monkeypatch):
+    """A private font directory and index file, with no index loaded yet."""
+    fonts = tmp_path / "fonts"
+    fonts.mkdir()
+    (fonts / "Alpha.ttf").write_bytes(b"")
+    monkeypatch.setattr(halftone_common, "_FONT_DIRS", [fonts])
+    monkeypatch.setattr(halftone_common, "FONT_INDEX_PATH", tmp_path / "font_index.json")
+    monkeypatch.setattr(halftone_common, "_FONT_INDEX", None)
+    return fonts
+
+
+def _reload(monkeypatch):
+    monkeypatch.setattr(halftone_common, "_FONT_INDEX", None)
+    return _font_index()
+
+
+def test_index_is_reused_while_font_dirs_are_unchanged(font_dir, monkeypatch):
+    assert _font_index() == {"alpha.ttf": str(font_dir / "Alpha.ttf")}
+    assert halftone_common.FONT_INDEX_PATH.exists()
+
+    def scan():
+        raise AssertionError("font directories walked again")
+    monkeypatch.setattr(halftone_common, "_scan_font_dirs", scan)
+    assert "alpha.ttf" in _reload(monkeypatch)
+
+
+def test_index_rebuilds_when_a_font_dir_changes(font_dir, monkeypatch):
+    _font_index()
+    (font_dir / "Beta.ttf").write_bytes(b"")
+    mtime = os.stat(font_dir).st_mtime_ns + 10**9
+    os.utime(font_dir, ns=(mtime, mtime))
+    assert _reload(monkeypatch) == {
+        "alpha.ttf": str(font_dir / "Alpha.ttf"),
+        "beta.ttf": str(font_dir / "Beta.ttf"),
+    }
@@ -0,0 +1,107 @@
+"""Vectorized halftone engine against the per-dot reference loop."""
+
+import math
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from halftone_common import (
+    PALETTE, InkScreen, _cell_means, _halftone_grid, apply_halftone,
+    apply_halftone_screens, apply_halftone_tint,
+)
+
+
+def reference_halftone(img, dot_spacing, dot_color, bg_color, angle):
+    """The original per-cell crop / ImageDraw.ellipse implementation."""
+    src = img.convert("L")
+    w, h = src.size
+    out = Image.new("RGB", (w, h), bg_color)
+    draw = ImageDraw.Draw(out)
+    max_r = dot_spacing * 0.45
+    cos_a = math.cos(math.radians(angle))
+    sin_a = math.sin(math.radians(angle))
+    for gy in range(-dot_spacing, h + dot_spacing, dot_spacing):
+        for gx in range(-dot_spacing, w + dot_spacing, dot_spacing):
+            cx = int(gx * cos_a - gy * sin_a + w * (1 - cos_a + sin_a) / 2)
+            cy = int(gx * sin_a + gy * cos_a + h * (1 - cos_a - sin_a) / 2)
+            if cx < 0 or cx >= w or cy < 0 or cy >= h:
+                continue
+            x0 = max(0, cx - dot_spacing // 2)
+            y0 = max(0, cy - dot_spacing // 2)
+            x1 = min(w, cx + dot_spacing // 2)
+            y1 = min(h, cy + dot_spacing // 2)
+            pixels = np.asarray(src.crop((x0, y0, x1, y1)))
+            if not pixels.size:
+                continue
+            r = max_r * (1.0 - int(pixels.sum()) / pixels.size / 255.0)
+            if r < 0.5:
+                continue
+            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=dot_color)
+    return out
+
+
+def sample_image(w=97, h=71, seed=0):
+    """A gradient with noise and a hard edge, so every dot size occurs."""
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(0, 255, w)[None, :, None] * np.ones((h, 1, 3))
+    px = ramp + rng.integers(-40, 41, (h, w, 1))
+    px[h // 3:h // 2] = 20
+    return Image.fromarray(np.clip(px, 0, 255).astype(np.uint8), "RGB")
+
+
+def assert_same(a, b):
+    assert a.size == b.size
+    assert a.tobytes() == b.tobytes()
+
+
+@pytest.mark.parametrize("dot_spacing", [3, 5, 8, 13])
+@pytest.mark.parametrize("angle", [0, 15, -30, 45])
+def test_matches_reference(dot_spacing, angle):
+    img = sample_image()
+    expected = reference_halftone(img, dot_spacing, PALETTE["ink"],
+                                  PALETTE["paper"], angle)
+    actual = apply_halftone(img, dot_spacing, PALETTE["ink"], PALETTE["paper"], angle)
+    assert_same(actual, expected)
+
+
+@pytest.mark.parametrize("size", [(97, 71), (64, 64), (33, 120)])
+@pytest.mark.parametrize("dot_spacing", [2, 3, 6, 7, 16])
+@pytest.mark.parametrize("angle", [0, 90, 20])
+def test_cell_means_match_direct_sums(size, dot_spacing, angle):
+    gray = np.asarray(sample_image(*size).convert("L"))
+    h, w = gray.shape
+    cx, cy, _ = _halftone_grid(w, h, dot_spacing, angle)
+    means, valid = _cell_means(gray, cx, cy, dot_spacing)
+    half = dot_spacing // 2
+    for x, y, mean, ok in zip(cx, cy, means, valid):
+        cell = gray[max(0, y - half):min(h, y + half), max(0, x - half):min(w, x + half)]
+        assert ok == (cell.size > 0)
+        if ok:
+            assert mean == int(cell.sum()) / cell.size
+
+
+def _screens():
+    return [InkScreen(PALETTE["ink"], 6, 15),
+            InkScreen(PALETTE["resistance_red"], 9, 30, intensity=0.5, tone=False)]
+
+
+def test_bands_match_whole_page():
+    img = sample_image(120, 203)
+    whole = apply_halftone_screens(img, _screens(), seed=7)
+    for band_height in (16, 37, 100):
+        assert_same(apply_halftone_screens(img, _screens(), seed=7,
+                                           band_height=band_height), whole)
+
+
+def test_workers_match_single_pass():
+    img = sample_image(120, 203)
+    whole = apply_halftone_screens(img, _screens(), seed=7)
+    assert_same(apply_halftone_screens(img, _screens(), seed=7, workers=2), whole)
+
+
+def test_tint_bands_and_workers_match_single_pass():
+    img = sample_image(120, 203)
+    whole = apply_halftone_tint(img.copy(), 7, seed=3)
+    assert_same(apply_halftone_tint(img.copy(), 7, seed=3, band_height=40), whole)
+    assert_same(apply_halftone_tint(img.copy(), 7, seed=3, workers=2), whole)
@@ -0,0 +1,136 @@
+"""Seeded paper textures, the paper cache and the grain overlay."""
+
+import argparse
+
+import numpy as np
+import pytest
+
+from PIL import Image
+
+import halftone_common
+from halftone_common import (
+    RNG_TILE_ROWS, RenderRNG, _LRUCache, add_fold_crease, add_grain_overlay,
+    add_paper_wear, clear_paper_cache, make_paper_texture, seed_arg,
+)
+
+
+@pytest.fixture
+def paper_cache(tmp_path, monkeypatch):
+    """A private, empty paper cache (memory and disk)."""
+    monkeypatch.setattr(halftone_common, "PAPER_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(halftone_common, "_PAPER_CACHE", _LRUCache(1 << 24))
+    return tmp_path
+
+
+def test_seed_is_reproducible(paper_cache):
+    a = make_paper_texture(64, 48, fiber_density=2, seed=5, cache=False)
+    b = make_paper_texture(64, 48, fiber_density=2, seed=5, cache=False)
+    c = make_paper_texture(64, 48, fiber_density=2, seed=6, cache=False)
+    assert a.tobytes() == b.tobytes()
+    assert a.tobytes() != c.tobytes()
+
+
+def test_lru_evicts_least_recently_used():
+    cache = _LRUCache(30)
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+    cache.put("c", 3, 10)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.put("d", 4, 10)
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in "acd"] == [1, 3, 4]
+    assert cache.total == 30
+    cache.put("huge", 5, 31)
+    assert cache.get("huge") is None and cache.total == 30
+
+
+def test_memory_hit_returns_a_fresh_copy(paper_cache):
+    first = make_paper_texture(40, 30, seed=1)
+    first.paste((0, 0, 0), (0, 0, 40, 30))
+    again = make_paper_texture(40, 30, seed=1)
+    assert again.tobytes() == make_paper_texture(40, 30, seed=1, cache=False).tobytes()
+
+
+def test_disk_hit_after_memory_clear(paper_cache, monkeypatch):
+    expected = make_paper_texture(40, 30, fiber_density=1, seed=2).tobytes()
+    assert len(list(paper_cache.glob("*.npy"))) == 1
+    clear_paper_cache()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("texture was regenerated instead of loaded")
+
+    monkeypatch.setattr(halftone_common, "_apply_grain", fail)
+    assert make_paper_texture(40, 30, fiber_density=1, seed=2).tobytes() == expected
+
+
+def test_parameters_invalidate(paper_cache):
+    base = make_paper_texture(40, 30, seed=3).tobytes()
+    assert make_paper_texture(40, 30, grain_amount=20, seed=3).tobytes() != base
+    assert make_paper_texture(40, 30, base_color=(200, 200, 200), seed=3).tobytes() != base
+    assert len(list(paper_cache.glob("*.npy"))) == 3
+
+
+def test_version_bump_invalidates(paper_cache, monkeypatch):
+    make_paper_texture(40, 30, seed=4)
+    monkeypatch.setattr(halftone_common, "_PAPER_CACHE_VERSION",
+                        halftone_common._PAPER_CACHE_VERSION + 1)
+    clear_paper_cache()
+    make_paper_texture(40, 30, seed=4)
+    assert len(list(paper_cache.glob("*.npy"))) == 2
+
+
+def test_corrupt_disk_entry_is_regenerated(paper_cache):
+    expected = make_paper_texture(40, 30, seed=8).tobytes()
+    clear_paper_cache()
+    for f in paper_cache.glob("*.npy"):
+        np.save(f, np.zeros((3, 3, 3), np.uint8))
+    assert make_paper_texture(40, 30, seed=8).tobytes() == expected
+
+
+def test_grain_is_one_clipped_offset_per_pixel():
+    img = Image.new("RGB", (23, 17), (250, 128, 3))
+    amount = 12
+    noise = np.random.default_rng(9).integers(-amount, amount + 1, (17, 23),
+                                              dtype=np.int16)
+    expected = np.clip(np.array(img, np.int16) + noise[..., None], 0, 255)
+    add_grain_overlay(img, amount, seed=9)
+    assert np.array_equal(np.array(img), expected)
+
+
+def test_grain_tiles_do_not_depend_on_page_height():
+    short = Image.new("RGB", (20, RNG_TILE_ROWS), (128, 128, 128))
+    tall = Image.new("RGB", (20, RNG_TILE_ROWS + 40), (128, 128, 128))
+    add_grain_overlay(short, 10, seed=RenderRNG(11))
+    add_grain_overlay(tall, 10, seed=RenderRNG(11))
+    assert np.array_equal(np.array(tall)[:RNG_TILE_ROWS], np.array(short))
+
+
+def test_negative_seeds_are_rejected():
+    with pytest.raises(ValueError):
+        RenderRNG(-1)
+    with pytest.raises(argparse.ArgumentTypeError):
+        seed_arg("-1")
+    assert seed_arg("0") == 0
+
+
+def test_fold_crease_stays_within_a_pixel_of_its_row():
+    img = Image.new("RGB", (40, 30), (200, 200, 200))
+    add_fold_crease(img, y_pos=12, seed=5)
+    px = np.asarray(img, np.int16)
+    changed = np.nonzero((px != 200).any(axis=(1, 2)))[0]
+    assert changed.min() >= 11 and changed.max() <= 14
+    # Every column gets a dark row with a lighter one right below it
+    darkest = px[..., 0].argmin(axis=0)
+    assert (px[darkest, np.arange(40), 0] < 200).all()
+    assert (px[darkest + 1, np.arange(40), 0] > 200).all()
+
+
+def test_paper_wear_is_seeded_and_darkens_the_edges():
+    def worn(seed):
+        img = Image.new("RGB", (120, 90), (220, 210, 190))
+        return np.asarray(add_paper_wear(img, creases=[(None, False)], edge_wear=2,
+                                         stains=2, seed=seed), np.int16)
+    px = worn(RenderRNG(3))
+    assert np.array_equal(px, worn(RenderRNG(3)))
+    assert not np.array_equal(px, worn(RenderRNG(4)))
+    assert px[0].mean() < px[40:50, 20:40].mean()
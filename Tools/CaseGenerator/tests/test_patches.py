@@ -0,0 +1,42 @@
+"""Procedural photo, scribble and drawing patches."""
+
+import numpy as np
+from PIL import Image
+
+from halftone_common import RenderRNG
+from procedural_patches import (
+    CRAYON, child_drawing, portrait_photo, scribble_mask, shade_strokes,
+)
+
+
+def test_seeded_patches_repeat_and_unseeded_ones_vary():
+    a = np.asarray(portrait_photo(60, 80, seed=RenderRNG(2)))
+    assert np.array_equal(a, np.asarray(portrait_photo(60, 80, seed=RenderRNG(2))))
+    assert not np.array_equal(a, np.asarray(portrait_photo(60, 80, seed=RenderRNG(3))))
+    assert not np.array_equal(np.asarray(portrait_photo(60, 80)),
+                              np.asarray(portrait_photo(60, 80)))
+    assert a[..., 0].min() >= 60 and a[..., 0].max() <= 200
+
+
+def test_scribble_mask_counts_overlapping_strokes():
+    mask = scribble_mask(200, 150, seed=4, strokes=12, margin=10)
+    assert mask.shape == (150, 200) and not mask.flags.writeable
+    assert mask.max() >= 1 and mask.sum() > 12 * 30
+    assert scribble_mask(200, 150, seed=4, strokes=12, margin=10) is mask
+
+
+def test_shade_strokes_darkens_by_stroke_count():
+    img = Image.new("RGB", (200, 150), (200, 190, 180))
+    mask = scribble_mask(200, 150, seed=4, strokes=12, margin=10)
+    shade_strokes(img, mask, (10, 20, 30))
+    expected = np.array([200, 190, 180]) - mask[..., None] * np.array([10, 20, 30])
+    assert np.array_equal(np.asarray(img), np.clip(expected, 0, 255))
+
+
+def test_child_drawing_uses_crayon_colours_only():
+    sprite, offset = child_drawing(seed=7)
+    px = np.asarray(sprite)
+    drawn = px[px[..., 3] == 255, :3]
+    assert offset == (-32, -42) and len(drawn)
+    assert {tuple(c) for c in drawn} <= set(CRAYON.values())
+    assert (px[px[..., 3] != 255] == 0).all()
@@ -0,0 +1,63 @@
+"""Pixel doc glyph and stamp masks, and layout text fitting."""
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from pixel_doc import (
+    CHAR_H, CHAR_W, FONT_4x6, draw_stamp, draw_text, draw_text_centered,
+    element, render_layout, _ellipsize,
+)
+
+
+def test_text_masks_match_the_bitmap_font():
+    text = "Ab9 ~Z"
+    img = Image.new("RGB", (40, 10), (0, 0, 0))
+    assert draw_text(img, 2, 3, text, (255, 255, 255)) == 2 + len(text) * CHAR_W
+    expected = np.zeros((10, 40), dtype=bool)
+    for i, ch in enumerate(text):
+        if ch in FONT_4x6:
+            glyph = np.array(FONT_4x6[ch], dtype=bool)
+            expected[3:3 + CHAR_H, 2 + i * CHAR_W:6 + i * CHAR_W] = glyph
+    assert np.array_equal(np.asarray(img)[..., 0] == 255, expected)
+
+
+def _reference_stamp(img, cx, cy, radius, color):
+    """The per-pixel stamp the cached mask replaced."""
+    draw = ImageDraw.Draw(img)
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            dist = (dx * dx + dy * dy) ** 0.5
+            if abs(dist - radius) < 1.2:
+                if (dx + dy) % 2 == 0:
+                    draw.point((cx + dx, cy + dy), fill=color)
+            elif abs(dist - (radius - 3)) < 0.8:
+                if (dx + dy) % 3 == 0:
+                    draw.point((cx + dx, cy + dy), fill=color)
+    draw_text_centered(img, cy - 4, "SECTOR 3", color, cx * 2, draw)
+    draw_text_centered(img, cy + 2, "VERIFIED", color, cx * 2, draw)
+
+
+def test_stamp_mask_matches_per_pixel_stamp():
+    color = (180, 40, 40)
+    for radius in (9, 14, 23):
+        expected = Image.new("RGB", (80, 70), (0, 0, 0))
+        _reference_stamp(expected, 40, 35, radius, color)
+        img = Image.new("RGB", (80, 70), (0, 0, 0))
+        draw_stamp(img, 40, 35, radius, color=color)
+        assert np.array_equal(np.asarray(img), np.asarray(expected))
+
+
+def test_ellipsize_cuts_at_a_word_break():
+    assert _ellipsize("THE DISCREPANCY GROWS EVERY", 25) == "THE DISCREPANCY GROWS..."
+    assert _ellipsize("SHORT,", 25) == "SHORT..."
+    assert _ellipsize("UNBREAKABLEWORD", 8) == "UNBRE..."
+
+
+def test_overflowing_lines_stop_at_the_bottom_row():
+    text = " ".join(["WORD"] * 200)
+    layout = (element("lines", y=10, align="left", text="{text}", bottom=-40),)
+    img = render_layout(layout, {"text": text}, (160, 120))
+    px = np.asarray(img)
+    rows = np.nonzero((px != px[:, :1]).any(axis=1))[0]
+    assert rows.size and rows[0] >= 10 and rows[-1] < img.height - 40
+    assert rows[-1] >= img.height - 40 - 7 - CHAR_H
@@ -0,0 +1,71 @@
+"""Render-cache keys and entries."""
+
+import os
+
+import pytest
+from PIL import Image
+
+import render_cache
+from render_cache import local_dependencies, lookup, materialize, render_key, store
+
+
+@pytest.fixture
+def generators(tmp_path, monkeypatch):
+    """A directory of generator modules: rc_gen -> rc_helper -> rc_base."""
+    (tmp_path / "rc_base.py").write_text("INK = 1\n")
+    (tmp_path / "rc_helper.py").write_text(
+        "from rc_base import INK\n\ndef draw():\n    return INK\n")
+    (tmp_path / "rc_gen.py").write_text(
+        "import os\n\ndef generate(dot_spacing=5, scale=1):\n"
+        "    from rc_helper import draw\n    return draw()\n")
+    (tmp_path / "rc_other.py").write_text("X = 1\n")
+    monkeypatch.setattr(render_cache, "SCRIPT_DIR", tmp_path)
+    monkeypatch.setattr(render_cache, "RENDER_CACHE_DIR", tmp_path / "renders")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return tmp_path
+
+
+def test_dependencies_are_transitive_and_local(generators):
+    names = [name for name, _ in local_dependencies("rc_gen")]
+    assert names == ["rc_base", "rc_gen", "rc_helper"]
+
+
+def test_key_changes_with_transitive_dependency(generators):
+    key = render_key("rc_gen", "generate")
+    assert render_key("rc_gen", "generate") == key
+    (generators / "rc_base.py").write_text("INK = 2\n")
+    assert render_key("rc_gen", "generate") != key
+
+
+def test_key_ignores_unrelated_modules(generators):
+    key = render_key("rc_gen", "generate")
+    (generators / "rc_other.py").write_text("X = 2\n")
+    assert render_key("rc_gen", "generate") == key
+
+
+def test_key_fills_in_defaults(generators):
+    key = render_key("rc_gen", "generate")
+    assert render_key("rc_gen", "generate", {"dot_spacing": 5}) == key
+    assert render_key("rc_gen", "generate", {"dot_spacing": 6}) != key
+    assert render_key("rc_gen", "generate", seed=1) != key
+
+
+def test_store_lookup_materialize(generators):
+    key = "0" * 64
+    assert lookup(key) is None
+    cached = store(key, Image.new("RGB", (4, 3), (1, 2, 3)))
+    assert lookup(key) == cached
+
+    out = generators / "out" / "page.png"
+    assert materialize(cached, out) in ("linked", "copied")
+    assert materialize(cached, out) in ("current", "copied")
+    assert Image.open(out).getpixel((0, 0)) == (1, 2, 3)
+
+
+def test_modified_entry_is_a_miss(generators):
+    key = "1" * 64
+    cached = store(key, Image.new("RGB", (4, 3)))
+    Image.new("RGB", (5, 5)).save(cached)
+    st = cached.stat()
+    os.utime(cached, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    assert lookup(key) is None
@@ -0,0 +1,128 @@
+"""Generated schema predicates against jsonschema."""
+
+import copy
+import json
+import random
+
+import pytest
+
+jsonschema = pytest.importorskip("jsonschema")
+
+import schema_check
+from schema_check import UnsupportedSchema, generate_source, schema_errors
+from validate import CASES_DIR, SCHEMA_PATH
+
+SCHEMA = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+CASES = [json.loads(p.read_text(encoding="utf-8")) for p in sorted(CASES_DIR.glob("*.json"))]
+
+# Replacement values that break most keywords one way or another
+ODD_VALUES = [None, True, 0, -1, 1.5, 10 ** 9, "", "x", "ZZ-99", [], [None], {}, {"k": 1}]
+
+
+@pytest.fixture(autouse=True)
+def schema_cache(tmp_path, monkeypatch):
+    """A private generated-code cache, and no predicates from earlier tests."""
+    monkeypatch.setattr(schema_check, "SCHEMA_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(schema_check, "_FAST", {})
+    return tmp_path
+
+
+def agrees(case, schema):
+    expected = jsonschema.Draft202012Validator(schema).is_valid(case)
+    return (schema_errors(case, schema) == []) == expected
+
+
+def mutations(case, rng, count):
+    """Copies of case with one value deleted, replaced or added."""
+    paths = []
+
+    def walk(node, path):
+        paths.append(path)
+        children = node.items() if isinstance(node, dict) else \
+            enumerate(node) if isinstance(node, list) else ()
+        for key, child in children:
+            walk(child, path + (key,))
+
+    walk(case, ())
+    for _ in range(count):
+        mutated = copy.deepcopy(case)
+        path = rng.choice(paths[1:])
+        parent = mutated
+        for key in path[:-1]:
+            parent = parent[key]
+        action = rng.randrange(3)
+        if action == 0:
+            del parent[path[-1]]
+        elif action == 1:
+            parent[path[-1]] = copy.deepcopy(rng.choice(ODD_VALUES))
+        elif isinstance(parent, dict):
+            parent["unexpectedKey"] = 1
+        else:
+            parent.append(copy.deepcopy(rng.choice(ODD_VALUES)))
+        yield mutated
+
+
+@pytest.mark.skipif(not CASES, reason="no case JSONs")
+def test_shipped_cases_agree():
+    for case in CASES:
+        assert agrees(case, SCHEMA)
+
+
+@pytest.mark.skipif(not CASES, reason="no case JSONs")
+def test_mutated_cases_agree():
+    rng = random.Random(0)
+    for case in CASES:
+        for mutated in mutations(case, rng, 60):
+            assert agrees(mutated, SCHEMA)
+
+
+def test_the_case_schema_is_compiled():
+    # Raises UnsupportedSchema if the case schema fell back to jsonschema
+    assert "validate = " in generate_source(SCHEMA)
+
+
+@pytest.mark.parametrize("schema, instances", [
+    ({"type": "integer", "minimum": 0, "exclusiveMaximum": 10},
+     [0, 9, 9.0, 10, -1, 2.5, True, "3", None]),
+    ({"type": ["number", "null"], "maximum": 1.5}, [None, 1.5, 1.6, False, "1"]),
+    ({"type": "string", "minLength": 2, "maxLength": 3, "pattern": "^[A-Z]"},
+     ["AB", "ABCD", "A", "ab", "Ab", 12]),
+    ({"enum": ["a", "b"]}, ["a", "c", 1, None]),
+    ({"type": "array", "items": {"type": "string"}, "minItems": 1, "maxItems": 2},
+     [["a"], [], ["a", "b", "c"], [1], "a"]),
+    ({"type": "object", "required": ["a"], "properties": {"a": {"type": "integer"}},
+      "additionalProperties": {"type": "string"}},
+     [{"a": 1}, {"a": 1, "b": "x"}, {"a": 1, "b": 2}, {"b": "x"}, {"a": "1"}, []]),
+    ({"minimum": 3, "maxLength": 1, "minItems": 1}, [4, 2, "x", "xy", [], [1], None]),
+    ({"$defs": {"node": {"type": "object", "properties": {
+        "next": {"$ref": "#/$defs/node"}, "v": {"type": "integer"}}}},
+      "$ref": "#/$defs/node"},
+     [{"next": {"next": {"v": 1}}}, {"next": {"next": {"v": "x"}}}, {"next": 3}]),
+    (False, [1, None]),
+])
+def test_keywords_agree(schema, instances):
+    for instance in instances:
+        assert agrees(instance, schema), instance
+
+
+@pytest.mark.parametrize("schema", [
+    {"maximum": float("nan")},
+    {"minimum": float("-inf")},
+    {"maxLength": 1.5},
+    {"not": {"type": "string"}},
+    {"$ref": "other.json#/x"},
+])
+def test_unsupported_schemas_are_refused(schema):
+    with pytest.raises(UnsupportedSchema):
+        generate_source(schema)
+
+
+def test_tampered_cache_file_is_regenerated(schema_cache):
+    schema = {"type": "object", "required": ["a"]}
+    assert agrees({}, schema)
+    (path,) = schema_cache.glob("*.py")
+    path.write_text(path.read_text(encoding="utf-8").replace("return False", "return True"),
+                    encoding="utf-8")
+    schema_check._FAST.clear()
+    assert schema_errors({}, schema) != []
+    assert "return False" in path.read_text(encoding="utf-8")
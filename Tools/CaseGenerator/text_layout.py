@@ -0,0 +1,69 @@
+"""
+Text metrics and line wrapping for the TrueType document layouts.
+
+Measurements and wrapped paragraphs are memoized per font object, which
+halftone_common.load_font shares for each (style, size).
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def text_bbox(font, text):
+    """Cached font.getbbox(text): (left, top, right, bottom)."""
+    return font.getbbox(text)
+
+
+def text_width(font, text):
+    """Ink width of text (bbox right - left), as used for centering."""
+    left, _, right, _ = text_bbox(font, text)
+    return right - left
+
+
+@lru_cache(maxsize=8192)
+def text_advance(font, text):
+    """Cached font.getlength(text): horizontal advance in pixels."""
+    return font.getlength(text)
+
+
+def centered_x(font, text, width, left=0):
+    """x at which text is centered in [left, left + width)."""
+    return left + (width - text_width(font, text)) // 2
+
+
+@lru_cache(maxsize=512)
+def wrap_text(text, font, max_width):
+    """
+    Greedy word wrap by measured advance.
+
+    A word wider than max_width gets a line of its own.
+
+    Args:
+        text: Paragraph (any whitespace separates words)
+        font: PIL font
+        max_width: Maximum line advance in pixels
+
+    Returns:
+        Tuple of line strings.
+    """
+    space = text_advance(font, " ")
+    lines = []
+    line, line_w = [], 0.0
+    for word in text.split():
+        word_w = text_advance(font, word)
+        if line and line_w + space + word_w > max_width:
+            lines.append(" ".join(line))
+            line, line_w = [word], word_w
+        else:
+            line_w += word_w + (space if line else 0.0)
+            line.append(word)
+    if line:
+        lines.append(" ".join(line))
+    return tuple(lines)
+
+
+def clear_text_caches():
+    """Drop all memoized metrics and wrapped paragraphs."""
+    text_bbox.cache_clear()
+    text_advance.cache_clear()
+    wrap_text.cache_clear()
@@ -29,6 +29,8 @@ except ImportError:
     print("Error: 'jsonschema' package not installed. Run: pip install jsonschema")
     sys.exit(1)
 
+from schema_check import schema_errors
+
 
 SCRIPT_DIR = Path(__file__).parent
 SCHEMA_PATH = SCRIPT_DIR / "schema" / "case_schema.json"
@@ -70,9 +72,8 @@ def load_schema() -> dict:
 
 
 def validate_schema(case: dict, schema: dict, result: ValidationResult):
-    """Phase 1: JSON Schema compliance."""
-    validator = jsonschema.Draft202012Validator(schema)
-    errors = list(validator.iter_errors(case))
+    """Phase 1: JSON Schema compliance (schema compiled once per process)."""
+    errors = schema_errors(case, schema)
 
     for err in errors:
         path = " → ".join(str(p) for p in err.absolute_path) or "root"